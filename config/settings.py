@@ -115,6 +115,13 @@ class StorageConfig:
         """Get the output directory for scraped data."""
         return self.base_dir / self.brand / self.gender
 
+    @property
+    def metadata_index_path(self) -> Path:
+        """Get the path of the metadata index file built by the viewer."""
+        # Kept beside output_dir rather than in it, so rewriting the index
+        # doesn't change the directory mtime the viewer watches for new data
+        return self.output_dir.with_name(f"{self.gender}.index.jsonl")
+
     def get_product_dir(self, product_id: str, category: str) -> Path:
         """Get the directory for a specific product."""
         return self.output_dir / category / product_id
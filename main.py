@@ -95,8 +95,8 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
         super().__init__(prog, max_help_position=40, width=100)
 
 
-def parse_args():
-    """Parse command line arguments."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser."""
 
     # Build category list for help text
     category_list = "\n".join(
@@ -427,7 +427,12 @@ Data is saved to Supabase (cloud) by default, with optional local file storage.
         help="Only tag products that don't have tags_final (use with --tag-existing)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments (defaults to sys.argv)."""
+    return _build_parser().parse_args(argv)
 
 
 async def ai_status():
@@ -0,0 +1,3773 @@
+let products = [];
+let allProducts = [];  // Store all products for filtering
+let allProductIds = new Set();  // product_ids in allProducts, for variant lookups
+let filteredProducts = [];  // Currently filtered products
+let currentIndex = 0;
+let currentImageIndex = 0;
+let currentCategory = 'all';  // Track selected category
+
+// Category organization structure - matches Zara's website navigation
+const CATEGORY_STRUCTURE = {
+    tops_base: {
+        label: 'Base Layer',
+        icon: '👕',
+        subcategories: {
+            tshirts: { label: 'T-Shirts', icon: '👕', keywords: ['t-shirt', 'tshirt', 'tee', 't shirt', 'basic', 'tank top'] },
+            shirts: { label: 'Shirts', icon: '👔', keywords: ['shirt', 'button', 'oxford', 'poplin', 'linen shirt', 'cotton shirt'] },
+            polos: { label: 'Polo Shirts', icon: '👕', keywords: ['polo'] },
+            tanks: { label: 'Tank Tops', icon: '🎽', keywords: ['tank', 'sleeveless', 'muscle'] }
+        }
+    },
+    tops_mid: {
+        label: 'Mid Layer',
+        icon: '🧶',
+        subcategories: {
+            sweaters: { label: 'Sweaters', icon: '🧶', keywords: ['sweater', 'knit', 'pullover', 'jumper', 'knitwear'] },
+            cardigans: { label: 'Cardigans', icon: '🧶', keywords: ['cardigan'] },
+            quarterzip: { label: 'Quarter Zip', icon: '🧶', keywords: ['quarter zip', 'quarter-zip', 'half zip', 'half-zip'] },
+            hoodies: { label: 'Hoodies', icon: '🧥', keywords: ['hoodie', 'hooded'] },
+            sweatshirts: { label: 'Sweatshirts', icon: '👕', keywords: ['sweatshirt', 'fleece', 'crewneck', 'crew neck', 'french terry'] }
+        }
+    },
+    bottoms: {
+        label: 'Bottoms',
+        icon: '👖',
+        subcategories: {
+            pants: { label: 'Pants', icon: '👖', keywords: ['pant', 'trouser', 'chino', 'jogger', 'cargo', 'slack'] },
+            jeans: { label: 'Jeans', icon: '👖', keywords: ['jean', 'denim'] },
+            shorts: { label: 'Shorts', icon: '🩳', keywords: ['short', 'bermuda'] },
+            sweatsuits: { label: 'Sweatsuits', icon: '🏃', keywords: ['sweatsuit', 'tracksuit', 'track pant', 'jogger set'] }
+        }
+    },
+    outerwear: {
+        label: 'Outerwear',
+        icon: '🧥',
+        subcategories: {
+            jackets: { label: 'Jackets', icon: '🧥', keywords: ['jacket', 'bomber', 'windbreaker', 'trucker', 'down jacket', 'leather jacket', 'biker jacket', 'moto jacket'] },
+            coats: { label: 'Coats', icon: '🧥', keywords: ['coat', 'overcoat', 'trench', 'parka', 'puffer', 'quilted', 'padded', 'leather coat'] },
+            blazers: { label: 'Blazers', icon: '🤵', keywords: ['blazer', 'sport coat'] },
+            suits: { label: 'Suits', icon: '🤵', keywords: ['suit'] },
+            overshirts: { label: 'Overshirts', icon: '👔', keywords: ['overshirt', 'shacket', 'shirt jacket'] },
+            vests: { label: 'Vests', icon: '🦺', keywords: ['vest', 'gilet', 'waistcoat', 'bodywarmer'] }
+        }
+    },
+    shoes: {
+        label: 'Footwear',
+        icon: '👟',
+        subcategories: {
+            shoes: { label: 'Shoes', icon: '👟', keywords: ['shoe', 'sneaker', 'loafer', 'derby', 'oxford', 'sandal', 'slipper', 'moccasin', 'espadrille'] },
+            boots: { label: 'Boots', icon: '🥾', keywords: ['boot', 'chelsea', 'ankle boot', 'combat boot'] }
+        }
+    }
+};
+
+/**
+ * GARMENT TYPE DETECTION
+ *
+ * This function classifies products based on the PRODUCT NAME only.
+ * The category field in the database is UNRELIABLE and should not be trusted.
+ *
+ * Classification priority (checked in order - first match wins):
+ * 1. Bottoms (pants, shorts, jeans, trousers) - very distinctive names
+ * 2. Shoes/Boots (footwear, sneakers, boots) - very distinctive names
+ * 3. Outerwear (jackets, coats, blazers, leather) - check before tops
+ * 4. Mid layer (sweaters, hoodies, sweatshirts, quarter-zip) - check before base
+ * 5. Base layer (t-shirts, shirts, polos) - most generic, check last
+ */
+
+// Helper function to check if a word exists as a complete word (not part of another word)
+function hasWord(text, word) {
+    // Create a regex that matches the word with word boundaries
+    // This prevents "pants" from matching in "participants"
+    // Note: Escaping special regex characters in the word
+    const escaped = word.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+    const regex = new RegExp('\\b' + escaped + '(s|es)?\\b', 'i');
+    return regex.test(text);
+}
+
+// Helper function to check if any of the keywords match
+function hasAnyWord(text, keywords) {
+    return keywords.some(kw => hasWord(text, kw));
+}
+
+function classifyProduct(product) {
+    // ONLY use the product name for classification - it's the most reliable
+    const name = (product.name || '').toLowerCase();
+
+    // ============================================================
+    // STEP 1: Check for BOTTOMS first (pants, shorts, jeans, trousers)
+    // These have very distinctive names that won't conflict with other categories
+    // ============================================================
+
+    // Check for shorts FIRST (before pants, since "shorts" is more specific)
+    if (hasAnyWord(name, ['short', 'bermuda'])) {
+        // Make sure it's not "short sleeve" which is a top
+        if (!hasAnyWord(name, ['sleeve', 'shirt', 'top', 'tee', 't-shirt'])) {
+            return { main: 'bottoms', sub: 'shorts', displayCategory: 'Shorts' };
+        }
+    }
+
+    // Check for jeans (before generic pants)
+    if (hasAnyWord(name, ['jean', 'denim pant', 'denim trouser'])) {
+        return { main: 'bottoms', sub: 'jeans', displayCategory: 'Jeans' };
+    }
+
+    // Check for sweatsuits/tracksuits
+    if (hasAnyWord(name, ['sweatsuit', 'tracksuit', 'track pant', 'jogger set', 'matching set'])) {
+        return { main: 'bottoms', sub: 'sweatsuits', displayCategory: 'Sweatsuits' };
+    }
+
+    // Check for pants/trousers
+    if (hasAnyWord(name, ['pant', 'trouser', 'chino', 'jogger', 'cargo pant', 'dress pant', 'suit pant', 'slack'])) {
+        return { main: 'bottoms', sub: 'pants', displayCategory: 'Pants' };
+    }
+
+    // ============================================================
+    // STEP 2: Check for FOOTWEAR (Shoes & Boots)
+    // ============================================================
+
+    // Check boots first (more specific than shoes)
+    if (hasAnyWord(name, ['boot', 'chelsea', 'combat boot', 'ankle boot', 'hiking boot'])) {
+        return { main: 'shoes', sub: 'boots', displayCategory: 'Boots' };
+    }
+
+    // Check for shoes
+    if (hasAnyWord(name, ['shoe', 'sneaker', 'loafer', 'derby', 'sandal', 'slipper', 'moccasin', 'espadrille', 'trainer'])) {
+        return { main: 'shoes', sub: 'shoes', displayCategory: 'Shoes' };
+    }
+
+    // ============================================================
+    // STEP 3: Check for OUTERWEAR (jackets, coats, blazers, vests)
+    // Check these BEFORE tops because "jacket" might contain other words
+    // ============================================================
+
+    // Blazers (specific outerwear)
+    if (hasAnyWord(name, ['blazer', 'sport coat', 'sportcoat'])) {
+        return { main: 'outerwear', sub: 'blazers', displayCategory: 'Blazers' };
+    }
+
+    // Suits (check before generic jacket - "suit jacket" should be suits)
+    if (hasWord(name, 'suit') && !hasAnyWord(name, ['sweatsuit', 'tracksuit'])) {
+        return { main: 'outerwear', sub: 'suits', displayCategory: 'Suits' };
+    }
+
+    // Coats (includes puffers, parkas, trenches)
+    if (hasAnyWord(name, ['coat', 'parka', 'puffer', 'trench', 'overcoat', 'topcoat'])) {
+        return { main: 'outerwear', sub: 'coats', displayCategory: 'Coats' };
+    }
+
+    // Vests/Gilets
+    if (hasAnyWord(name, ['vest', 'gilet', 'waistcoat', 'bodywarmer'])) {
+        return { main: 'outerwear', sub: 'vests', displayCategory: 'Vests' };
+    }
+
+    // Overshirts / Shackets (between shirt and jacket)
+    if (hasAnyWord(name, ['overshirt', 'shacket', 'shirt jacket'])) {
+        return { main: 'outerwear', sub: 'overshirts', displayCategory: 'Overshirts' };
+    }
+
+    // Jackets (general - check after more specific outerwear)
+    if (hasAnyWord(name, ['jacket', 'bomber', 'windbreaker', 'anorak', 'trucker', 'down jacket', 'quilted', 'padded'])) {
+        return { main: 'outerwear', sub: 'jackets', displayCategory: 'Jackets' };
+    }
+
+    // ============================================================
+    // STEP 4: Check for MID LAYER tops (sweaters, hoodies, sweatshirts, quarter-zip)
+    // Check these BEFORE base layer because "sweatshirt" contains "shirt"
+    // ============================================================
+
+    // Quarter-zip (check before sweaters)
+    if (hasAnyWord(name, ['quarter zip', 'quarter-zip', 'half zip', 'half-zip', '1/4 zip'])) {
+        return { main: 'tops_mid', sub: 'quarterzip', displayCategory: 'Quarter Zip' };
+    }
+
+    // Sweatshirts (check BEFORE checking for "shirt")
+    if (hasAnyWord(name, ['sweatshirt', 'crewneck sweat', 'crew neck sweat', 'fleece'])) {
+        return { main: 'tops_mid', sub: 'sweatshirts', displayCategory: 'Sweatshirts' };
+    }
+
+    // Hoodies
+    if (hasAnyWord(name, ['hoodie', 'hooded'])) {
+        return { main: 'tops_mid', sub: 'hoodies', displayCategory: 'Hoodies' };
+    }
+
+    // Cardigans (check before generic sweaters)
+    if (hasWord(name, 'cardigan')) {
+        return { main: 'tops_mid', sub: 'cardigans', displayCategory: 'Cardigans' };
+    }
+
+    // Sweaters/Knits
+    if (hasAnyWord(name, ['sweater', 'knit', 'pullover', 'jumper', 'knitwear'])) {
+        return { main: 'tops_mid', sub: 'sweaters', displayCategory: 'Sweaters' };
+    }
+
+    // ============================================================
+    // STEP 5: Check for BASE LAYER tops (t-shirts, shirts, polos, tanks)
+    // These are the most generic categories - check last
+    // ============================================================
+
+    // T-shirts (check before generic "shirt")
+    if (hasAnyWord(name, ['t-shirt', 'tshirt', 'tee'])) {
+        return { main: 'tops_base', sub: 'tshirts', displayCategory: 'T-Shirts' };
+    }
+
+    // Tank tops
+    if (hasAnyWord(name, ['tank', 'sleeveless top', 'muscle tee'])) {
+        return { main: 'tops_base', sub: 'tanks', displayCategory: 'Tank Tops' };
+    }
+
+    // Polos
+    if (hasWord(name, 'polo')) {
+        return { main: 'tops_base', sub: 'polos', displayCategory: 'Polo Shirts' };
+    }
+
+    // Shirts (most generic - only if nothing else matched)
+    if (hasWord(name, 'shirt')) {
+        return { main: 'tops_base', sub: 'shirts', displayCategory: 'Shirts' };
+    }
+
+    // ============================================================
+    // STEP 6: Fallback - use tags_final if available
+    // ============================================================
+    const tagsFinal = product.tags_final;
+    if (tagsFinal && tagsFinal.category) {
+        const cat = tagsFinal.category.toLowerCase();
+        if (cat === 'bottom') {
+            return { main: 'bottoms', sub: 'pants', displayCategory: 'Pants' };
+        }
+        if (cat === 'outerwear') {
+            return { main: 'outerwear', sub: 'jackets', displayCategory: 'Jackets' };
+        }
+        if (cat === 'shoes') {
+            return { main: 'shoes', sub: 'shoes', displayCategory: 'Shoes' };
+        }
+        if (cat === 'top_mid' || (tagsFinal.top_layer_role === 'mid')) {
+            return { main: 'tops_mid', sub: 'sweaters', displayCategory: 'Sweaters' };
+        }
+        if (cat === 'top_base' || cat === 'top' || (tagsFinal.top_layer_role === 'base')) {
+            return { main: 'tops_base', sub: 'tshirts', displayCategory: 'T-Shirts' };
+        }
+    }
+
+    // ============================================================
+    // STEP 7: Last resort - uncategorized
+    // ============================================================
+    return { main: 'other', sub: null, displayCategory: 'Other' };
+}
+
+// Get the display category name for a product (used for the badge)
+function getDisplayCategory(product) {
+    const classification = classifyProduct(product);
+    return classification.displayCategory || 'Other';
+}
+
+// Build category dropdown options HTML for reclassification
+function buildCategoryDropdownOptions(currentSubcategory) {
+    let html = '';
+    const orderedCategories = ['tops_base', 'tops_mid', 'bottoms', 'outerwear', 'shoes'];
+
+    for (const mainKey of orderedCategories) {
+        const mainConfig = CATEGORY_STRUCTURE[mainKey];
+        if (!mainConfig) continue;
+
+        html += `<optgroup label="${mainConfig.icon} ${mainConfig.label}">`;
+        for (const [subKey, subConfig] of Object.entries(mainConfig.subcategories)) {
+            const selected = (subKey === currentSubcategory) ? 'selected' : '';
+            html += `<option value="${subKey}" ${selected}>${subConfig.label}</option>`;
+        }
+        html += '</optgroup>';
+    }
+
+    // Add "Other" option
+    html += `<optgroup label="📦 Other">`;
+    html += `<option value="accessories">Accessories</option>`;
+    html += `<option value="bags">Bags</option>`;
+    html += `<option value="colognes">Colognes</option>`;
+    html += `</optgroup>`;
+
+    return html;
+}
+
+// Handle category reclassification
+async function handleCategoryChange(selectElement) {
+    const newCategory = selectElement.value;
+    const product = getCurrentProduct();
+
+    if (!product) return;
+
+    // Get the display name for the new category
+    let displayName = newCategory;
+    for (const [mainKey, mainConfig] of Object.entries(CATEGORY_STRUCTURE)) {
+        if (mainConfig.subcategories[newCategory]) {
+            displayName = mainConfig.subcategories[newCategory].label;
+            break;
+        }
+    }
+
+    console.log(`Reclassifying product ${product.product_id} to: ${newCategory} (${displayName})`);
+
+    try {
+        // Update in Supabase
+        const response = await fetch('/api/update_product_category', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id,
+                new_category: newCategory
+            })
+        });
+
+        if (response.ok) {
+            // Update local data
+            product.category = newCategory;
+
+            // Show success notification
+            showNotification(`Category changed to ${displayName}`, 'success');
+
+            // Rebuild the sidebar to update counts
+            buildCategorySidebar();
+        } else {
+            const error = await response.json();
+            showNotification(`Failed to update category: ${error.message}`, 'error');
+        }
+    } catch (err) {
+        console.error('Failed to update category:', err);
+        showNotification('Failed to update category', 'error');
+    }
+}
+
+// Helper to get current product
+function getCurrentProduct() {
+    if (currentCategory === 'all') {
+        return filteredProducts[currentIndex];
+    }
+    return filteredProducts[currentIndex];
+}
+
+// Build category sidebar from products data
+function buildCategorySidebar() {
+    const categoryList = document.getElementById('categoryList');
+    if (!categoryList || !allProducts.length) return;
+
+    // Initialize counts structure dynamically from CATEGORY_STRUCTURE
+    const counts = { other: { total: 0 } };
+    for (const [mainCat, config] of Object.entries(CATEGORY_STRUCTURE)) {
+        counts[mainCat] = { total: 0 };
+        for (const subKey of Object.keys(config.subcategories)) {
+            counts[mainCat][subKey] = 0;
+        }
+    }
+
+    // Classify each product
+    allProducts.forEach(product => {
+        const { main, sub } = classifyProduct(product);
+        if (counts[main]) {
+            counts[main].total++;
+            if (sub && counts[main][sub] !== undefined) {
+                counts[main][sub]++;
+            }
+        } else {
+            counts.other.total++;
+        }
+    });
+
+    // Update "All Products" count
+    document.getElementById('allCount').textContent = allProducts.length;
+
+    // Clear existing category items (except "All Products")
+    const allCategoryItem = categoryList.querySelector('.all-categories');
+    categoryList.innerHTML = '';
+    categoryList.appendChild(allCategoryItem);
+
+    // Build organized category structure
+    const orderedCategories = ['tops_base', 'tops_mid', 'bottoms', 'outerwear', 'shoes'];
+
+    orderedCategories.forEach(mainCat => {
+        const config = CATEGORY_STRUCTURE[mainCat];
+        const mainCount = counts[mainCat]?.total || 0;
+
+        // Main category header
+        const mainLi = document.createElement('li');
+        mainLi.className = 'category-item category-header';
+        mainLi.setAttribute('data-category', mainCat);
+        mainLi.onclick = () => filterByOrganizedCategory(mainCat, null);
+        mainLi.innerHTML = `
+            <span class="category-name">${config.icon} ${config.label}</span>
+            <span class="category-count">${mainCount}</span>
+        `;
+        categoryList.appendChild(mainLi);
+
+        // Subcategories
+        const subEntries = Object.entries(config.subcategories);
+        if (subEntries.length > 0) {
+            subEntries.forEach(([subKey, subConfig]) => {
+                const subCount = counts[mainCat]?.[subKey] || 0;
+                const subLi = document.createElement('li');
+                subLi.className = 'category-item subcategory-item';
+                subLi.setAttribute('data-category', `${mainCat}-${subKey}`);
+                subLi.onclick = () => filterByOrganizedCategory(mainCat, subKey);
+                subLi.innerHTML = `
+                    <span class="category-name">${subConfig.icon} ${subConfig.label}</span>
+                    <span class="category-count">${subCount}</span>
+                `;
+                categoryList.appendChild(subLi);
+            });
+        }
+    });
+
+    // Add "Other" if there are uncategorized items
+    if (counts.other.total > 0) {
+        const otherLi = document.createElement('li');
+        otherLi.className = 'category-item';
+        otherLi.setAttribute('data-category', 'other');
+        otherLi.onclick = () => filterByOrganizedCategory('other', null);
+        otherLi.innerHTML = `
+            <span class="category-name">📦 Other</span>
+            <span class="category-count">${counts.other.total}</span>
+        `;
+        categoryList.appendChild(otherLi);
+    }
+}
+
+// Filter by organized category
+function filterByOrganizedCategory(mainCat, subCat) {
+    currentCategory = subCat ? `${mainCat}-${subCat}` : mainCat;
+
+    // Update active state in sidebar
+    document.querySelectorAll('.category-item').forEach(item => {
+        item.classList.remove('active');
+        if (item.getAttribute('data-category') === currentCategory) {
+            item.classList.add('active');
+        }
+    });
+
+    // Filter products
+    if (mainCat === 'all') {
+        filteredProducts = [...allProducts];
+    } else {
+        filteredProducts = allProducts.filter(p => {
+            const { main, sub } = classifyProduct(p);
+            if (subCat) {
+                return main === mainCat && sub === subCat;
+            }
+            return main === mainCat;
+        });
+    }
+
+    // Update products array and reset to first product
+    products = filteredProducts;
+    currentIndex = 0;
+    currentImageIndex = 0;
+
+    if (products.length > 0) {
+        displayProduct(0);
+    } else {
+        document.getElementById('productCard').innerHTML = `
+            <div class="no-data">
+                <h2>No products found</h2>
+                <p>No products in this category</p>
+            </div>
+        `;
+    }
+}
+
+// Get icon for category (legacy support)
+function getCategoryIcon(category) {
+    const icons = {
+        'shirts': '👔',
+        't-shirts': '👕',
+        'pants': '👖',
+        'jeans': '👖',
+        'shorts': '🩳',
+        'jackets': '🧥',
+        'coats': '🧥',
+        'suits': '🤵',
+        'blazers': '🤵',
+        'shoes': '👟',
+        'sneakers': '👟',
+        'boots': '🥾',
+        'hats': '🧢',
+        'sweaters': '🧶',
+        'hoodies': '🧥',
+        'swimwear': '🩱',
+        'activewear': '🏃',
+        'default': '📦'
+    };
+    const lowerCategory = category.toLowerCase();
+    for (const [key, icon] of Object.entries(icons)) {
+        if (lowerCategory.includes(key)) return icon;
+    }
+    return icons.default;
+}
+
+// Format category name for display
+function formatCategoryName(category) {
+    // Map internal category keys to human-readable names
+    const categoryDisplayNames = {
+        'all': 'All Products',
+        // Base Layer
+        'tops_base': 'Base Layer',
+        'tops_base-tshirts': 'T-Shirts',
+        'tops_base-shirts': 'Shirts',
+        'tops_base-polos': 'Polo Shirts',
+        'tops_base-tanks': 'Tank Tops',
+        // Mid Layer
+        'tops_mid': 'Mid Layer',
+        'tops_mid-sweaters': 'Sweaters',
+        'tops_mid-cardigans': 'Cardigans',
+        'tops_mid-quarterzip': 'Quarter Zip',
+        'tops_mid-hoodies': 'Hoodies',
+        'tops_mid-sweatshirts': 'Sweatshirts',
+        // Bottoms
+        'bottoms': 'Bottoms',
+        'bottoms-pants': 'Pants',
+        'bottoms-jeans': 'Jeans',
+        'bottoms-shorts': 'Shorts',
+        'bottoms-sweatsuits': 'Sweatsuits',
+        // Outerwear
+        'outerwear': 'Outerwear',
+        'outerwear-jackets': 'Jackets',
+        'outerwear-coats': 'Coats',
+        'outerwear-leather': 'Leather',
+        'outerwear-blazers': 'Blazers',
+        'outerwear-suits': 'Suits',
+        'outerwear-overshirts': 'Overshirts',
+        'outerwear-vests': 'Vests',
+        // Footwear
+        'shoes': 'Footwear',
+        'shoes-shoes': 'Shoes',
+        'shoes-boots': 'Boots',
+        // Other
+        'other': 'Other'
+    };
+
+    if (categoryDisplayNames[category]) {
+        return categoryDisplayNames[category];
+    }
+
+    // Fallback: convert snake_case-subcategory to Title Case
+    return category
+        .split(/[-_]/)
+        .map(word => word.charAt(0).toUpperCase() + word.slice(1).toLowerCase())
+        .join(' ');
+}
+
+// Filter products by category (legacy support)
+function filterByCategory(category) {
+    if (category === 'all') {
+        filterByOrganizedCategory('all', null);
+        return;
+    }
+    // For legacy category names, try to map to organized structure
+    filterByOrganizedCategory(category, null);
+}
+
+async function loadProducts() {
+    try {
+        const response = await fetch('/api/products');
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        // Curation data may have changed along with the products
+        curationBundles.clear();
+        productDetails.clear();
+        productDetailRequests.clear();
+
+        // Products arrive as newline-delimited JSON. Show the first one
+        // as soon as it's parsed instead of waiting for the whole list
+        const data = [];
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let firstShown = false;
+        products = data;
+        while (true) {
+            const { done, value } = await reader.read();
+            buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+            const lines = buffer.split('\n');
+            buffer = done ? '' : lines.pop();
+            for (const line of lines) {
+                if (line) data.push(JSON.parse(line));
+            }
+            if (!firstShown && data.length > 0) {
+                firstShown = true;
+                displayProduct(0);
+            }
+            if (done) break;
+        }
+
+        // Store all products for filtering
+        allProducts = data;
+        allProductIds = new Set(data.map(p => p.product_id));
+        filteredProducts = [...allProducts];
+        products = filteredProducts;
+
+        // Build the category sidebar
+        buildCategorySidebar();
+
+        if (firstShown) {
+            // The first product was shown mid-stream; refresh the totals
+            updateNavigation(currentIndex);
+        } else if (products.length > 0) {
+            displayProduct(0);
+        } else {
+            document.getElementById('productCard').innerHTML = `
+                <div class="no-data">
+                    <h2>No products found</h2>
+                    <p>${useSupabase ? 'No products in Supabase database. Run: <code>python main.py --supabase</code>' : 'Run the scraper first: <code>python main.py</code>'}</p>
+                </div>
+            `;
+            document.getElementById('counter').textContent = 'No products';
+        }
+    } catch (error) {
+        console.error('Error loading products:', error);
+        document.getElementById('productCard').innerHTML = `
+            <div class="no-data">
+                <h2>Error loading products</h2>
+                <p>${error.message}</p>
+            </div>
+        `;
+    }
+}
+
+// Placeholder for products without images; one cacheable file instead of
+// an inline data URI
+const NO_IMAGE_URL = '/static/no-image.svg';
+
+// _image_urls is filled in for every product by getProductDetail
+function getImageUrl(product, index) {
+    return product._image_urls?.[index] || NO_IMAGE_URL;
+}
+
+function updateNavigation(index) {
+    // Update counter - show category filter if active
+    const categoryLabel = currentCategory === 'all' ? '' : ` in ${formatCategoryName(currentCategory)}`;
+    document.getElementById('counter').textContent = `Product ${index + 1} of ${products.length}${categoryLabel}`;
+
+    // Update navigation buttons
+    document.getElementById('prevBtn').disabled = index === 0;
+    document.getElementById('nextBtn').disabled = index === products.length - 1;
+}
+
+// Curation data per product_id ({curated, rejected, ai_tags, status}), loaded
+// for a window of products at a time so navigating costs no extra requests
+const curationBundles = new Map();
+const CURATION_BUNDLE_WINDOW = 50;
+
+async function getCurationBundle(index, signal) {
+    const productId = products[index].product_id;
+    if (!curationBundles.has(productId)) {
+        const start = Math.max(0, index - CURATION_BUNDLE_WINDOW / 2);
+        const ids = products.slice(start, start + CURATION_BUNDLE_WINDOW)
+            .map(p => p.product_id)
+            .filter(id => id === productId || !curationBundles.has(id));
+        const response = await fetch(`/api/curation_bundle?ids=${ids.map(encodeURIComponent).join(',')}`, { signal });
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        const data = await response.json();
+        for (const [id, bundle] of Object.entries(data)) {
+            curationBundles.set(id, bundle);
+        }
+    }
+    return curationBundles.get(productId);
+}
+
+// Full product records by product_id. /api/products only lists what's needed
+// for navigation and the sidebar; the rest is fetched once a product is shown
+const productDetails = new Map();
+// Detail requests in flight by product_id. A product displayed while its
+// preload is still running waits for that request instead of starting another
+const productDetailRequests = new Map();
+
+function getProductDetail(index) {
+    const product = products[index];
+    const productId = product.product_id;
+    if (productDetails.has(productId)) {
+        return Promise.resolve(productDetails.get(productId));
+    }
+    if (!productDetailRequests.has(productId)) {
+        const request = fetchProductDetail(product).finally(() => {
+            // A refresh may have replaced this request in the meantime
+            if (productDetailRequests.get(productId) === request) {
+                productDetailRequests.delete(productId);
+            }
+        });
+        productDetailRequests.set(productId, request);
+    }
+    return productDetailRequests.get(productId);
+}
+
+async function fetchProductDetail(product) {
+    const response = await fetch(`/api/products/${encodeURIComponent(product.product_id)}`);
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    // Fill in the listed entry itself, so everything reading products[]
+    // (curation, tagging, variants) sees the full record
+    Object.assign(product, await response.json());
+    // Supabase products come with full image URLs. Local ones are served
+    // from their downloaded files (their image_urls, if any, point at the
+    // original remote images), so build those URLs once here
+    product._image_urls = product._source === 'supabase'
+        ? (product.image_urls || [])
+        : (product.images || []).map(
+            image => `/images/${product.category}/${product.product_id}/${image}`
+        );
+    productDetails.set(product.product_id, product);
+    return product;
+}
+
+// Once the browser is idle, warm the caches for the previous and next
+// products (main image and full record) so stepping to them is instant
+function preloadAdjacentProducts(index) {
+    const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+    whenIdle(() => {
+        for (const i of [index + 1, index - 1]) {
+            const product = products[i];
+            if (!product) continue;
+            if (product.thumbnail_url) new Image().src = product.thumbnail_url;
+            getProductDetail(i).catch(() => {});  // Retried when displayed
+        }
+    });
+}
+
+// Aborts the requests of the previous displayProduct call, so paging quickly
+// doesn't wait on, or render, products the user has already moved past.
+// Detail requests are shared with preloads and always run to completion,
+// since their result is cached either way
+let displayAbortController = null;
+
+// Pass { refresh: true } after editing the product, to refetch its cached
+// detail and curation data
+async function displayProduct(index, { refresh = false } = {}) {
+    if (index < 0 || index >= products.length) return;
+
+    currentIndex = index;
+    currentImageIndex = 0;
+
+    displayAbortController?.abort();
+    displayAbortController = new AbortController();
+    const { signal } = displayAbortController;
+
+    updateNavigation(index);
+
+    if (refresh) {
+        productDetails.delete(products[index].product_id);
+        productDetailRequests.delete(products[index].product_id);
+    }
+    let product;
+    try {
+        product = await getProductDetail(index);
+    } catch (error) {
+        if (signal.aborted) return;
+        console.error('Error loading product:', error);
+        document.getElementById('productCard').innerHTML = `
+            <div class="no-data">
+                <h2>Error loading product</h2>
+                <p>${error.message}</p>
+            </div>
+        `;
+        return;
+    }
+    if (signal.aborted) return;
+
+    // Fetch curated metadata for this product (if using Supabase)
+    let curatedTags = [];
+    let curatedFit = [];
+    let curatedWeight = [];
+    let rejectedTags = [];
+    let aiGeneratedTags = [];
+    let curationStatus = null;
+    if (useSupabase) {
+        if (refresh) curationBundles.delete(product.product_id);
+        try {
+            const bundle = await getCurationBundle(index, signal);
+            const curatedData = bundle.curated;
+            curatedTags = curatedData.filter(c => c.field_name === 'style_tag');
+            curatedFit = curatedData.filter(c => c.field_name === 'fit');
+            curatedWeight = curatedData.filter(c => c.field_name === 'weight');
+            rejectedTags = bundle.rejected;
+            aiGeneratedTags = bundle.ai_tags.filter(t => t.field_name === 'style_tag');
+            curationStatus = bundle.status;
+        } catch (error) {
+            if (signal.aborted) return;
+            console.error('Error fetching curation data:', error);
+        }
+    }
+    // Another product was displayed while this one's data loaded
+    if (signal.aborted) return;
+
+    // Store for global access
+    window.currentCurationStatus = curationStatus;
+
+    // Store rejected tags globally for easy lookup
+    window.currentRejectedTags = rejectedTags;
+
+    // Store AI-generated tags globally
+    window.currentAIGeneratedTags = aiGeneratedTags;
+
+    // Helper function to check if an inferred tag is rejected
+    function isTagRejected(fieldName, fieldValue) {
+        return rejectedTags.some(r => r.field_name === fieldName && r.field_value === fieldValue);
+    }
+
+    // Helper function to get rejection info for a tag
+    function getRejectionInfo(fieldName, fieldValue) {
+        return rejectedTags.find(r => r.field_name === fieldName && r.field_value === fieldValue);
+    }
+
+    // Build price display
+    let priceHtml = '';
+    if (product.price) {
+        const current = product.price.current;
+        const original = product.price.original;
+        const discount = product.price.discount_percentage;
+
+        priceHtml = `<span class="current-price">$${current || 'N/A'}</span>`;
+        if (original && original > current) {
+            priceHtml += `<span class="original-price">$${original}</span>`;
+        }
+        if (discount) {
+            priceHtml += `<span class="discount-badge">-${discount}%</span>`;
+        }
+    }
+
+    // Build clickable color tags that link to color variants
+    // First, build a map of color variants for this product
+    const currentColor = product.color || '';
+    const parentId = product.parent_product_id || product.product_id.split('_')[0];
+
+    const colorTags = (product.colors || []).map(c => {
+        // Generate the color slug to find the matching product
+        const colorSlug = c.toLowerCase().replace(/[^a-z0-9]+/g, '_').replace(/^_+|_+$/g, '') || 'unknown';
+        const variantId = parentId + '_' + colorSlug;
+
+        // Check if this is the current color
+        const isCurrentColor = c.toLowerCase() === currentColor.toLowerCase();
+
+        // Find if the color variant exists in our products
+        const variantExists = allProductIds.has(variantId);
+
+        if (isCurrentColor) {
+            // Current color - highlight it
+            return `<span class="tag" style="background:#4CAF50;color:white;font-weight:bold;" title="Current color">${c}</span>`;
+        } else if (variantExists) {
+            // Clickable link to the variant
+            return `<span class="tag color-variant-link" style="cursor:pointer;background:#e3f2fd;color:#1565c0;" data-variant-id="${variantId}" onclick="navigateToColorVariant('${variantId}')" title="Click to view ${c} variant">${c}</span>`;
+        } else {
+            // Variant not in database yet
+            return `<span class="tag" style="opacity:0.6;" title="Color variant not scraped yet">${c}</span>`;
+        }
+    }).join('');
+
+    // Build size tags with availability styling
+    // Try to use sizes_availability first (new format with availability), fallback to sizes (old format)
+    const sizesAvailability = product.sizes_availability || [];
+    const sizesOld = (product.sizes || []).filter(s => s && s.trim() && s !== 'Add');
+
+    let sizeTags = '';
+    if (sizesAvailability.length > 0) {
+        // New format: [{"size": "M", "available": true, "availability": "in_stock"}, ...]
+        sizeTags = sizesAvailability.map(s => {
+            const sizeLabel = typeof s === 'object' ? s.size : s;
+            const isAvailable = typeof s === 'object' ? s.available : true;
+            const availability = typeof s === 'object' ? (s.availability || 'unknown') : 'unknown';
+
+            // Determine styling and tooltip based on availability
+            let style = '';
+            let tooltip = '';
+            let indicator = '';
+
+            if (availability === 'out_of_stock' || !isAvailable) {
+                style = 'background: #f5f5f5; color: #999; text-decoration: line-through;';
+                tooltip = 'Out of stock';
+            } else if (availability === 'low_on_stock') {
+                style = 'background: #fff3e0; color: #e65100; border: 1px solid #ffcc80;';
+                tooltip = 'Low stock – only a few left';
+                indicator = '<span style="display: inline-block; width: 6px; height: 6px; background: #ff9800; border-radius: 50%; margin-left: 6px; animation: pulse 1.5s infinite;"></span>';
+            } else {
+                style = 'background: #e8f5e9; color: #2e7d32; border: 1px solid #c8e6c9;';
+                tooltip = 'In stock';
+            }
+
+            return `<span class="tag" style="${style} cursor: default; transition: all 0.2s;" title="${tooltip}">${sizeLabel}${indicator}</span>`;
+        }).join('');
+    } else if (sizesOld.length > 0) {
+        // Old format: ["S", "M", "L"]
+        sizeTags = sizesOld.map(s => `<span class="tag">${s}</span>`).join('');
+    }
+
+    const materialTags = (product.materials || []).map(m => `<span class="tag">${m}</span>`).join('');
+
+    // Parse composition for better display
+    // Prefer structured composition data if available, otherwise parse the string
+    let compositionHtml = '';
+
+    if (product.composition_structured && product.composition_structured.parts) {
+        // Use structured composition data - hierarchical display
+        const parts = product.composition_structured.parts;
+        compositionHtml = parts.map(part => {
+            const partName = part.name || '';
+            const areasHtml = (part.areas || []).map(area => {
+                const areaName = area.name || '';
+                const components = (area.components || []).map(c =>
+                    `<span class="tag" style="background: #f5f5f5; color: #333; font-size: 12px;">${c.percentage} ${c.material}</span>`
+                ).join('');
+
+                if (areaName) {
+                    // Has sub-area name (e.g., MAIN FABRIC, SECONDARY FABRIC)
+                    return `
+                        <div style="margin-left: 12px; margin-bottom: 8px;">
+                            <div style="font-size: 9px; font-weight: 500; color: #888; margin-bottom: 4px; text-transform: uppercase;">${areaName}</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 6px;">${components}</div>
+                        </div>
+                    `;
+                } else {
+                    // Direct components under the part
+                    return `
+                        <div style="display: flex; flex-wrap: wrap; gap: 6px; margin-left: 12px;">${components}</div>
+                    `;
+                }
+            }).join('');
+
+            if (partName) {
+                return `
+                    <div style="margin-bottom: 16px;">
+                        <div style="font-size: 10px; font-weight: 600; color: #666; margin-bottom: 6px; text-transform: uppercase;">${partName}</div>
+                        ${areasHtml}
+                    </div>
+                `;
+            } else {
+                return areasHtml;
+            }
+        }).join('');
+    } else if (product.composition) {
+        const comp = product.composition;
+
+        // Check if this is a complex shoe-style composition with part names
+        // Sort by length descending to match longer parts first (OUTSOLE before SOLE, etc.)
+        const partNames = ['OUTSOLE', 'MIDSOLE', 'INSOLE', 'FOOTBED', 'COUNTER', 'TONGUE', 'LINING', 'UPPER', 'OUTER', 'INNER', 'SOLE', 'HEEL', 'TOE', 'MAIN FABRIC', 'SECONDARY FABRIC', 'OUTER SHELL'];
+
+        // Find all part matches with their positions
+        let partMatches = [];
+        for (const partName of partNames) {
+            // Match part name case-insensitively
+            const regex = new RegExp(partName, 'gi');
+            let match;
+            while ((match = regex.exec(comp)) !== null) {
+                // Check if this position overlaps with an already found (longer) part
+                let overlaps = false;
+                for (const existing of partMatches) {
+                    if ((match.index >= existing.start && match.index < existing.end) ||
+                        (match.index + partName.length > existing.start && match.index + partName.length <= existing.end)) {
+                        overlaps = true;
+                        break;
+                    }
+                }
+                if (!overlaps) {
+                    partMatches.push({
+                        name: partName.toUpperCase(),
+                        start: match.index,
+                        end: match.index + partName.length
+                    });
+                }
+            }
+        }
+
+        // Sort by position
+        partMatches.sort((a, b) => a.start - b.start);
+
+        const hasParts = partMatches.length > 0;
+
+        if (hasParts) {
+            // Parse each section
+            let sections = [];
+            for (let i = 0; i < partMatches.length; i++) {
+                const partName = partMatches[i].name;
+                const startPos = partMatches[i].end;
+                const endPos = (i + 1 < partMatches.length) ? partMatches[i + 1].start : comp.length;
+
+                let materialsStr = comp.substring(startPos, endPos).trim();
+                // Remove leading colon or space if present
+                materialsStr = materialsStr.replace(/^[:\s]+/, '');
+
+                // Parse materials: "37% polyurethane32% polyester" -> ["37% polyurethane", "32% polyester"]
+                const materialList = materialsStr.match(/\d+%\s*[a-zA-Z][a-zA-Z\s]*?(?=\d+%|$)/g) || [];
+                const cleanedMaterials = materialList.map(m => m.trim()).filter(m => m);
+
+                if (cleanedMaterials.length > 0) {
+                    sections.push({
+                        part: partName,
+                        materials: cleanedMaterials
+                    });
+                }
+            }
+
+            if (sections.length > 0) {
+                compositionHtml = sections.map(section => `
+                    <div style="margin-bottom: 12px;">
+                        <div style="font-size: 10px; font-weight: 600; color: #666; margin-bottom: 6px;">${section.part}</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 6px;">
+                            ${section.materials.map(m => `<span class="tag" style="background: #f5f5f5; color: #333; font-size: 12px;">${m}</span>`).join('')}
+                        </div>
+                    </div>
+                `).join('');
+            } else {
+                // Fallback to simple display
+                compositionHtml = `<p style="color: #333; font-size: 14px; font-weight: 500; margin: 0; font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Fira Code', monospace;">${comp}</p>`;
+            }
+        } else {
+            // Simple composition like "100% cotton" or "49% polyamide, 29% polyester"
+            // Parse into individual materials for pill display
+            const materials = comp.split(/,\s*/).map(m => m.trim()).filter(m => m);
+            if (materials.length > 1) {
+                compositionHtml = `
+                    <div style="display: flex; flex-wrap: wrap; gap: 6px;">
+                        ${materials.map(m => `<span class="tag" style="background: #f5f5f5; color: #333; font-size: 12px;">${m}</span>`).join('')}
+                    </div>
+                `;
+            } else {
+                compositionHtml = `<p style="color: #333; font-size: 14px; font-weight: 500; margin: 0; font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Fira Code', monospace;">${comp}</p>`;
+            }
+        }
+    }
+
+    // Build style tags with reasoning (hover to see reasoning)
+    const styleTags = (product.style_tags || []).map(s => {
+        // Handle both old format (string) and new format (object with tag/reasoning)
+        const tagValue = typeof s === 'string' ? s : s.tag;
+        const reasoning = typeof s === 'string' ? '' : (s.reasoning || '');
+        const isRejected = isTagRejected('style_tag', tagValue);
+        const rejectedClass = isRejected ? 'rejected-tag' : '';
+        const deleteTitle = isRejected ? 'Undo rejection (restore tag)' : 'Mark as incorrect';
+        const deleteSymbol = isRejected ? '↩' : '×';
+
+        return `<span class="tag-container">
+            <span class="tag ${rejectedClass}" style="background:#e3f2fd;color:#1565c0;cursor:help;" title="${reasoning}" data-field="style_tag" data-value="${tagValue}" data-reasoning="${reasoning}" data-type="inferred">${tagValue}</span>
+            <button class="tag-delete-btn" data-field="style_tag" data-value="${tagValue}" data-rejected="${isRejected}" onclick="handleTagDeleteClick(this)" title="${deleteTitle}">${deleteSymbol}</button>
+        </span>`;
+    }).join('');
+
+    // Render card. The gallery keeps its <img> elements between products;
+    // only the metadata markup is rebuilt
+    renderGallery(product);
+    document.getElementById('productMetadata').innerHTML = `
+            ${curateMode ? `
+                <div class="category-dropdown-wrapper">
+                    <select class="category-dropdown" onchange="handleCategoryChange(this)">
+                        ${buildCategoryDropdownOptions(classifyProduct(product).sub || product.category)}
+                    </select>
+                </div>
+            ` : `
+                <span class="category-badge">${getDisplayCategory(product)}</span>
+            `}
+            <h2 class="product-name">${product.name}</h2>
+            <p class="product-id">ID: ${product.product_id}</p>
+
+            <div class="price-section">
+                ${priceHtml}
+            </div>
+
+            ${product.tags_final ? `
+                <div class="ai-section" style="margin-top: 20px; padding: 20px; background: linear-gradient(135deg, #fafafa 0%, #f5f5f5 100%); border-radius: 12px; border: 1px solid #e0e0e0;">
+                    <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 20px;">
+                        <span style="font-size: 11px; font-weight: 600; color: #666; text-transform: uppercase; letter-spacing: 1px;">ReFitd Canonical Tags</span>
+                        <span style="font-size: 10px; font-weight: 600; padding: 4px 10px; border-radius: 10px; background: ${
+                            product.curation_status_refitd === 'approved' ? '#4CAF50' :
+                            product.curation_status_refitd === 'needs_review' ? '#FF9800' :
+                            product.curation_status_refitd === 'needs_fix' ? '#f44336' : '#bdbdbd'
+                        }; color: white; text-transform: uppercase; letter-spacing: 0.5px;">${product.curation_status_refitd || 'pending'}</span>
+                    </div>
+
+                    <!-- Style Identity (array field) -->
+                    <div style="margin-bottom: 20px;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.8px; margin-bottom: 10px;">Style Identity</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                            ${(product.tags_final.style_identity || []).map(s => `
+                                <span style="display: inline-flex; align-items: center; background: #1a1a1a; color: white; font-weight: 500; padding: 8px 16px; border-radius: 6px; font-size: 13px; gap: 8px;">
+                                    ${s}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagRemove('style_identity', '${s.replace(/'/g, "\'")}')" title="Remove ${s}" style="display: none; background: none; border: none; color: rgba(255,255,255,0.7); cursor: pointer; padding: 0; font-size: 16px; line-height: 1; margin-left: 4px;">×</button>
+                                </span>
+                            `).join('')}
+                            ${(product.tags_final.deleted_tags?.style_identity || []).map(s => {
+                                // Handle both old format (string) and new format (object)
+                                const tagValue = typeof s === 'string' ? s : s.value;
+                                const reason = typeof s === 'string' ? '' : (s.reason || '');
+                                const curator = typeof s === 'string' ? '' : (s.curator || '');
+                                const tooltip = reason ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : 'Rejected');
+                                return `
+                                    <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #3d1a1a; color: #999; font-weight: 500; padding: 8px 16px; border-radius: 6px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #6d3a3a; cursor: help;" title="${tooltip}">
+                                        ${tagValue}
+                                        ${reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none;">(${reason.substring(0, 30)}${reason.length > 30 ? '...' : ''})</span>` : ''}
+                                        <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagAdd('style_identity', '${tagValue.replace(/'/g, "\'")}')" title="Restore ${tagValue}" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                    </span>
+                                `;
+                            }).join('')}
+                            ${(product.tags_final.style_identity || []).length === 0 && !(product.tags_final.deleted_tags?.style_identity || []).length ? `<span style="color: #ccc; font-size: 12px;">None</span>` : ''}
+                            <div class="canonical-tag-add-input" style="display: none;">
+                                <select style="padding: 8px 12px; border: 1px dashed #ccc; border-radius: 6px; font-size: 13px; background: white;" onchange="if(this.value){handleCanonicalTagAdd('style_identity', this.value); this.value='';}">
+                                    <option value="">Add style...</option>
+                                    <option value="minimal">Minimal</option>
+                                    <option value="classic">Classic</option>
+                                    <option value="preppy">Preppy</option>
+                                    <option value="workwear">Workwear</option>
+                                    <option value="streetwear">Streetwear</option>
+                                    <option value="rugged">Rugged</option>
+                                    <option value="tailoring">Tailoring</option>
+                                    <option value="elevated-basics">Elevated Basics</option>
+                                    <option value="normcore">Normcore</option>
+                                    <option value="sporty">Sporty</option>
+                                    <option value="outdoorsy">Outdoorsy</option>
+                                    <option value="western">Western</option>
+                                    <option value="vintage">Vintage</option>
+                                    <option value="grunge">Grunge</option>
+                                    <option value="punk">Punk</option>
+                                    <option value="utilitarian">Utilitarian</option>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <!-- Formality (single-value field) -->
+                    <div style="margin-bottom: 16px; background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Formality</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                            ${product.tags_final.formality ? `
+                                <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                    ${product.tags_final.formality}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('formality', null)" title="Remove formality" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                </span>
+                            ` : `<span style="color: #ccc; font-size: 12px;">Not set</span>`}
+                            ${product.tags_final.deleted_tags?.formality ? (() => {
+                                const dt = product.tags_final.deleted_tags.formality;
+                                const tagValue = typeof dt === 'string' ? dt : (dt?.value || '');
+                                const reason = typeof dt === 'string' ? '' : (dt?.reason || '');
+                                const curator = typeof dt === 'string' ? '' : (dt?.curator || '');
+                                const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                return `
+                                    <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                        ${tagValue}${reasonSnippet}
+                                        <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagSet('formality', '${tagValue}')" title="Restore formality" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                    </span>
+                                `;
+                            })() : ''}
+                            <div class="canonical-tag-add-input" style="display: none;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white;" onchange="if(this.value){handleCanonicalTagSet('formality', this.value); this.value='';}">
+                                    <option value="">Set formality...</option>
+                                    <option value="athletic">Athletic</option>
+                                    <option value="casual">Casual</option>
+                                    <option value="smart-casual">Smart Casual</option>
+                                    <option value="business-casual">Business Casual</option>
+                                    <option value="formal">Formal</option>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 12px;">
+                        <!-- Fit (single-value field) - NOT for shoes -->
+                        <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Fit</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                                ${product.tags_final.fit ? `
+                                    <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                        ${product.tags_final.fit}
+                                        <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('fit', null)" title="Remove fit" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                    </span>
+                                ` : `<span style="color: #ccc; font-size: 12px;">${product.tags_final.shoe_type ? 'N/A' : 'Not set'}</span>`}
+                                ${product.tags_final.deleted_tags?.fit ? (() => {
+                                    const dt = product.tags_final.deleted_tags.fit;
+                                    const tagValue = typeof dt === 'string' ? dt : (dt?.value || '');
+                                    const reason = typeof dt === 'string' ? '' : (dt?.reason || '');
+                                    const curator = typeof dt === 'string' ? '' : (dt?.curator || '');
+                                    const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                    const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                    return `
+                                        <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                            ${tagValue}${reasonSnippet}
+                                            <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagSet('fit', '${tagValue}')" title="Restore fit" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                        </span>
+                                    `;
+                                })() : ''}
+                            </div>
+                            <div class="canonical-tag-add-input" style="display: none; margin-top: 8px;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white; width: 100%;" onchange="if(this.value){handleCanonicalTagSet('fit', this.value); this.value='';}">
+                                    <option value="">Set fit...</option>
+                                    <option value="skinny">Skinny</option>
+                                    <option value="slim">Slim</option>
+                                    <option value="regular">Regular</option>
+                                    <option value="relaxed">Relaxed</option>
+                                    <option value="baggy">Baggy</option>
+                                    <option value="oversized">Oversized</option>
+                                </select>
+                            </div>
+                        </div>
+                        <!-- Silhouette (single-value field) -->
+                        <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Silhouette</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                                ${product.tags_final.silhouette ? `
+                                    <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                        ${product.tags_final.silhouette}
+                                        <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('silhouette', null)" title="Remove silhouette" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                    </span>
+                                ` : `<span style="color: #ccc; font-size: 12px;">${product.tags_final.shoe_type ? 'N/A' : 'Not set'}</span>`}
+                                ${product.tags_final.deleted_tags?.silhouette ? (() => {
+                                    const dt = product.tags_final.deleted_tags.silhouette;
+                                    const tagValue = typeof dt === 'string' ? dt : (dt?.value || '');
+                                    const reason = typeof dt === 'string' ? '' : (dt?.reason || '');
+                                    const curator = typeof dt === 'string' ? '' : (dt?.curator || '');
+                                    const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                    const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                    return `
+                                        <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                            ${tagValue}${reasonSnippet}
+                                            <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagSet('silhouette', '${tagValue}')" title="Restore silhouette" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                        </span>
+                                    `;
+                                })() : ''}
+                            </div>
+                            <div class="canonical-tag-add-input" style="display: none; margin-top: 8px;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white; width: 100%;" onchange="if(this.value){handleCanonicalTagSet('silhouette', this.value); this.value='';}">
+                                    <option value="">Set silhouette...</option>
+                                    <optgroup label="Bottoms">
+                                        <option value="straight">Straight</option>
+                                        <option value="tapered">Tapered</option>
+                                        <option value="wide">Wide</option>
+                                    </optgroup>
+                                    <optgroup label="Tops & Outerwear">
+                                        <option value="neutral">Neutral</option>
+                                        <option value="relaxed">Relaxed</option>
+                                        <option value="boxy">Boxy</option>
+                                        <option value="structured">Structured</option>
+                                        <option value="tailored">Tailored</option>
+                                        <option value="longline">Longline</option>
+                                    </optgroup>
+                                </select>
+                            </div>
+                        </div>
+                        <!-- Length (single-value field) - NOT for shoes -->
+                        <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Length</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                                ${product.tags_final.length ? `
+                                    <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                        ${product.tags_final.length}
+                                        <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('length', null)" title="Remove length" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                    </span>
+                                ` : `<span style="color: #ccc; font-size: 12px;">${product.tags_final.shoe_type ? 'N/A' : 'Not set'}</span>`}
+                                ${product.tags_final.deleted_tags?.length ? (() => {
+                                    const dt = product.tags_final.deleted_tags.length;
+                                    const tagValue = typeof dt === 'string' ? dt : (dt?.value || '');
+                                    const reason = typeof dt === 'string' ? '' : (dt?.reason || '');
+                                    const curator = typeof dt === 'string' ? '' : (dt?.curator || '');
+                                    const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                    const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                    return `
+                                        <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                            ${tagValue}${reasonSnippet}
+                                            <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagSet('length', '${tagValue}')" title="Restore length" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                        </span>
+                                    `;
+                                })() : ''}
+                            </div>
+                            <div class="canonical-tag-add-input" style="display: none; margin-top: 8px;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white; width: 100%;" onchange="if(this.value){handleCanonicalTagSet('length', this.value); this.value='';}">
+                                    <option value="">Set length...</option>
+                                    <option value="cropped">Cropped</option>
+                                    <option value="regular">Regular</option>
+                                    <option value="long">Long</option>
+                                </select>
+                            </div>
+                        </div>
+                        <!-- Pattern (single-value field) -->
+                        <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Pattern</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                                ${product.tags_final.pattern ? `
+                                    <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                        ${product.tags_final.pattern}
+                                        <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('pattern', null)" title="Remove pattern" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                    </span>
+                                ` : `<span style="color: #ccc; font-size: 12px;">Not set</span>`}
+                                ${product.tags_final.deleted_tags?.pattern ? (() => {
+                                    const dt = product.tags_final.deleted_tags.pattern;
+                                    const tagValue = typeof dt === 'string' ? dt : (dt?.value || '');
+                                    const reason = typeof dt === 'string' ? '' : (dt?.reason || '');
+                                    const curator = typeof dt === 'string' ? '' : (dt?.curator || '');
+                                    const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                    const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                    return `
+                                        <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                            ${tagValue}${reasonSnippet}
+                                            <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagSet('pattern', '${tagValue}')" title="Restore pattern" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                        </span>
+                                    `;
+                                })() : ''}
+                            </div>
+                            <div class="canonical-tag-add-input" style="display: none; margin-top: 8px;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white; width: 100%;" onchange="if(this.value){handleCanonicalTagSet('pattern', this.value); this.value='';}">
+                                    <option value="">Set pattern...</option>
+                                    <option value="solid">Solid</option>
+                                    <option value="stripe">Stripe</option>
+                                    <option value="check">Check</option>
+                                    <option value="textured">Textured</option>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <!-- Context (array field) -->
+                    <div style="margin-top: 16px; background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 10px;">Context</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                            ${(product.tags_final.context || []).map(c => `
+                                <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px;">
+                                    ${c}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagRemove('context', '${c.replace(/'/g, "\'")}')" title="Remove ${c}" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                </span>
+                            `).join('')}
+                            ${(product.tags_final.deleted_tags?.context || []).map(c => {
+                                // Handle both old format (string) and new format (object)
+                                const tagValue = typeof c === 'string' ? c : (c?.value || '');
+                                const reason = typeof c === 'string' ? '' : (c?.reason || '');
+                                const curator = typeof c === 'string' ? '' : (c?.curator || '');
+                                const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                return `
+                                    <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                        ${tagValue}${reasonSnippet}
+                                        <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagAdd('context', '${tagValue.replace(/'/g, "\\'")}')" title="Restore ${tagValue}" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                    </span>
+                                `;
+                            }).join('')}
+                            ${(product.tags_final.context || []).length === 0 && !(product.tags_final.deleted_tags?.context || []).length ? `<span style="color: #ccc; font-size: 12px;">None</span>` : ''}
+                            <div class="canonical-tag-add-input" style="display: none;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white;" onchange="if(this.value){handleCanonicalTagAdd('context', this.value); this.value='';}">
+                                    <option value="">Add context...</option>
+                                    <option value="everyday">Everyday</option>
+                                    <option value="work-appropriate">Work Appropriate</option>
+                                    <option value="travel">Travel</option>
+                                    <option value="evening">Evening</option>
+                                    <option value="weekend">Weekend</option>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <!-- Construction Details (array field) -->
+                    <div style="margin-top: 12px; background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 10px;">Construction</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                            ${(product.tags_final.construction_details || []).map(d => `
+                                <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px;">
+                                    ${d}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagRemove('construction_details', '${d.replace(/'/g, "\'")}')" title="Remove ${d}" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                </span>
+                            `).join('')}
+                            ${(product.tags_final.deleted_tags?.construction_details || []).map(c => {
+                                // Handle both old format (string) and new format (object)
+                                const tagValue = typeof c === 'string' ? c : (c?.value || '');
+                                const reason = typeof c === 'string' ? '' : (c?.reason || '');
+                                const curator = typeof c === 'string' ? '' : (c?.curator || '');
+                                const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                return `
+                                    <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                        ${tagValue}${reasonSnippet}
+                                        <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagAdd('construction_details', '${tagValue.replace(/'/g, "\\'")}')" title="Restore ${tagValue}" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                    </span>
+                                `;
+                            }).join('')}
+                            ${(product.tags_final.construction_details || []).length === 0 && !(product.tags_final.deleted_tags?.construction_details || []).length ? `<span style="color: #ccc; font-size: 12px;">None</span>` : ''}
+                            <div class="canonical-tag-add-input" style="display: none;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white;" onchange="if(this.value){handleCanonicalTagAdd('construction_details', this.value); this.value='';}">
+                                    <option value="">Add detail...</option>
+                                    <optgroup label="Bottoms">
+                                        <option value="pleated">Pleated</option>
+                                        <option value="flat-front">Flat Front</option>
+                                        <option value="cargo">Cargo</option>
+                                        <option value="drawstring">Drawstring</option>
+                                        <option value="elastic-waist">Elastic Waist</option>
+                                    </optgroup>
+                                    <optgroup label="Tops & Outerwear">
+                                        <option value="structured-shoulder">Structured Shoulder</option>
+                                        <option value="dropped-shoulder">Dropped Shoulder</option>
+                                    </optgroup>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <!-- Pairing Tags (array field) -->
+                    <div style="margin-top: 12px; background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 10px;">Pairing</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                            ${(product.tags_final.pairing_tags || []).map(p => `
+                                <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px;">
+                                    ${p}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagRemove('pairing_tags', '${p.replace(/'/g, "\'")}')" title="Remove ${p}" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                </span>
+                            `).join('')}
+                            ${(product.tags_final.deleted_tags?.pairing_tags || []).map(p => {
+                                // Handle both old format (string) and new format (object)
+                                const tagValue = typeof p === 'string' ? p : (p?.value || '');
+                                const reason = typeof p === 'string' ? '' : (p?.reason || '');
+                                const curator = typeof p === 'string' ? '' : (p?.curator || '');
+                                const tooltip = reason && curator ? `Rejected by ${curator}: ${reason}` : (curator ? `Rejected by ${curator}` : (reason ? `Reason: ${reason}` : 'Rejected'));
+                                const reasonSnippet = reason ? `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${reason.length > 30 ? reason.substring(0, 30) + '...' : reason})</span>` : '';
+                                return `
+                                    <span class="deleted-tag-display" style="display: inline-flex; align-items: center; background: #fee; color: #999; padding: 6px 12px; border-radius: 4px; font-size: 13px; gap: 8px; text-decoration: line-through; border: 1px dashed #fcc; cursor: help;" title="${tooltip}">
+                                        ${tagValue}${reasonSnippet}
+                                        <button class="canonical-tag-restore-btn" onclick="handleCanonicalTagAdd('pairing_tags', '${tagValue.replace(/'/g, "\\'")}')" title="Restore ${tagValue}" style="display: none; background: none; border: none; color: #4caf50; cursor: pointer; padding: 0; font-size: 12px; line-height: 1;">↩</button>
+                                    </span>
+                                `;
+                            }).join('')}
+                            ${(product.tags_final.pairing_tags || []).length === 0 && !(product.tags_final.deleted_tags?.pairing_tags || []).length ? `<span style="color: #ccc; font-size: 12px;">None</span>` : ''}
+                            <div class="canonical-tag-add-input" style="display: none;">
+                                <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px; background: white;" onchange="if(this.value){handleCanonicalTagAdd('pairing_tags', this.value); this.value='';}">
+                                    <option value="">Add pairing...</option>
+                                    <option value="neutral-base">Neutral Base</option>
+                                    <option value="statement-piece">Statement Piece</option>
+                                    <option value="easy-dress-up">Easy Dress Up</option>
+                                    <option value="easy-dress-down">Easy Dress Down</option>
+                                    <option value="high-versatility">High Versatility</option>
+                                </select>
+                            </div>
+                        </div>
+                    </div>
+
+                    <!-- Shoe-specific fields -->
+                    ${product.tags_final.shoe_type || product.tags_final.profile || product.tags_final.closure ? `
+                        <div style="margin-top: 16px; padding-top: 16px; border-top: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 12px;">Shoe Details</div>
+                            <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px;">
+                                ${product.tags_final.shoe_type ? `
+                                    <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Type</div>
+                                        <span style="display: inline-flex; align-items: center; background: #1a1a1a; color: white; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                            ${product.tags_final.shoe_type}
+                                            <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('shoe_type', null)" title="Remove shoe type" style="display: none; background: none; border: none; color: rgba(255,255,255,0.7); cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                        </span>
+                                    </div>
+                                ` : ''}
+                                ${product.tags_final.profile ? `
+                                    <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Profile</div>
+                                        <span style="display: inline-flex; align-items: center; background: #1a1a1a; color: white; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                            ${product.tags_final.profile}
+                                            <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('profile', null)" title="Remove profile" style="display: none; background: none; border: none; color: rgba(255,255,255,0.7); cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                        </span>
+                                    </div>
+                                ` : ''}
+                                ${product.tags_final.closure ? `
+                                    <div style="background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Closure</div>
+                                        <span style="display: inline-flex; align-items: center; background: #1a1a1a; color: white; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                            ${product.tags_final.closure}
+                                            <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('closure', null)" title="Remove closure" style="display: none; background: none; border: none; color: rgba(255,255,255,0.7); cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                        </span>
+                                    </div>
+                                ` : ''}
+                            </div>
+                        </div>
+                    ` : ''}
+
+                    <!-- Top Layer Role (only for tops) -->
+                    ${product.tags_final.top_layer_role ? `
+                        <div style="margin-top: 12px; background: white; padding: 14px 16px; border-radius: 8px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 8px;">Top Layer Role</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px; align-items: center;">
+                                <span style="display: inline-flex; align-items: center; background: #f5f5f5; color: #333; padding: 6px 12px; border-radius: 4px; font-size: 13px; font-weight: 500; gap: 8px;">
+                                    ${product.tags_final.top_layer_role === 'base' ? 'Base Layer' : 'Mid Layer'}
+                                    <button class="canonical-tag-delete-btn" onclick="handleCanonicalTagSet('top_layer_role', null)" title="Remove layer role" style="display: none; background: none; border: none; color: #999; cursor: pointer; padding: 0; font-size: 14px; line-height: 1;">×</button>
+                                </span>
+                                <div class="canonical-tag-add-input" style="display: none;">
+                                    <select style="padding: 6px 10px; border: 1px dashed #ccc; border-radius: 4px; font-size: 12px;" onchange="if(this.value){handleCanonicalTagSet('top_layer_role', this.value); this.value='';}">
+                                        <option value="">Set layer...</option>
+                                        <option value="base">Base Layer</option>
+                                        <option value="mid">Mid Layer</option>
+                                    </select>
+                                </div>
+                            </div>
+                        </div>
+                    ` : ''}
+
+                    ${product.tag_policy_version ? `
+                        <div style="margin-top: 16px; padding-top: 12px; border-top: 1px solid #eee; font-size: 11px; color: #bbb;">
+                            Policy: ${product.tag_policy_version}
+                        </div>
+                    ` : ''}
+                </div>
+            ` : ''}
+
+            <!-- Product Details Section -->
+            <div class="product-details-grid" style="margin-top: 24px; display: grid; gap: 20px;">
+
+                ${product.description ? `
+                    <div class="detail-card" style="background: #fafafa; border-radius: 12px; padding: 20px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 12px;">Description</div>
+                        <p style="color: #333; line-height: 1.7; font-size: 14px; margin: 0;">${product.description}</p>
+                    </div>
+                ` : ''}
+
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px;">
+                    ${colorTags ? `
+                        <div class="detail-card" style="background: #fafafa; border-radius: 12px; padding: 20px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 12px;">Colors</div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px;">${colorTags}</div>
+                        </div>
+                    ` : ''}
+
+                    ${sizeTags ? `
+                        <div class="detail-card" style="background: #fafafa; border-radius: 12px; padding: 20px; border: 1px solid #eee;">
+                            <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 12px;">
+                                Sizes
+                                <span style="font-weight: 400; font-size: 9px; color: #bbb; text-transform: none; letter-spacing: 0; margin-left: 6px;">(hover for stock)</span>
+                            </div>
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px;">${sizeTags}</div>
+                            ${product.sizes_checked_at ? `
+                                <div style="margin-top: 12px; font-size: 10px; font-style: italic; color: #bbb;">
+                                    Updated ${new Date(product.sizes_checked_at).toLocaleDateString('en-US', { month: 'short', day: 'numeric' })} at ${new Date(product.sizes_checked_at).toLocaleTimeString('en-US', { hour: 'numeric', minute: '2-digit' })}
+                                </div>
+                            ` : ''}
+                        </div>
+                    ` : ''}
+                </div>
+
+                ${product.composition || materialTags ? `
+                    <div class="detail-card" style="background: #fafafa; border-radius: 12px; padding: 20px; border: 1px solid #eee;">
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 12px;">Composition</div>
+                        ${compositionHtml}
+                        ${materialTags && !product.composition ? `
+                            <div style="display: flex; flex-wrap: wrap; gap: 8px;">${materialTags}</div>
+                        ` : ''}
+                    </div>
+                ` : ''}
+
+                <div class="detail-card" style="background: #fafafa; border-radius: 12px; padding: 16px 20px; border: 1px solid #eee; display: flex; align-items: center; justify-content: space-between;">
+                    <div>
+                        <div style="font-size: 10px; font-weight: 600; color: #999; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 6px;">Source</div>
+                        <a href="${product.url}" target="_blank" style="color: #1a1a1a; text-decoration: none; font-size: 13px; font-weight: 500; display: flex; align-items: center; gap: 6px;">
+                            <span style="max-width: 300px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">zara.com</span>
+                            <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="opacity: 0.5;"><path d="M18 13v6a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V8a2 2 0 0 1 2-2h6"></path><polyline points="15 3 21 3 21 9"></polyline><line x1="10" y1="14" x2="21" y2="3"></line></svg>
+                        </a>
+                    </div>
+                    <a href="${product.url}" target="_blank" style="background: #1a1a1a; color: white; text-decoration: none; font-size: 12px; font-weight: 500; padding: 8px 16px; border-radius: 6px; transition: all 0.2s;" onmouseover="this.style.background='#333'" onmouseout="this.style.background='#1a1a1a'">View on Zara →</a>
+                </div>
+
+            </div>
+
+            <div class="validation-section" style="margin-top: 24px;">
+                <h3 class="section-title">Curation Status</h3>
+                <div id="curationStatusArea">
+                    ${curationStatus && curationStatus.status === 'complete' ? `
+                        <span class="curation-status-badge complete">✓ Curated by ${curationStatus.curator}</span>
+                        ${curationStatus.notes ? `<p style="font-size:12px;color:#666;margin-top:5px;">Notes: ${curationStatus.notes}</p>` : ''}
+                    ` : `
+                        <span class="curation-status-badge pending">⏳ Pending Curation</span>
+                    `}
+                </div>
+                <div id="curationButtonArea" style="margin-top: 15px;"></div>
+            </div>
+
+            <div class="danger-zone" style="margin-top: 30px; padding: 15px; border: 1px solid #ffcdd2; border-radius: 8px; background: #fff5f5;">
+                <h3 class="section-title" style="color: #c62828; margin-top: 0;">⚠️ Danger Zone</h3>
+                <p style="font-size: 12px; color: #666; margin-bottom: 10px;">Permanently delete this product from the database.</p>
+                <button onclick="deleteProduct('${product.product_id}')"
+                        style="background: #f44336; color: white; border: none; padding: 8px 16px; border-radius: 4px; cursor: pointer; font-size: 13px;"
+                        onmouseover="this.style.background='#d32f2f'"
+                        onmouseout="this.style.background='#f44336'">
+                    🗑️ Delete Product
+                </button>
+            </div>
+
+            <p class="scraped-time">Scraped: ${new Date(product.scraped_at).toLocaleString()}</p>
+    `;
+
+    preloadAdjacentProducts(index);
+}
+
+// Build the card skeleton once; later products reuse its image elements.
+// Other views (e.g. "No products found") replace the card's contents, so
+// rebuild whenever the gallery is missing
+function ensureProductCardLayout() {
+    if (document.getElementById('mainImage')) return;
+    const template = document.getElementById('productCardTemplate');
+    document.getElementById('productCard').replaceChildren(template.content.cloneNode(true));
+}
+
+// Point the main image and thumbnail pool at a product's images, creating
+// thumbnails only when a product has more images than any before it
+function renderGallery(product) {
+    ensureProductCardLayout();
+
+    const imageCount = product._image_urls.length;
+
+    const mainImage = document.getElementById('mainImage');
+    const mainImageSrc = getImageUrl(product, 0);
+    if (mainImage.getAttribute('src') !== mainImageSrc) mainImage.src = mainImageSrc;
+    mainImage.alt = product.name;
+
+    const row = document.getElementById('thumbnailRow');
+    const thumbs = row.children;
+    while (thumbs.length < imageCount) {
+        const thumb = document.createElement('img');
+        const i = thumbs.length;
+        thumb.className = 'thumbnail';
+        thumb.alt = `Thumbnail ${i + 1}`;
+        thumb.onclick = () => changeImage(i);
+        row.appendChild(thumb);
+    }
+    for (let i = 0; i < thumbs.length; i++) {
+        const thumb = thumbs[i];
+        if (i < imageCount) {
+            const src = getImageUrl(product, i);
+            if (thumb.getAttribute('src') !== src) thumb.src = src;
+            thumb.classList.toggle('active', i === 0);
+            thumb.style.display = '';
+        } else {
+            thumb.style.display = 'none';
+        }
+    }
+}
+
+function changeImage(index) {
+    currentImageIndex = index;
+    const product = products[currentIndex];
+    document.getElementById('mainImage').src = getImageUrl(product, index);
+
+    // Update active thumbnail
+    document.querySelectorAll('.thumbnail').forEach((thumb, i) => {
+        thumb.classList.toggle('active', i === index);
+    });
+}
+
+function navigate(direction) {
+    const newIndex = currentIndex + direction;
+    if (newIndex >= 0 && newIndex < products.length) {
+        displayProduct(newIndex);
+        // Preserve curate mode state when navigating
+        if (curateMode && currentCurator) {
+            showCurateInputs();
+        }
+    }
+}
+
+function navigateToColorVariant(variantId) {
+    // Find the index of the color variant product
+    const variantIndex = products.findIndex(p => p.product_id === variantId);
+
+    if (variantIndex !== -1) {
+        displayProduct(variantIndex);
+        // Preserve curate mode state when navigating
+        if (curateMode && currentCurator) {
+            showCurateInputs();
+        }
+        // Scroll to top of product card for better UX
+        document.getElementById('productCard').scrollIntoView({ behavior: 'smooth', block: 'start' });
+    } else {
+        console.warn('Color variant not found:', variantId);
+        alert(`Color variant "${variantId}" not found in the product database.`);
+    }
+}
+
+async function deleteProduct(productId) {
+    // Show confirmation dialog
+    const productName = products[currentIndex]?.name || productId;
+    const confirmed = confirm(`Are you sure you want to delete this product?
+
+"${productName}"
+(ID: ${productId})
+
+This action cannot be undone.`);
+
+    if (!confirmed) return;
+
+    try {
+        const response = await fetch(`/api/products/${productId}`, {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' }
+        });
+
+        const result = await response.json();
+
+        if (response.ok && result.success) {
+            // Remove from local products array
+            const deletedIndex = products.findIndex(p => p.product_id === productId);
+            if (deletedIndex !== -1) {
+                products.splice(deletedIndex, 1);
+            }
+
+            // Show success message
+            alert(`✓ Product deleted successfully!
+
+Images deleted: ${result.images_deleted || 0}`);
+
+            // Navigate to next product or reload
+            if (products.length === 0) {
+                document.getElementById('productCard').innerHTML = `
+                    <div class="no-data">
+                        <h2>No products remaining</h2>
+                        <p>All products have been deleted. Run the scraper to add more.</p>
+                    </div>
+                `;
+                document.getElementById('counter').textContent = 'No products';
+            } else {
+                // Adjust current index if needed
+                if (currentIndex >= products.length) {
+                    currentIndex = products.length - 1;
+                }
+                displayProduct(currentIndex);
+            }
+        } else {
+            alert(`❌ Failed to delete product:
+${result.error || 'Unknown error'}`);
+        }
+    } catch (error) {
+        console.error('Error deleting product:', error);
+        alert(`❌ Error deleting product:
+${error.message}`);
+    }
+}
+
+function markValid(index) {
+    document.getElementById('validationStatus').textContent = '✓ Marked as VALID';
+    document.getElementById('validationStatus').style.color = '#4CAF50';
+    console.log(`Product ${products[index].product_id} marked as valid`);
+}
+
+function markInvalid(index) {
+    document.getElementById('validationStatus').textContent = '✗ Marked as INVALID';
+    document.getElementById('validationStatus').style.color = '#f44336';
+    console.log(`Product ${products[index].product_id} marked as invalid`);
+}
+
+// Keyboard navigation
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'ArrowLeft') navigate(-1);
+    if (e.key === 'ArrowRight') navigate(1);
+});
+
+// ============================================
+// DELETED TAG HELPERS
+// ============================================
+
+// Helper to get value from deleted tag (handles both old string format and new object format)
+function getDeletedTagValue(deletedTag) {
+    return typeof deletedTag === 'string' ? deletedTag : (deletedTag?.value || '');
+}
+
+// Helper to get rejection reason from deleted tag
+function getDeletedTagReason(deletedTag) {
+    return typeof deletedTag === 'string' ? '' : (deletedTag?.reason || '');
+}
+
+// Helper to get curator from deleted tag
+function getDeletedTagCurator(deletedTag) {
+    return typeof deletedTag === 'string' ? '' : (deletedTag?.curator || '');
+}
+
+// Helper to build tooltip for deleted tag
+function getDeletedTagTooltip(deletedTag) {
+    const reason = getDeletedTagReason(deletedTag);
+    const curator = getDeletedTagCurator(deletedTag);
+    if (reason && curator) return `Rejected by ${curator}: ${reason}`;
+    if (curator) return `Rejected by ${curator}`;
+    if (reason) return `Reason: ${reason}`;
+    return 'Rejected';
+}
+
+// Helper to render rejection reason snippet (for inline display)
+function renderRejectionReason(deletedTag) {
+    const reason = getDeletedTagReason(deletedTag);
+    if (!reason) return '';
+    const truncated = reason.length > 30 ? reason.substring(0, 30) + '...' : reason;
+    return `<span style="font-size: 10px; color: #e57373; font-style: italic; text-decoration: none; margin-left: 4px;">(${truncated})</span>`;
+}
+
+// ============================================
+// CURATE MODE FUNCTIONALITY
+// ============================================
+let curateMode = false;
+let currentCurator = null;
+
+const curatorColors = {
+    'Reed': { bg: '#4CAF50', class: 'curator-reed' },
+    'Gigi': { bg: '#9C27B0', class: 'curator-gigi' },
+    'Kiki': { bg: '#E91E63', class: 'curator-kiki' }
+};
+
+function renderCuratedTagsInline(curatedTags) {
+    if (!curatedTags || curatedTags.length === 0) {
+        return '';
+    }
+
+    return curatedTags.map(tag => {
+        const colorInfo = curatorColors[tag.curator] || { bg: '#999' };
+        return `<span class="tag-container">
+            <span class="curated-tag" style="background: ${colorInfo.bg};" data-type="curated" data-field="${tag.field_name}" data-value="${tag.field_value}" data-curator="${tag.curator}">
+                ${tag.field_value} <span class="curator-name">(${tag.curator})</span>
+            </span>
+            <button class="tag-delete-btn" onclick="handleCuratedTagDelete('${tag.field_name}', '${tag.field_value}', '${tag.curator}')" title="Delete curated tag">×</button>
+        </span>`;
+    }).join('');
+}
+
+// Render AI-generated tags with teal/cyan color
+function renderAIGeneratedTagsInline(aiTags) {
+    if (!aiTags || aiTags.length === 0) {
+        return '';
+    }
+
+    return aiTags.map(tag => {
+        return `<span class="tag-container">
+            <span class="ai-generated-tag" style="background: linear-gradient(135deg, #00bcd4, #0097a7); color: #fff; padding: 6px 12px; border-radius: 4px; font-size: 13px; display: inline-flex; align-items: center; gap: 5px;" data-type="ai-generated" data-field="${tag.field_name}" data-value="${tag.field_value}">
+                ${tag.field_value} <span class="ai-badge" style="font-size: 10px; opacity: 0.9; background: rgba(255,255,255,0.2); padding: 1px 4px; border-radius: 3px;">🤖 AI</span>
+            </span>
+            <button class="tag-delete-btn ai-tag-delete" onclick="event.stopPropagation(); handleAITagDelete('${tag.field_name}', '${tag.field_value}')" title="Delete AI-generated tag">×</button>
+        </span>`;
+    }).join('');
+}
+
+function renderCuratedTags(curatedTags) {
+    if (!curatedTags || curatedTags.length === 0) {
+        return '';
+    }
+
+    const tagsHtml = curatedTags.map(tag => {
+        const colorInfo = curatorColors[tag.curator] || { bg: '#999' };
+        return `<span class="curated-tag" style="background: ${colorInfo.bg};">
+            ${tag.field_value} <span class="curator-name">(${tag.curator})</span>
+        </span>`;
+    }).join('');
+
+    return `
+        <h3 class="section-title" style="margin-top: 15px;">Curated Tags</h3>
+        <div class="tag-list">${tagsHtml}</div>
+    `;
+}
+
+function toggleCurateMode() {
+    const btn = document.getElementById('curateBtn');
+    const selector = document.getElementById('curatorSelector');
+
+    if (!curateMode) {
+        // Entering curate mode - show curator selector
+        selector.classList.add('visible');
+        btn.textContent = '❌ Exit Curate';
+        btn.classList.add('active');
+        document.body.classList.add('curate-mode');
+        curateMode = true;
+    } else {
+        // Exiting curate mode
+        exitCurateMode();
+    }
+}
+
+function exitCurateMode() {
+    const btn = document.getElementById('curateBtn');
+    const selector = document.getElementById('curatorSelector');
+    const badge = document.getElementById('curatorBadge');
+
+    selector.classList.remove('visible');
+    badge.style.display = 'none';
+    btn.textContent = '✏️ Curate';
+    btn.classList.remove('active');
+    document.getElementById('curatorSelect').value = '';
+    document.body.classList.remove('curate-mode');
+
+    curateMode = false;
+    currentCurator = null;
+
+    // Hide canonical tag curation controls
+    hideCurateInputs();
+
+    // Re-render the product to hide curate inputs
+    if (products.length > 0) {
+        displayProduct(currentIndex);
+    }
+}
+
+function hideCurateInputs() {
+    // Hide canonical tag delete buttons and add inputs
+    document.querySelectorAll('.canonical-tag-delete-btn').forEach(btn => {
+        btn.style.display = 'none';
+    });
+    document.querySelectorAll('.canonical-tag-add-input').forEach(input => {
+        input.style.display = 'none';
+    });
+}
+
+async function selectCurator(curator) {
+    if (!curator) {
+        currentCurator = null;
+        document.getElementById('curatorBadge').style.display = 'none';
+        return;
+    }
+
+    currentCurator = curator;
+    const badge = document.getElementById('curatorBadge');
+    const colorInfo = curatorColors[curator];
+
+    badge.textContent = `Curating as: ${curator}`;
+    badge.className = `curator-badge ${colorInfo.class}`;
+    badge.style.display = 'inline-block';
+
+    // Re-render the product to show curate inputs (await since displayProduct is async)
+    await displayProduct(currentIndex);
+
+    // Show the curate input after render
+    showCurateInputs();
+}
+
+function showCurateInputs() {
+    if (!currentCurator) return;
+
+    const colorInfo = curatorColors[currentCurator];
+
+    // Show/hide canonical tag delete buttons, add inputs, and restore buttons
+    document.querySelectorAll('.canonical-tag-delete-btn').forEach(btn => {
+        btn.style.display = 'inline';
+    });
+    document.querySelectorAll('.canonical-tag-add-input').forEach(input => {
+        input.style.display = 'inline-block';
+    });
+    document.querySelectorAll('.canonical-tag-restore-btn').forEach(btn => {
+        btn.style.display = 'inline';
+    });
+
+    // Style Tags input
+    const styleInputContainer = document.getElementById('curateStyleTagInput');
+    if (styleInputContainer) {
+        styleInputContainer.innerHTML = `
+            <div class="curate-input-wrapper">
+                <input type="text"
+                       class="curate-input"
+                       id="newStyleTagInput"
+                       placeholder="Add new style tag... (press Enter)"
+                       onkeypress="handleCurateKeypress(event, 'style_tag', 'styleTagsList')"
+                       style="border-color: ${colorInfo.bg};">
+            </div>
+        `;
+    }
+
+    // Fit input
+    const fitInputContainer = document.getElementById('curateFitInput');
+    if (fitInputContainer) {
+        fitInputContainer.innerHTML = `
+            <div class="curate-input-wrapper">
+                <input type="text"
+                       class="curate-input"
+                       id="newFitInput"
+                       placeholder="Add fit value... (e.g., slim, relaxed, oversized)"
+                       onkeypress="handleCurateKeypress(event, 'fit', 'fitTagsList')"
+                       style="border-color: ${colorInfo.bg};">
+            </div>
+        `;
+    }
+
+    // Weight input
+    const weightInputContainer = document.getElementById('curateWeightInput');
+    if (weightInputContainer) {
+        weightInputContainer.innerHTML = `
+            <div class="curate-input-wrapper">
+                <input type="text"
+                       class="curate-input"
+                       id="newWeightInput"
+                       placeholder="Add weight value... (e.g., light, medium, heavy)"
+                       onkeypress="handleCurateKeypress(event, 'weight', 'weightTagsList')"
+                       style="border-color: ${colorInfo.bg};">
+            </div>
+        `;
+    }
+
+    // Mark as Complete button
+    const curationButtonArea = document.getElementById('curationButtonArea');
+    if (curationButtonArea) {
+        const curationStatus = window.currentCurationStatus;
+        if (curationStatus && curationStatus.status === 'complete') {
+            curationButtonArea.innerHTML = `
+                <button class="complete-btn undo" onclick="unmarkProductComplete()">↩ Undo Completion</button>
+            `;
+        } else {
+            curationButtonArea.innerHTML = `
+                <button class="complete-btn" onclick="markProductComplete()">✓ Mark as Complete (Good as is)</button>
+            `;
+        }
+    }
+}
+
+function handleCurateKeypress(event, fieldName, tagsListId) {
+    if (event.key === 'Enter') {
+        const input = event.target;
+        const tagValue = input.value.trim();
+
+        if (tagValue && currentCurator) {
+            addCuratedField(tagValue, fieldName, tagsListId);
+            input.value = '';
+        }
+    }
+}
+
+async function addCuratedField(tagValue, fieldName, tagsListId) {
+    const product = products[currentIndex];
+    const colorInfo = curatorColors[currentCurator];
+
+    // Add the tag to the display immediately
+    const tagsList = document.getElementById(tagsListId);
+
+    // Remove "Not specified" placeholder if present
+    const placeholder = tagsList.querySelector('span[style*="color:#999"]');
+    if (placeholder) {
+        placeholder.remove();
+    }
+
+    // Create the new curated tag element
+    const newTag = document.createElement('span');
+    newTag.className = 'curated-tag';
+    newTag.style.background = colorInfo.bg;
+    newTag.innerHTML = `${tagValue} <span class="curator-name">(${currentCurator})</span>`;
+    tagsList.appendChild(newTag);
+
+    // Save to database
+    try {
+        const response = await fetch('/api/curated', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id,
+                field_name: fieldName,
+                field_value: tagValue,
+                curator: currentCurator
+            })
+        });
+        const result = await response.json();
+        // The tag was added to the page in place; drop the stale cached data
+        curationBundles.delete(product.product_id);
+        if (result.success) {
+            console.log(`✓ Saved curated ${fieldName}: "${tagValue}" by ${currentCurator}`);
+        } else {
+            console.error('Failed to save:', result.error);
+        }
+    } catch (error) {
+        console.error('Error saving curated field:', error);
+    }
+}
+
+// ============================================
+// TAG DELETION FUNCTIONALITY
+// ============================================
+
+function handleTagDeleteClick(button) {
+    const fieldName = button.dataset.field;
+    const fieldValue = button.dataset.value;
+    const isRejected = button.dataset.rejected === 'true';
+    const reasoning = button.dataset.reasoning || '';
+
+    handleInferredTagDelete(fieldName, fieldValue, reasoning, isRejected);
+}
+
+// ============================================
+// TAG REMOVAL FEEDBACK MODAL FUNCTIONS
+// ============================================
+
+let tagRemovalModalResolve = null;
+let tagRemovalModalData = null;
+
+function showTagRemovalModal(fieldName, value) {
+    return new Promise((resolve) => {
+        tagRemovalModalResolve = resolve;
+        tagRemovalModalData = { fieldName, value };
+
+        // Update modal description
+        const description = document.getElementById('tagRemovalDescription');
+        description.innerHTML = `You're removing <strong style="color: #e74c3c;">"${value}"</strong> from <strong>${fieldName.replace(/_/g, ' ')}</strong>. Please provide feedback to help improve AI tagging.`;
+
+        // Clear previous input
+        document.getElementById('tagRemovalReason').value = '';
+        document.getElementById('tagRemovalCategory').value = 'incorrect_value';
+
+        // Show modal
+        const modal = document.getElementById('tagRemovalFeedbackModal');
+        modal.style.display = 'flex';
+
+        // Focus on textarea
+        setTimeout(() => document.getElementById('tagRemovalReason').focus(), 100);
+    });
+}
+
+function closeTagRemovalModal(confirmed) {
+    const modal = document.getElementById('tagRemovalFeedbackModal');
+    modal.style.display = 'none';
+
+    if (tagRemovalModalResolve) {
+        if (confirmed) {
+            const reason = document.getElementById('tagRemovalReason').value.trim();
+            const category = document.getElementById('tagRemovalCategory').value;
+            tagRemovalModalResolve({ confirmed: true, reason, category });
+        } else {
+            tagRemovalModalResolve({ confirmed: false });
+        }
+        tagRemovalModalResolve = null;
+        tagRemovalModalData = null;
+    }
+}
+
+// Close modal on Escape key
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape' && document.getElementById('tagRemovalFeedbackModal').style.display === 'flex') {
+        closeTagRemovalModal(false);
+    }
+});
+
+// ============================================
+// CANONICAL TAG CURATION FUNCTIONS
+// ============================================
+
+async function handleCanonicalTagAdd(fieldName, value) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to add tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+    if (!value || !value.trim()) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/canonical_tags/${product.product_id}/field`, {
+            method: 'PATCH',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                field_name: fieldName,
+                action: 'add',
+                value: value.trim(),
+                curator: currentCurator
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            console.log(`✓ Added canonical tag: "${value}" to ${fieldName}`);
+            // Update local data
+            if (product.tags_final) {
+                product.tags_final = result.tags_final;
+            }
+            // Refresh the display
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            console.error('Failed to add:', result.error);
+            alert('Failed to add tag: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error adding canonical tag:', error);
+        alert('Error adding tag');
+    }
+}
+
+async function handleCanonicalTagRemove(fieldName, value) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to remove tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    // Show feedback modal instead of simple confirm
+    const feedback = await showTagRemovalModal(fieldName, value);
+    if (!feedback.confirmed) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/canonical_tags/${product.product_id}/field`, {
+            method: 'PATCH',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                field_name: fieldName,
+                action: 'remove',
+                value: value,
+                curator: currentCurator,
+                feedback_reason: feedback.reason,
+                feedback_category: feedback.category
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            console.log(`✓ Removed canonical tag: "${value}" from ${fieldName} (reason: ${feedback.reason || 'none provided'})`);
+            // Update local data
+            if (product.tags_final) {
+                product.tags_final = result.tags_final;
+            }
+            // Refresh the display
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            console.error('Failed to remove:', result.error);
+            alert('Failed to remove tag: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error removing canonical tag:', error);
+        alert('Error removing tag');
+    }
+}
+
+async function handleCanonicalTagSet(fieldName, value) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to edit tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    // If removing a tag (value is null), show feedback modal
+    let feedback = { reason: null, category: null };
+    if (value === null) {
+        const currentValue = product.tags_final?.[fieldName];
+        if (currentValue) {
+            const modalResult = await showTagRemovalModal(fieldName, currentValue);
+            if (!modalResult.confirmed) {
+                return;
+            }
+            feedback = { reason: modalResult.reason, category: modalResult.category };
+        }
+    }
+
+    try {
+        const response = await fetch(`/api/canonical_tags/${product.product_id}/field`, {
+            method: 'PATCH',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                field_name: fieldName,
+                action: 'set',
+                value: value ? value.trim() : null,
+                curator: currentCurator,
+                feedback_reason: feedback.reason,
+                feedback_category: feedback.category
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            console.log(`✓ Set canonical tag: ${fieldName} = "${value}"${feedback.reason ? ` (reason: ${feedback.reason})` : ''}`);
+            // Update local data
+            if (product.tags_final) {
+                product.tags_final = result.tags_final;
+            }
+            // Refresh the display
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            console.error('Failed to set:', result.error);
+            alert('Failed to set tag: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error setting canonical tag:', error);
+        alert('Error setting tag');
+    }
+}
+
+async function handleCuratedTagDelete(fieldName, fieldValue, curator) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to delete tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    if (!confirm(`Delete curated tag "${fieldValue}" added by ${curator}?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/curated', {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id,
+                field_name: fieldName,
+                field_value: fieldValue,
+                curator: curator
+            })
+        });
+
+        const result = await response.json();
+        if (result.success || result.error === undefined) {
+            console.log(`✓ Deleted curated tag: "${fieldValue}" by ${curator}`);
+            // Refresh the display
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            console.error('Failed to delete:', result.error);
+            alert('Failed to delete tag: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error deleting curated tag:', error);
+        alert('Error deleting tag');
+    }
+}
+
+// Handle deletion of AI-generated tags
+async function handleAITagDelete(fieldName, fieldValue) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to delete tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    if (!confirm(`Delete AI-generated tag "${fieldValue}"?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/ai_tags', {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id,
+                field_name: fieldName,
+                field_value: fieldValue
+            })
+        });
+
+        const result = await response.json();
+        if (result.success || result.error === undefined) {
+            console.log(`✓ Deleted AI-generated tag: "${fieldValue}"`);
+            // Refresh the display
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            console.error('Failed to delete:', result.error);
+            alert('Failed to delete AI tag: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error deleting AI-generated tag:', error);
+        alert('Error deleting AI tag');
+    }
+}
+
+async function handleInferredTagDelete(fieldName, fieldValue, reasoning, isCurrentlyRejected) {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first to manage tags.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    if (isCurrentlyRejected) {
+        // Undo rejection - restore the tag
+        if (!confirm(`Restore tag "${fieldValue}"? This will undo the rejection.`)) {
+            return;
+        }
+
+        try {
+            const response = await fetch('/api/rejected_tags', {
+                method: 'DELETE',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    product_id: product.product_id,
+                    field_name: fieldName,
+                    field_value: fieldValue
+                })
+            });
+
+            const result = await response.json();
+            if (result.success || result.error === undefined) {
+                console.log(`✓ Restored inferred tag: "${fieldValue}"`);
+                // Refresh the display
+                await displayProduct(currentIndex, { refresh: true });
+                showCurateInputs();
+            } else {
+                console.error('Failed to restore:', result.error);
+                alert('Failed to restore tag: ' + result.error);
+            }
+        } catch (error) {
+            console.error('Error restoring tag:', error);
+            alert('Error restoring tag');
+        }
+    } else {
+        // Mark as rejected
+        const rejectionReason = prompt(`Mark "${fieldValue}" as incorrect?
+
+Optionally, enter why this tag is wrong (for ML training):`, '');
+
+        if (rejectionReason === null) {
+            return; // User cancelled
+        }
+
+        try {
+            const response = await fetch('/api/rejected_tags', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    product_id: product.product_id,
+                    field_name: fieldName,
+                    field_value: fieldValue,
+                    original_reasoning: reasoning,
+                    curator: currentCurator,
+                    rejection_reason: rejectionReason || null
+                })
+            });
+
+            const result = await response.json();
+            if (result.success) {
+                console.log(`✓ Marked inferred tag as rejected: "${fieldValue}" (reason: ${rejectionReason || 'not provided'})`);
+                // Refresh the display
+                await displayProduct(currentIndex, { refresh: true });
+                showCurateInputs();
+            } else {
+                console.error('Failed to reject:', result.error);
+                alert('Failed to mark as incorrect: ' + result.error);
+            }
+        } catch (error) {
+            console.error('Error rejecting tag:', error);
+            alert('Error marking tag as incorrect');
+        }
+    }
+}
+
+// Load products on page load
+loadProducts();
+
+// ============================================
+// TAB NAVIGATION
+// ============================================
+
+function switchTab(tab) {
+    // Update tab buttons
+    document.querySelectorAll('.tab-btn').forEach(btn => btn.classList.remove('active'));
+    if (tab === 'products') {
+        document.getElementById('tabProducts').classList.add('active');
+    } else if (tab === 'ai') {
+        document.getElementById('tabAI').classList.add('active');
+    } else {
+        document.getElementById('tabDashboard').classList.add('active');
+    }
+
+    // Update tab content
+    document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
+    if (tab === 'products') {
+        document.getElementById('productsTab').classList.add('active');
+    } else if (tab === 'ai') {
+        document.getElementById('aiTab').classList.add('active');
+        checkAIStatus();
+    } else {
+        document.getElementById('dashboardTab').classList.add('active');
+        loadDashboard();
+    }
+}
+
+// ============================================
+// AI FUNCTIONALITY
+// ============================================
+
+let chatHistory = [];
+
+async function checkAIStatus() {
+    const statusEl = document.getElementById('aiStatus');
+    const statusText = document.getElementById('aiStatusText');
+
+    try {
+        const response = await fetch('/api/ai/status');
+        const data = await response.json();
+
+        if (data.available) {
+            statusEl.classList.remove('offline');
+            statusEl.classList.add('online');
+            statusText.textContent = 'Online';
+        } else {
+            statusEl.classList.remove('online');
+            statusEl.classList.add('offline');
+            statusText.textContent = 'Offline';
+        }
+    } catch (error) {
+        statusEl.classList.remove('online');
+        statusEl.classList.add('offline');
+        statusText.textContent = 'Error';
+    }
+}
+
+function handleAISearchKeypress(event) {
+    if (event.key === 'Enter') {
+        performAISearch();
+    }
+}
+
+async function performAISearch() {
+    const input = document.getElementById('aiSearchInput');
+    const query = input.value.trim();
+
+    if (!query) {
+        alert('Please enter a search query');
+        return;
+    }
+
+    const searchBtn = document.getElementById('aiSearchBtn');
+    const progress = document.getElementById('searchProgress');
+    const results = document.getElementById('aiSearchResults');
+
+    searchBtn.disabled = true;
+    progress.classList.add('visible');
+    results.innerHTML = '';
+
+    try {
+        const response = await fetch('/api/ai/search', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ query: query, limit: 12 })
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            results.innerHTML = `<div class="no-results"><p>❌ ${data.error}</p></div>`;
+        } else if (data.results && data.results.length > 0) {
+            renderSearchResults(data.results);
+        } else {
+            results.innerHTML = `<div class="no-results"><p>No matching products found. Try a different description.</p></div>`;
+        }
+    } catch (error) {
+        results.innerHTML = `<div class="no-results"><p>❌ Error: ${error.message}</p></div>`;
+    } finally {
+        searchBtn.disabled = false;
+        progress.classList.remove('visible');
+    }
+}
+
+function renderSearchResults(results) {
+    const container = document.getElementById('aiSearchResults');
+    const html = `
+        <p style="color: #666; margin-bottom: 15px;">Found ${results.length} matching products:</p>
+        <div class="ai-results">
+            ${results.map(product => {
+                let imageUrl = NO_IMAGE_URL;
+
+                if (product.image_urls && product.image_urls[0]) {
+                    imageUrl = product.image_urls[0];
+                } else if (product.primary_image) {
+                    imageUrl = product.primary_image;
+                }
+
+                const similarity = product.similarity ? Math.round(product.similarity * 100) : '';
+
+                return `
+                    <div class="ai-result-card" onclick="goToProduct('${product.product_id}')">
+                        <img src="${imageUrl}" alt="${product.name}" onerror="this.onerror = null; this.src = NO_IMAGE_URL">
+                        <div class="card-content">
+                            <div class="card-title">${product.name || 'Unknown'}</div>
+                            <div class="card-price">${product.price || ''}</div>
+                            ${similarity ? `<div class="card-similarity">${similarity}% match</div>` : ''}
+                        </div>
+                    </div>
+                `;
+            }).join('')}
+        </div>
+    `;
+
+    container.innerHTML = html;
+}
+
+function goToProduct(productId) {
+    const index = products.findIndex(p => p.product_id === productId);
+    if (index !== -1) {
+        switchTab('products');
+        displayProduct(index);
+    } else {
+        alert('Product not found in current view. Try refreshing the page.');
+    }
+}
+
+async function generateAllTags() {
+    const btn = document.getElementById('generateAllTagsBtn');
+    const progress = document.getElementById('tagProgress');
+    const progressText = document.getElementById('tagProgressText');
+    const results = document.getElementById('tagResults');
+
+    if (!confirm('This will generate AI style tags for all products without tags. This may take several minutes. Continue?')) {
+        return;
+    }
+
+    btn.disabled = true;
+    progress.classList.add('visible');
+    progressText.textContent = 'Starting...';
+    results.innerHTML = '';
+
+    try {
+        const response = await fetch('/api/ai/generate-tags', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ all: true })
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            results.innerHTML = `<p style="color: #c62828;">❌ ${data.error}</p>`;
+        } else {
+            results.innerHTML = `<p style="color: #2e7d32;">✅ Generated tags for ${data.count || 0} products!</p>`;
+            // Reload products to show new tags
+            await loadProducts();
+        }
+    } catch (error) {
+        results.innerHTML = `<p style="color: #c62828;">❌ Error: ${error.message}</p>`;
+    } finally {
+        btn.disabled = false;
+        progress.classList.remove('visible');
+    }
+}
+
+async function generateTagsForCurrent() {
+    if (products.length === 0 || currentIndex < 0) {
+        alert('No product selected');
+        return;
+    }
+
+    const product = products[currentIndex];
+    const progress = document.getElementById('tagProgress');
+    const progressText = document.getElementById('tagProgressText');
+    const results = document.getElementById('tagResults');
+
+    progress.classList.add('visible');
+    progressText.textContent = `Analyzing ${product.name}...`;
+    results.innerHTML = '';
+
+    try {
+        const response = await fetch('/api/ai/generate-tags', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ product_id: product.product_id })
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            results.innerHTML = `<p style="color: #c62828;">❌ ${data.error}</p>`;
+        } else if (data.tags) {
+            results.innerHTML = `
+                <p style="color: #2e7d32;">✅ Generated tags for ${product.name}:</p>
+                <div class="tag-list" style="margin-top: 10px;">
+                    ${data.tags.map(tag => `<span class="tag" style="background:#e3f2fd;color:#1565c0;">${tag}</span>`).join('')}
+                </div>
+            `;
+            // Reload the current product to show new tags
+            await loadProducts();
+            displayProduct(currentIndex);
+        }
+    } catch (error) {
+        results.innerHTML = `<p style="color: #c62828;">❌ Error: ${error.message}</p>`;
+    } finally {
+        progress.classList.remove('visible');
+    }
+}
+
+// Generate AI tags for a specific product (called from product page button)
+async function generateAITagsForProduct(productId) {
+    const btn = document.getElementById('aiGenTagsBtn');
+    const statusDiv = document.getElementById('aiTagsStatus');
+
+    if (!btn || !statusDiv) return;
+
+    // Set loading state
+    btn.classList.add('loading');
+    btn.disabled = true;
+    statusDiv.innerHTML = '<span style="color: #0097a7;">🔄 Analyzing product images with AI...</span>';
+
+    try {
+        const response = await fetch('/api/ai/generate-tags', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ product_id: productId })
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            statusDiv.innerHTML = `<span style="color: #c62828;">❌ ${data.error}</span>`;
+        } else if (data.tags && data.tags.length > 0) {
+            statusDiv.innerHTML = `<span style="color: #0097a7;">✅ Generated ${data.tags.length} new tags!</span>`;
+
+            // Build the new AI tags and append them directly to the page without reloading
+            const newAITags = data.tags.map(tagValue => ({
+                field_name: 'style_tag',
+                field_value: tagValue
+            }));
+
+            // Add new tags to the global array
+            window.currentAIGeneratedTags = [...(window.currentAIGeneratedTags || []), ...newAITags];
+
+            // Render the new tags directly into the style tags list
+            const styleTagsList = document.getElementById('styleTagsList');
+            if (styleTagsList) {
+                const newTagsHtml = renderAIGeneratedTagsInline(newAITags);
+                styleTagsList.insertAdjacentHTML('beforeend', newTagsHtml);
+            }
+        } else if (data.filtered_duplicates > 0) {
+            // AI generated tags but all were duplicates
+            statusDiv.innerHTML = `<span style="color: #0097a7;">ℹ️ AI found ${data.original_count} tags, but all matched existing tags</span>`;
+        } else if (data.original_count === 0) {
+            // AI couldn't generate any tags
+            statusDiv.innerHTML = `<span style="color: #ff9800;">⚠️ AI couldn't identify style tags for this image</span>`;
+        } else {
+            statusDiv.innerHTML = `<span style="color: #ff9800;">⚠️ No new tags generated</span>`;
+        }
+    } catch (error) {
+        console.error('Error generating AI tags:', error);
+        statusDiv.innerHTML = `<span style="color: #c62828;">❌ Error: ${error.message}</span>`;
+    } finally {
+    // Reset button state
+        btn.classList.remove('loading');
+        btn.disabled = false;
+    }
+}
+
+// Reset product metadata to original scraped state
+async function resetProductMetadata(productId) {
+    if (!confirm('This will remove all curated tags, AI-generated tags, and manual changes for this product. The product will be restored to its original scraped state. Continue?')) {
+        return;
+    }
+
+    const statusDiv = document.getElementById('aiTagsStatus');
+    if (statusDiv) {
+        statusDiv.innerHTML = '<span style="color: #ef5350;">🔄 Resetting to original state...</span>';
+    }
+
+    try {
+        const response = await fetch('/api/reset-metadata/' + productId, {
+            method: 'DELETE'
+        });
+
+        const data = await response.json();
+
+        if (data.error) {
+            if (statusDiv) {
+                statusDiv.innerHTML = '<span style="color: #c62828;">❌ ' + data.error + '</span>';
+            }
+        } else {
+            if (statusDiv) {
+                statusDiv.innerHTML = '<span style="color: #4caf50;">✅ Reset complete! Removed ' + (data.curated_deleted || 0) + ' curated and ' + (data.ai_deleted || 0) + ' AI tags</span>';
+            }
+            // Refresh the product display
+            await displayProduct(currentIndex, { refresh: true });
+        }
+    } catch (error) {
+        console.error('Error resetting metadata:', error);
+        if (statusDiv) {
+            statusDiv.innerHTML = '<span style="color: #c62828;">❌ Error: ' + error.message + '</span>';
+        }
+    }
+}
+
+function handleChatKeypress(event) {
+    if (event.key === 'Enter') {
+        sendChatMessage();
+    }
+}
+
+async function sendChatMessage() {
+    const input = document.getElementById('chatInput');
+    const message = input.value.trim();
+
+    if (!message) return;
+
+    input.value = '';
+
+    const messagesContainer = document.getElementById('chatMessages');
+
+    // Add user message to UI
+    messagesContainer.innerHTML += `
+        <div class="ai-chat-message user">
+            <div class="role">You</div>
+            <div>${escapeHtml(message)}</div>
+        </div>
+    `;
+
+    // Add to history
+    chatHistory.push({ role: 'user', content: message });
+
+    // Add loading indicator
+    messagesContainer.innerHTML += `
+        <div class="ai-chat-message assistant" id="chatLoading">
+            <div class="role">Assistant</div>
+            <div><em>Thinking...</em></div>
+        </div>
+    `;
+
+    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+
+    try {
+        const response = await fetch('/api/ai/chat', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ messages: chatHistory })
+        });
+
+        const data = await response.json();
+
+        // Remove loading indicator
+        document.getElementById('chatLoading')?.remove();
+
+        if (data.error) {
+            messagesContainer.innerHTML += `
+                <div class="ai-chat-message assistant">
+                    <div class="role">Assistant</div>
+                    <div style="color: #c62828;">Error: ${data.error}</div>
+                </div>
+            `;
+        } else {
+            const assistantMessage = data.response || 'No response';
+            chatHistory.push({ role: 'assistant', content: assistantMessage });
+
+            messagesContainer.innerHTML += `
+                <div class="ai-chat-message assistant">
+                    <div class="role">Assistant</div>
+                    <div>${formatChatResponse(assistantMessage)}</div>
+                </div>
+            `;
+        }
+    } catch (error) {
+        document.getElementById('chatLoading')?.remove();
+        messagesContainer.innerHTML += `
+            <div class="ai-chat-message assistant">
+                <div class="role">Assistant</div>
+                <div style="color: #c62828;">Error: ${error.message}</div>
+            </div>
+        `;
+    }
+
+    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+function formatChatResponse(text) {
+    // Basic markdown-like formatting
+    return text
+        .replace(/\n/g, '<br>')
+        .replace(/\*\*(.+?)\*\*/g, '<strong>$1</strong>')
+        .replace(/\*(.+?)\*/g, '<em>$1</em>');
+}
+
+// ============================================
+// DASHBOARD FUNCTIONALITY
+// ============================================
+
+// Plotly is only needed for the dashboard charts, so it's fetched the first
+// time the dashboard opens rather than delaying every page load
+const PLOTLY_URL = 'https://cdn.plot.ly/plotly-2.27.0.min.js';
+let plotlyPromise = null;
+
+function loadPlotly() {
+    if (!plotlyPromise) {
+        plotlyPromise = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = PLOTLY_URL;
+            script.onload = resolve;
+            script.onerror = () => {
+                plotlyPromise = null;  // Allow a retry on the next visit
+                reject(new Error('Failed to load Plotly'));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return plotlyPromise;
+}
+
+async function loadDashboard() {
+    const dashboardContent = document.getElementById('dashboardContent');
+
+    if (!useSupabase) {
+        dashboardContent.innerHTML = `
+            <div class="no-data">
+                <h2>Dashboard requires Supabase</h2>
+                <p>Run the viewer with <code>--supabase</code> flag to enable dashboard features.</p>
+            </div>
+        `;
+        return;
+    }
+
+    dashboardContent.innerHTML = '<div class="no-data"><h2>Loading dashboard...</h2></div>';
+
+    try {
+        const [response] = await Promise.all([fetch('/api/dashboard/stats'), loadPlotly()]);
+        const stats = await response.json();
+
+        if (stats.error) {
+            dashboardContent.innerHTML = `
+                <div class="no-data">
+                    <h2>Error loading dashboard</h2>
+                    <p>${stats.error}</p>
+                </div>
+            `;
+            return;
+        }
+
+        renderDashboard(stats);
+    } catch (error) {
+        console.error('Error loading dashboard:', error);
+        dashboardContent.innerHTML = `
+            <div class="no-data">
+                <h2>Error loading dashboard</h2>
+                <p>${error.message}</p>
+            </div>
+        `;
+    }
+}
+
+function renderDashboard(stats) {
+    const overview = stats.overview;
+    const byCategory = stats.by_category;
+    const byCurator = stats.by_curator;
+    const recentActivity = stats.recent_activity;
+
+    // Build scraper section
+    const scraperHtml = `
+        <div class="scraper-section">
+            <h3>🔍 Want to Scrape?</h3>
+            <p style="color: #666; margin-bottom: 15px;">Scrape new products from Zara. Already-scraped products will be skipped automatically.</p>
+
+            <div class="scraper-controls">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
+                    <label style="margin: 0;">Categories:</label>
+                    <div style="display: flex; gap: 8px;">
+                        <button type="button" onclick="selectAllCategories()" style="padding: 4px 8px; font-size: 11px; cursor: pointer; background: #4CAF50; color: white; border: none; border-radius: 4px;">Select All</button>
+                        <button type="button" onclick="deselectAllCategories()" style="padding: 4px 8px; font-size: 11px; cursor: pointer; background: #f44336; color: white; border: none; border-radius: 4px;">Deselect All</button>
+                    </div>
+                </div>
+                <select id="scraperCategories" multiple style="height: 150px;">
+                    <optgroup label="Clothing">
+                        <option value="tshirts" selected>T-Shirts</option>
+                        <option value="shirts" selected>Shirts</option>
+                        <option value="trousers" selected>Trousers</option>
+                        <option value="jeans" selected>Jeans</option>
+                        <option value="shorts" selected>Shorts</option>
+                        <option value="jackets" selected>Jackets</option>
+                        <option value="blazers" selected>Blazers</option>
+                        <option value="suits" selected>Suits</option>
+                    </optgroup>
+                    <optgroup label="Footwear">
+                        <option value="shoes" selected>Shoes</option>
+                    </optgroup>
+                    <optgroup label="Discovery">
+                        <option value="new-in" selected>New In</option>
+                    </optgroup>
+                </select>
+
+                <div style="margin-top: 15px; padding: 12px; background: #f8f9fa; border-radius: 8px; border: 1px solid #e0e0e0;">
+                    <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 10px;">
+                        <label style="display: flex; align-items: center; gap: 8px; cursor: pointer; margin: 0; font-weight: 500;">
+                            <input type="checkbox" id="scrapeAllProducts" onchange="toggleAllProducts()" style="width: 18px; height: 18px; cursor: pointer;">
+                            <span>Scrape ALL products per category</span>
+                        </label>
+                    </div>
+                    <div id="productCountContainer" style="display: flex; align-items: center; gap: 10px;">
+                        <label style="margin: 0; color: #666;">Products per category:</label>
+                        <input type="number" id="scraperProductCount" value="2" min="1" max="100" style="width: 70px; padding: 6px; border: 1px solid #ccc; border-radius: 4px;">
+                    </div>
+                    <p id="allProductsNote" style="display: none; margin: 8px 0 0 0; font-size: 12px; color: #4CAF50;">
+                        ✓ Will scrape all available products (this may take a while)
+                    </p>
+                </div>
+            </div>
+
+            <button class="go-btn" id="scraperGoBtn" onclick="startScraper()">🚀 GO</button>
+
+            <div class="progress-container" id="scraperProgress">
+                <div class="progress-status" id="progressStatus">Starting scraper...</div>
+                <div class="progress-bar-wrapper">
+                    <div class="progress-bar" id="progressBar"></div>
+                </div>
+                <div class="progress-text" id="progressText">0 products processed</div>
+                <div class="progress-details" id="progressDetails"></div>
+
+                <button class="log-toggle" id="logToggle" onclick="toggleLogViewer()">📋 Show Logs</button>
+                <div class="log-viewer" id="logViewer"></div>
+            </div>
+        </div>
+    `;
+
+    // Build stat cards
+    const statCardsHtml = `
+        <div class="dashboard-grid">
+            <div class="stat-card">
+                <div class="stat-value">${overview.total_products}</div>
+                <div class="stat-label">Total Products</div>
+            </div>
+            <div class="stat-card success">
+                <div class="stat-value">${overview.curated_products}</div>
+                <div class="stat-label">Curated Complete</div>
+            </div>
+            <div class="stat-card warning">
+                <div class="stat-value">${overview.pending_products}</div>
+                <div class="stat-label">Pending Curation</div>
+            </div>
+            <div class="stat-card info">
+                <div class="stat-value">${overview.percent_complete}%</div>
+                <div class="stat-label">Progress</div>
+            </div>
+        </div>
+
+        <div class="dashboard-grid">
+            <div class="stat-card">
+                <div class="stat-value">${overview.total_curated_tags}</div>
+                <div class="stat-label">Tags Added by Curators</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">${overview.total_rejected_tags}</div>
+                <div class="stat-label">Inferred Tags Rejected</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">${Object.keys(byCategory).length}</div>
+                <div class="stat-label">Categories</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-value">${Object.keys(byCurator).length}</div>
+                <div class="stat-label">Active Curators</div>
+            </div>
+        </div>
+    `;
+
+    // Build recent activity
+    let activityHtml = '';
+    if (recentActivity.length > 0) {
+        const activityItems = recentActivity.map(item => {
+            const colorInfo = curatorColors[item.curator] || { bg: '#999' };
+            const date = new Date(item.created_at).toLocaleDateString();
+            return `
+                <div class="activity-item">
+                    <span class="activity-product">${item.product_id}</span>
+                    <span class="activity-curator" style="background: ${colorInfo.bg};">${item.curator}</span>
+                    <span class="activity-time">${date}</span>
+                </div>
+            `;
+        }).join('');
+
+        activityHtml = `
+            <div class="activity-list">
+                <h3 class="chart-title">Recent Curation Activity</h3>
+                ${activityItems}
+            </div>
+        `;
+    }
+
+    // Render HTML
+    document.getElementById('dashboardContent').innerHTML = `
+        ${scraperHtml}
+
+        ${statCardsHtml}
+
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+            <div class="chart-container">
+                <h3 class="chart-title">Curation Progress by Category</h3>
+                <div id="categoryChart"></div>
+            </div>
+            <div class="chart-container">
+                <h3 class="chart-title">Curator Activity</h3>
+                <div id="curatorChart"></div>
+            </div>
+        </div>
+
+        <div class="chart-container">
+            <h3 class="chart-title">Overall Progress</h3>
+            <div id="progressChart"></div>
+        </div>
+
+        ${activityHtml}
+    `;
+
+    // Render Plotly charts
+    renderCategoryChart(byCategory);
+    renderCuratorChart(byCurator);
+    renderProgressChart(overview);
+
+    // Check if scraper is already running
+    checkScraperStatus();
+}
+
+// ============================================
+// SCRAPER FUNCTIONALITY
+// ============================================
+
+let scraperPollingInterval = null;
+
+// Select all categories
+function selectAllCategories() {
+    const select = document.getElementById('scraperCategories');
+    for (let option of select.options) {
+        option.selected = true;
+    }
+}
+
+// Deselect all categories
+function deselectAllCategories() {
+    const select = document.getElementById('scraperCategories');
+    for (let option of select.options) {
+        option.selected = false;
+    }
+}
+
+// Toggle "all products" mode
+function toggleAllProducts() {
+    const checkbox = document.getElementById('scrapeAllProducts');
+    const countContainer = document.getElementById('productCountContainer');
+    const allNote = document.getElementById('allProductsNote');
+    const countInput = document.getElementById('scraperProductCount');
+
+    if (checkbox.checked) {
+        countContainer.style.opacity = '0.5';
+        countInput.disabled = true;
+        allNote.style.display = 'block';
+    } else {
+        countContainer.style.opacity = '1';
+        countInput.disabled = false;
+        allNote.style.display = 'none';
+    }
+}
+
+async function startScraper() {
+    const categoriesSelect = document.getElementById('scraperCategories');
+    const productCountInput = document.getElementById('scraperProductCount');
+    const scrapeAllCheckbox = document.getElementById('scrapeAllProducts');
+    const goBtn = document.getElementById('scraperGoBtn');
+
+    // Get selected categories
+    const selectedCategories = Array.from(categoriesSelect.selectedOptions).map(opt => opt.value);
+
+    // If "scrape all" is checked, use a high number (9999), otherwise use the input value
+    const productsPerCategory = scrapeAllCheckbox.checked ? 9999 : (parseInt(productCountInput.value) || 2);
+
+    if (selectedCategories.length === 0) {
+        alert('Please select at least one category');
+        return;
+    }
+
+    // Disable button
+    goBtn.disabled = true;
+    goBtn.textContent = '⏳ Starting...';
+
+    try {
+        const response = await fetch('/api/scraper/start', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                categories: selectedCategories,
+                products_per_category: productsPerCategory
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            // Show progress container
+            document.getElementById('scraperProgress').classList.add('visible');
+            goBtn.textContent = '🔄 Scraping...';
+
+            // Start polling for status
+            startScraperPolling();
+        } else {
+            alert('Failed to start scraper: ' + result.error);
+            goBtn.disabled = false;
+            goBtn.textContent = '🚀 GO';
+        }
+    } catch (error) {
+        console.error('Error starting scraper:', error);
+        alert('Error starting scraper');
+        goBtn.disabled = false;
+        goBtn.textContent = '🚀 GO';
+    }
+}
+
+function startScraperPolling() {
+    // Clear any existing interval
+    if (scraperPollingInterval) {
+        clearInterval(scraperPollingInterval);
+    }
+
+    // Poll every second
+    scraperPollingInterval = setInterval(checkScraperStatus, 1000);
+}
+
+async function checkScraperStatus() {
+    try {
+        const response = await fetch('/api/scraper/status');
+        const status = await response.json();
+
+        const progressContainer = document.getElementById('scraperProgress');
+        const progressBar = document.getElementById('progressBar');
+        const progressStatus = document.getElementById('progressStatus');
+        const progressText = document.getElementById('progressText');
+        const progressDetails = document.getElementById('progressDetails');
+        const goBtn = document.getElementById('scraperGoBtn');
+        const logViewer = document.getElementById('logViewer');
+
+        // Don't update if elements don't exist (not on dashboard tab)
+        if (!progressContainer) return;
+
+        // Update log viewer
+        if (logViewer && status.logs && status.logs.length > 0) {
+            logViewer.innerHTML = status.logs.map(line => {
+                let lineClass = 'log-line';
+                if (line.startsWith('$')) lineClass += ' command';
+                else if (line.includes('❌') || line.includes('Error') || line.includes('error')) lineClass += ' error';
+                else if (line.includes('✅') || line.includes('✓')) lineClass += ' success';
+                else if (line.includes('⏭️') || line.includes('Skipping')) lineClass += ' warning';
+                else if (line.includes('Processing') || line.includes('Extracting')) lineClass += ' info';
+                return `<div class="${lineClass}">${line}</div>`;
+            }).join('');
+            // Auto-scroll to bottom
+            logViewer.scrollTop = logViewer.scrollHeight;
+        }
+
+        if (status.running) {
+            progressContainer.classList.add('visible');
+            goBtn.disabled = true;
+            goBtn.textContent = '🔄 Scraping...';
+
+            // Update progress bar
+            const total = status.total || 1;
+            const progress = status.progress || 0;
+            const percent = Math.min((progress / total) * 100, 100);
+            progressBar.style.width = percent + '%';
+
+            // Update status text
+            progressStatus.textContent = `Category: ${status.current_category || 'Starting...'}`;
+            progressText.textContent = `${status.products_scraped} scraped, ${status.products_skipped} skipped`;
+            if (status.current_product) {
+                progressDetails.textContent = `Current: ${status.current_product}`;
+            }
+        } else if (status.completed && !status.refresh_handled) {
+            // Scraping completed - only refresh once
+            clearInterval(scraperPollingInterval);
+            scraperPollingInterval = null;
+
+            progressBar.style.width = '100%';
+            progressStatus.textContent = '✅ Scraping Complete!';
+            progressText.textContent = `${status.products_scraped} new products scraped, ${status.products_skipped} skipped`;
+            progressDetails.textContent = 'Refreshing dashboard...';
+
+            goBtn.disabled = false;
+            goBtn.textContent = '🚀 GO';
+
+            // Mark refresh as handled to prevent loops
+            fetch('/api/scraper/reset', { method: 'POST' });
+
+            // Auto-refresh after 2 seconds
+            setTimeout(() => {
+                // Reload products
+                loadProducts();
+                // Reload dashboard stats only (not full reload to avoid loop)
+                refreshDashboardStats();
+                progressDetails.textContent = 'Dashboard updated!';
+            }, 2000);
+        } else if (status.completed && status.refresh_handled) {
+            // Already handled, just show completed state
+            progressContainer.classList.add('visible');
+            progressBar.style.width = '100%';
+            progressStatus.textContent = '✅ Scraping Complete!';
+            progressText.textContent = `${status.products_scraped} new products scraped, ${status.products_skipped} skipped`;
+            progressDetails.textContent = 'Dashboard updated!';
+            goBtn.disabled = false;
+            goBtn.textContent = '🚀 GO';
+        } else if (status.error) {
+            // Error occurred
+            clearInterval(scraperPollingInterval);
+            scraperPollingInterval = null;
+
+            progressStatus.textContent = '❌ Error';
+            progressText.textContent = status.error;
+            progressDetails.textContent = 'Check logs for details';
+
+            // Auto-show logs on error
+            if (logViewer) {
+                logViewer.classList.add('visible');
+                const logToggle = document.getElementById('logToggle');
+                if (logToggle) logToggle.textContent = '📋 Hide Logs';
+            }
+
+            goBtn.disabled = false;
+            goBtn.textContent = '🚀 GO';
+        } else {
+            // Not running, hide progress
+            progressContainer.classList.remove('visible');
+            goBtn.disabled = false;
+            goBtn.textContent = '🚀 GO';
+        }
+    } catch (error) {
+        console.error('Error checking scraper status:', error);
+    }
+}
+
+function toggleLogViewer() {
+    const logViewer = document.getElementById('logViewer');
+    const logToggle = document.getElementById('logToggle');
+
+    if (logViewer.classList.contains('visible')) {
+        logViewer.classList.remove('visible');
+        logToggle.textContent = '📋 Show Logs';
+    } else {
+        logViewer.classList.add('visible');
+        logToggle.textContent = '📋 Hide Logs';
+    }
+}
+
+async function refreshDashboardStats() {
+    // Refresh only the statistics without re-rendering the scraper section
+    // This prevents the refresh loop issue
+    try {
+        const [response] = await Promise.all([fetch('/api/dashboard/stats'), loadPlotly()]);
+        const stats = await response.json();
+
+        if (stats.error) {
+            console.error('Error refreshing stats:', stats.error);
+            return;
+        }
+
+        // Just update the stat card values
+        const overview = stats.overview;
+
+        // Find and update stat cards by their labels
+        const statCards = document.querySelectorAll('.stat-card');
+        statCards.forEach(card => {
+            const label = card.querySelector('.stat-label');
+            const value = card.querySelector('.stat-value');
+            if (!label || !value) return;
+
+            const labelText = label.textContent.toLowerCase();
+            if (labelText.includes('total products')) {
+                value.textContent = overview.total_products;
+            } else if (labelText.includes('curated complete')) {
+                value.textContent = overview.curated_products;
+            } else if (labelText.includes('pending')) {
+                value.textContent = overview.pending_products;
+            } else if (labelText.includes('progress')) {
+                value.textContent = overview.percent_complete + '%';
+            } else if (labelText.includes('tags added')) {
+                value.textContent = overview.total_curated_tags;
+            } else if (labelText.includes('tags rejected')) {
+                value.textContent = overview.total_rejected_tags;
+            }
+        });
+
+        // Update charts
+        renderCategoryChart(stats.by_category);
+        renderCuratorChart(stats.by_curator);
+        renderProgressChart(overview);
+
+        console.log('Dashboard stats refreshed');
+    } catch (error) {
+        console.error('Error refreshing dashboard stats:', error);
+    }
+}
+
+function renderCategoryChart(byCategory) {
+    const categories = Object.keys(byCategory);
+
+    // Build stacked bars by curator instead of generic "Curated"
+    const allCurators = ['Reed', 'Gigi', 'Kiki'];
+    const curatorTraces = [];
+
+    // Create a trace for each curator
+    allCurators.forEach(curator => {
+        const colorInfo = curatorColors[curator];
+        const values = categories.map(cat => {
+            const byCurator = byCategory[cat].by_curator || {};
+            return byCurator[curator] || 0;
+        });
+
+        // Only add trace if this curator has any data
+        if (values.some(v => v > 0)) {
+            curatorTraces.push({
+                x: categories,
+                y: values,
+                name: curator,
+                type: 'bar',
+                marker: { color: colorInfo ? colorInfo.bg : '#999' }
+            });
+        }
+    });
+
+    // Add pending trace
+    const pending = categories.map(c => byCategory[c].pending);
+    curatorTraces.push({
+        x: categories,
+        y: pending,
+        name: 'Pending',
+        type: 'bar',
+        marker: { color: '#ff9800' }
+    });
+
+    const layout = {
+        barmode: 'stack',
+        margin: { t: 20, r: 20, b: 60, l: 40 },
+        legend: { orientation: 'h', y: -0.2 },
+        xaxis: { tickangle: -45 }
+    };
+
+    Plotly.newPlot('categoryChart', curatorTraces, layout, { responsive: true });
+}
+
+function renderCuratorChart(byCurator) {
+    const curators = Object.keys(byCurator);
+
+    if (curators.length === 0) {
+        document.getElementById('curatorChart').innerHTML = '<p style="color:#999;text-align:center;padding:40px;">No curator activity yet</p>';
+        return;
+    }
+
+    // Get curator colors to match the rest of the UI
+    const curatorBarColors = curators.map(c => {
+        const colorInfo = curatorColors[c];
+        return colorInfo ? colorInfo.bg : '#999';
+    });
+
+    const data = [
+        {
+            x: curators,
+            y: curators.map(c => byCurator[c].completed),
+            name: 'Products Completed',
+            type: 'bar',
+            marker: { color: curatorBarColors }
+        },
+        {
+            x: curators,
+            y: curators.map(c => byCurator[c].tags_added),
+            name: 'Tags Added',
+            type: 'bar',
+            marker: { color: curatorBarColors.map(c => c + '99') }  // Slightly transparent
+        },
+        {
+            x: curators,
+            y: curators.map(c => byCurator[c].tags_rejected),
+            name: 'Tags Rejected',
+            type: 'bar',
+            marker: { color: curatorBarColors.map(c => c + '66') }  // More transparent
+        }
+    ];
+
+    const layout = {
+        barmode: 'group',
+        margin: { t: 20, r: 20, b: 40, l: 40 },
+        legend: { orientation: 'h', y: -0.15 }
+    };
+
+    Plotly.newPlot('curatorChart', data, layout, { responsive: true });
+}
+
+function renderProgressChart(overview) {
+    // Build values, labels, and colors arrays based on curated_by_curator
+    const values = [];
+    const labels = [];
+    const colors = [];
+
+    // Add curator-specific slices if curated_by_curator data is available
+    if (overview.curated_by_curator) {
+        const allCurators = ['Reed', 'Gigi', 'Kiki'];
+        allCurators.forEach(curator => {
+            const count = overview.curated_by_curator[curator] || 0;
+            if (count > 0) {
+                values.push(count);
+                labels.push(`${curator} Curated`);
+                const colorInfo = curatorColors[curator];
+                colors.push(colorInfo ? colorInfo.bg : '#999');
+            }
+        });
+    } else if (overview.curated_products > 0) {
+        // Fallback if no curator breakdown available
+        values.push(overview.curated_products);
+        labels.push('Curated');
+        colors.push('#4CAF50');
+    }
+
+    // Add pending products
+    if (overview.pending_products > 0) {
+        values.push(overview.pending_products);
+        labels.push('Pending');
+        colors.push('#ff9800');
+    }
+
+    const data = [{
+        values: values,
+        labels: labels,
+        type: 'pie',
+        hole: 0.6,
+        marker: {
+            colors: colors
+        },
+        textinfo: 'label+percent',
+        textposition: 'outside'
+    }];
+
+    const layout = {
+        margin: { t: 20, r: 20, b: 20, l: 20 },
+        showlegend: false,
+        annotations: [{
+            text: `${overview.percent_complete}%`,
+            showarrow: false,
+            font: { size: 32, weight: 'bold' }
+        }]
+    };
+
+    Plotly.newPlot('progressChart', data, layout, { responsive: true });
+}
+
+// ============================================
+// MARK AS COMPLETE FUNCTIONALITY
+// ============================================
+
+async function markProductComplete() {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first.');
+        return;
+    }
+
+    const product = products[currentIndex];
+    const notes = prompt('Optional notes about this curation:', '');
+
+    if (notes === null) return; // User cancelled
+
+    try {
+        const response = await fetch('/api/curation_status', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id,
+                curator: currentCurator,
+                notes: notes || null
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            console.log(`✓ Marked product ${product.product_id} as complete`);
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            alert('Failed to mark as complete: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error marking complete:', error);
+        alert('Error marking product as complete');
+    }
+}
+
+async function unmarkProductComplete() {
+    if (!curateMode || !currentCurator) {
+        alert('Please enter curate mode first.');
+        return;
+    }
+
+    const product = products[currentIndex];
+
+    if (!confirm('Remove completion status from this product?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/curation_status', {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                product_id: product.product_id
+            })
+        });
+
+        const result = await response.json();
+        if (result.success) {
+            console.log(`✓ Unmarked product ${product.product_id}`);
+            await displayProduct(currentIndex, { refresh: true });
+            showCurateInputs();
+        } else {
+            alert('Failed to unmark: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error unmarking:', error);
+    alert('Error removing completion status');
+    }
+}
+
+// ============================================
+// VOCABULARY MANAGEMENT
+// ============================================
+
+async function loadCustomVocabulary() {
+    try {
+        const response = await fetch('/api/vocabulary');
+        const result = await response.json();
+
+        if (result.success) {
+            displayCustomVocabulary(result.vocabulary);
+            updateCategoryDropdown(result.vocabulary);
+        } else {
+            document.getElementById('customVocabList').innerHTML = '<em style="color: #666;">No custom vocabulary yet</em>';
+        }
+    } catch (error) {
+        console.error('Error loading vocabulary:', error);
+        document.getElementById('customVocabList').innerHTML = '<em style="color: #ff6b6b;">Error loading vocabulary</em>';
+    }
+}
+
+function displayCustomVocabulary(vocabulary) {
+    const container = document.getElementById('customVocabList');
+
+    if (!vocabulary || Object.keys(vocabulary).length === 0) {
+        container.innerHTML = '<em style="color: #666;">No custom vocabulary yet. Add tags above to extend the AI vocabulary.</em>';
+        return;
+    }
+
+    let html = '<div style="display: flex; flex-wrap: wrap; gap: 15px;">';
+
+    for (const [category, tags] of Object.entries(vocabulary)) {
+        if (tags && tags.length > 0) {
+            html += `
+                <div style="background: rgba(100, 181, 246, 0.1); padding: 10px 15px; border-radius: 8px; border-left: 3px solid #64b5f6;">
+                    <strong style="color: #64b5f6; text-transform: capitalize;">${category.replace('_', ' ')}:</strong>
+                    <div style="margin-top: 8px; display: flex; flex-wrap: wrap; gap: 6px;">
+                        ${tags.map(tag => `
+                            <span style="background: rgba(0,212,170,0.2); color: #00d4aa; padding: 3px 8px; border-radius: 4px; font-size: 12px; display: inline-flex; align-items: center; gap: 5px;">
+                                ${tag}
+                                <span onclick="deleteVocabTag('${category}', '${tag}')" style="cursor: pointer; opacity: 0.7; font-size: 14px;" title="Remove tag">×</span>
+                            </span>
+                        `).join('')}
+                    </div>
+                </div>
+            `;
+        }
+    }
+
+    html += '</div>';
+    container.innerHTML = html;
+}
+
+function updateCategoryDropdown(vocabulary) {
+    const dropdown = document.getElementById('vocabCategory');
+    if (!dropdown) return;
+
+    // Add custom categories to dropdown
+    if (vocabulary) {
+        for (const category of Object.keys(vocabulary)) {
+            // Check if category already exists in dropdown
+            const exists = Array.from(dropdown.options).some(opt => opt.value === category);
+            if (!exists) {
+                const option = document.createElement('option');
+                option.value = category;
+                // Capitalize first letter of each word
+                option.textContent = category.replace(/_/g, ' ').split(' ').map(w => w.charAt(0).toUpperCase() + w.slice(1)).join(' ');
+                dropdown.appendChild(option);
+            }
+        }
+    }
+}
+
+async function addVocabTag() {
+    const category = document.getElementById('vocabCategory').value;
+    const tag = document.getElementById('vocabNewTag').value.trim().toLowerCase();
+
+    if (!tag) {
+        alert('Please enter a tag');
+        return;
+    }
+
+    if (!/^[a-z][a-z0-9-]*$/.test(tag)) {
+        alert('Tags must start with a letter and contain only lowercase letters, numbers, and hyphens');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/vocabulary/tag', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ category, tag })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            document.getElementById('vocabNewTag').value = '';
+            loadCustomVocabulary();
+            alert(`Tag "${tag}" added to ${category}!`);
+        } else {
+            alert('Error: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error adding tag:', error);
+        alert('Error adding tag');
+    }
+}
+
+async function createVocabCategory() {
+    const categoryName = document.getElementById('newCategoryName').value.trim().toLowerCase().replace(/\s+/g, '_');
+    const tagsInput = document.getElementById('newCategoryTags').value.trim();
+
+    if (!categoryName) {
+        alert('Please enter a category name');
+        return;
+    }
+
+    if (!/^[a-z][a-z0-9_]*$/.test(categoryName)) {
+        alert('Category name must start with a letter and contain only lowercase letters, numbers, and underscores');
+        return;
+    }
+
+    const tags = tagsInput.split(',').map(t => t.trim().toLowerCase()).filter(t => t);
+
+    if (tags.length === 0) {
+        alert('Please enter at least one initial tag');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/vocabulary/category', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ category: categoryName, tags })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            document.getElementById('newCategoryName').value = '';
+            document.getElementById('newCategoryTags').value = '';
+            loadCustomVocabulary();
+            alert(`Category "${categoryName}" created with ${tags.length} tags!`);
+        } else {
+            alert('Error: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error creating category:', error);
+        alert('Error creating category');
+    }
+}
+
+async function deleteVocabTag(category, tag) {
+    if (!confirm(`Remove "${tag}" from ${category}?`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/vocabulary/tag', {
+            method: 'DELETE',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ category, tag })
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            loadCustomVocabulary();
+        } else {
+            alert('Error: ' + result.error);
+        }
+    } catch (error) {
+        console.error('Error deleting tag:', error);
+        alert('Error deleting tag');
+    }
+}
+
+// Load custom vocabulary when page loads
+document.addEventListener('DOMContentLoaded', function() {
+    // Delay loading to ensure other elements are ready
+    setTimeout(loadCustomVocabulary, 1000);
+});
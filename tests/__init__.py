@@ -3,4 +3,5 @@ ReFitd test suite.
 
 Run all tests: python -m pytest tests/ -v
 Run specific test file: python -m pytest tests/test_viewer_rendering.py -v
+Run in parallel (pytest-xdist): python -m pytest tests/ -n auto --dist=loadfile
 """
@@ -4,44 +4,29 @@ Tests for product category classification.
 
 This test suite validates that products are correctly classified into categories
 based on their names. The classification logic mirrors the JavaScript implementation
-in viewer.py.
+in static/viewer.js.
 
 Run tests:
-    python test_category_classification.py
+    python tests/test_category_classification.py
 
-Or with pytest:
-    pytest test_category_classification.py -v
+(which runs pytest across all cores via pytest-xdist), or directly:
+    pytest tests/test_category_classification.py -v
 """
 
 import re
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+
+import pytest
 
 
 # =============================================================================
-# CLASSIFICATION LOGIC (mirrors JavaScript in viewer.py)
+# CLASSIFICATION LOGIC (mirrors JavaScript in static/viewer.js)
 # =============================================================================
 
 
-def has_word(text: str, word: str) -> bool:
-    """
-    Check if a word exists as a complete word (not part of another word).
-    This prevents "pants" from matching in "participants".
-    """
-    # Escape special regex characters
-    escaped_word = re.escape(word)
-    # Match word with optional plural suffix (s or es)
-    pattern = rf"\b{escaped_word}(s|es)?\b"
-    return bool(re.search(pattern, text, re.IGNORECASE))
-
-
-def has_any_word(text: str, keywords: list[str]) -> bool:
-    """Check if any of the keywords match as complete words."""
-    return any(has_word(text, kw) for kw in keywords)
-
-
-@dataclass
-class ClassificationResult:
+class ClassificationResult(NamedTuple):
     """Result of product classification."""
 
     main: str  # Main category (e.g., 'bottoms', 'outerwear')
@@ -49,49 +34,54 @@ class ClassificationResult:
     display_category: str  # Human-readable name (e.g., 'Pants', 'Jackets')
 
 
-def classify_product(
-    name: str, tags_final: Optional[dict] = None
-) -> ClassificationResult:
-    """
-    Classify a product based on its name.
-
-    This mirrors the JavaScript classifyProduct() function in viewer.py.
-    The classification follows a strict priority order to ensure
-    more specific categories are matched before generic ones.
-
-    Args:
-        name: Product name
-        tags_final: Optional tags_final dict from database
-
-    Returns:
-        ClassificationResult with main category, subcategory, and display name
-    """
-    name = name.lower()
-
+# Shared, immutable results returned by classify_product()
+_R_SHORTS = ClassificationResult("bottoms", "shorts", "Shorts")
+_R_JEANS = ClassificationResult("bottoms", "jeans", "Jeans")
+_R_SWEATSUITS = ClassificationResult("bottoms", "sweatsuits", "Sweatsuits")
+_R_PANTS = ClassificationResult("bottoms", "pants", "Pants")
+_R_BOOTS = ClassificationResult("shoes", "boots", "Boots")
+_R_SHOES = ClassificationResult("shoes", "shoes", "Shoes")
+_R_BLAZERS = ClassificationResult("outerwear", "blazers", "Blazers")
+_R_SUITS = ClassificationResult("outerwear", "suits", "Suits")
+_R_COATS = ClassificationResult("outerwear", "coats", "Coats")
+_R_VESTS = ClassificationResult("outerwear", "vests", "Vests")
+_R_OVERSHIRTS = ClassificationResult("outerwear", "overshirts", "Overshirts")
+_R_JACKETS = ClassificationResult("outerwear", "jackets", "Jackets")
+_R_QUARTERZIP = ClassificationResult("tops_mid", "quarterzip", "Quarter Zip")
+_R_SWEATSHIRTS = ClassificationResult("tops_mid", "sweatshirts", "Sweatshirts")
+_R_HOODIES = ClassificationResult("tops_mid", "hoodies", "Hoodies")
+_R_CARDIGANS = ClassificationResult("tops_mid", "cardigans", "Cardigans")
+_R_SWEATERS = ClassificationResult("tops_mid", "sweaters", "Sweaters")
+_R_TSHIRTS = ClassificationResult("tops_base", "tshirts", "T-Shirts")
+_R_TANKS = ClassificationResult("tops_base", "tanks", "Tank Tops")
+_R_POLOS = ClassificationResult("tops_base", "polos", "Polo Shirts")
+_R_SHIRTS = ClassificationResult("tops_base", "shirts", "Shirts")
+_R_OTHER = ClassificationResult("other", None, "Other")
+
+
+# Classification rules in strict priority order: more specific categories are
+# matched before generic ones. Each entry is (keywords, unless, result), where
+# the rule only applies if none of the ``unless`` words appear in the name.
+# Tuples throughout: the tables are built once at import and never mutated.
+_CLASSIFICATION_RULES: tuple[
+    tuple[tuple[str, ...], Optional[tuple[str, ...]], ClassificationResult], ...
+] = (
     # =========================================================================
-    # STEP 1: Check for BOTTOMS (pants, shorts, jeans, trousers)
+    # STEP 1: BOTTOMS (pants, shorts, jeans, trousers)
     # =========================================================================
-
-    # Check for shorts FIRST (before pants)
-    if has_any_word(name, ["short", "bermuda"]):
-        # Make sure it's not "short sleeve" which is a top
-        if not has_any_word(name, ["sleeve", "shirt", "top", "tee", "t-shirt"]):
-            return ClassificationResult("bottoms", "shorts", "Shorts")
-
-    # Check for jeans (before generic pants)
-    if has_any_word(name, ["jean", "denim pant", "denim trouser"]):
-        return ClassificationResult("bottoms", "jeans", "Jeans")
-
-    # Check for sweatsuits/tracksuits
-    if has_any_word(
-        name, ["sweatsuit", "tracksuit", "track pant", "jogger set", "matching set"]
-    ):
-        return ClassificationResult("bottoms", "sweatsuits", "Sweatsuits")
-
-    # Check for pants/trousers
-    if has_any_word(
-        name,
-        [
+    # Shorts FIRST (before pants), but not "short sleeve" which is a top
+    (("short", "bermuda"), ("sleeve", "shirt", "top", "tee", "t-shirt"), _R_SHORTS),
+    # Jeans (before generic pants)
+    (("jean", "denim pant", "denim trouser"), None, _R_JEANS),
+    # Sweatsuits/tracksuits
+    (
+        ("sweatsuit", "tracksuit", "track pant", "jogger set", "matching set"),
+        None,
+        _R_SWEATSUITS,
+    ),
+    # Pants/trousers
+    (
+        (
             "pant",
             "trouser",
             "chino",
@@ -100,24 +90,17 @@ def classify_product(
             "dress pant",
             "suit pant",
             "slack",
-        ],
-    ):
-        return ClassificationResult("bottoms", "pants", "Pants")
-
+        ),
+        None,
+        _R_PANTS,
+    ),
     # =========================================================================
-    # STEP 2: Check for FOOTWEAR (Shoes & Boots)
+    # STEP 2: FOOTWEAR (Shoes & Boots)
     # =========================================================================
-
-    # Check boots first (more specific than shoes)
-    if has_any_word(
-        name, ["boot", "chelsea", "combat boot", "ankle boot", "hiking boot"]
-    ):
-        return ClassificationResult("shoes", "boots", "Boots")
-
-    # Check for shoes
-    if has_any_word(
-        name,
-        [
+    # Boots first (more specific than shoes)
+    (("boot", "chelsea", "combat boot", "ankle boot", "hiking boot"), None, _R_BOOTS),
+    (
+        (
             "shoe",
             "sneaker",
             "loafer",
@@ -127,39 +110,27 @@ def classify_product(
             "moccasin",
             "espadrille",
             "trainer",
-        ],
-    ):
-        return ClassificationResult("shoes", "shoes", "Shoes")
-
+        ),
+        None,
+        _R_SHOES,
+    ),
     # =========================================================================
-    # STEP 3: Check for OUTERWEAR (jackets, coats, blazers, vests)
+    # STEP 3: OUTERWEAR (jackets, coats, blazers, vests)
     # Note: Leather items are classified by their garment type (jacket/coat)
     # =========================================================================
-
     # Blazers (specific outerwear)
-    if has_any_word(name, ["blazer", "sport coat", "sportcoat"]):
-        return ClassificationResult("outerwear", "blazers", "Blazers")
-
+    (("blazer", "sport coat", "sportcoat"), None, _R_BLAZERS),
     # Suits (check before generic jacket)
-    if has_word(name, "suit") and not has_any_word(name, ["sweatsuit", "tracksuit"]):
-        return ClassificationResult("outerwear", "suits", "Suits")
-
+    (("suit",), ("sweatsuit", "tracksuit"), _R_SUITS),
     # Coats (includes puffers, parkas, trenches)
-    if has_any_word(name, ["coat", "parka", "puffer", "trench", "overcoat", "topcoat"]):
-        return ClassificationResult("outerwear", "coats", "Coats")
-
+    (("coat", "parka", "puffer", "trench", "overcoat", "topcoat"), None, _R_COATS),
     # Vests/Gilets
-    if has_any_word(name, ["vest", "gilet", "waistcoat", "bodywarmer"]):
-        return ClassificationResult("outerwear", "vests", "Vests")
-
+    (("vest", "gilet", "waistcoat", "bodywarmer"), None, _R_VESTS),
     # Overshirts / Shackets
-    if has_any_word(name, ["overshirt", "shacket", "shirt jacket"]):
-        return ClassificationResult("outerwear", "overshirts", "Overshirts")
-
+    (("overshirt", "shacket", "shirt jacket"), None, _R_OVERSHIRTS),
     # Jackets (general - check after more specific outerwear)
-    if has_any_word(
-        name,
-        [
+    (
+        (
             "jacket",
             "bomber",
             "windbreaker",
@@ -168,78 +139,158 @@ def classify_product(
             "down jacket",
             "quilted",
             "padded",
-        ],
-    ):
-        return ClassificationResult("outerwear", "jackets", "Jackets")
-
+        ),
+        None,
+        _R_JACKETS,
+    ),
     # =========================================================================
-    # STEP 4: Check for MID LAYER (sweaters, hoodies, sweatshirts, quarter-zip)
+    # STEP 4: MID LAYER (sweaters, hoodies, sweatshirts, quarter-zip)
     # =========================================================================
-
     # Quarter-zip (check before sweaters)
-    if has_any_word(
-        name, ["quarter zip", "quarter-zip", "half zip", "half-zip", "1/4 zip"]
-    ):
-        return ClassificationResult("tops_mid", "quarterzip", "Quarter Zip")
-
+    (
+        ("quarter zip", "quarter-zip", "half zip", "half-zip", "1/4 zip"),
+        None,
+        _R_QUARTERZIP,
+    ),
     # Sweatshirts (check BEFORE checking for "shirt")
-    if has_any_word(
-        name, ["sweatshirt", "crewneck sweat", "crew neck sweat", "fleece"]
-    ):
-        return ClassificationResult("tops_mid", "sweatshirts", "Sweatshirts")
-
+    (
+        ("sweatshirt", "crewneck sweat", "crew neck sweat", "fleece"),
+        None,
+        _R_SWEATSHIRTS,
+    ),
     # Hoodies
-    if has_any_word(name, ["hoodie", "hooded"]):
-        return ClassificationResult("tops_mid", "hoodies", "Hoodies")
-
+    (("hoodie", "hooded"), None, _R_HOODIES),
     # Cardigans (check before generic sweaters)
-    if has_word(name, "cardigan"):
-        return ClassificationResult("tops_mid", "cardigans", "Cardigans")
-
+    (("cardigan",), None, _R_CARDIGANS),
     # Sweaters/Knits
-    if has_any_word(name, ["sweater", "knit", "pullover", "jumper", "knitwear"]):
-        return ClassificationResult("tops_mid", "sweaters", "Sweaters")
-
+    (("sweater", "knit", "pullover", "jumper", "knitwear"), None, _R_SWEATERS),
     # =========================================================================
-    # STEP 5: Check for BASE LAYER (t-shirts, shirts, polos, tanks)
+    # STEP 5: BASE LAYER (t-shirts, shirts, polos, tanks)
     # =========================================================================
-
     # T-shirts (check before generic "shirt")
-    if has_any_word(name, ["t-shirt", "tshirt", "tee"]):
-        return ClassificationResult("tops_base", "tshirts", "T-Shirts")
-
+    (("t-shirt", "tshirt", "tee"), None, _R_TSHIRTS),
     # Tank tops
-    if has_any_word(name, ["tank", "sleeveless top", "muscle tee"]):
-        return ClassificationResult("tops_base", "tanks", "Tank Tops")
-
+    (("tank", "sleeveless top", "muscle tee"), None, _R_TANKS),
     # Polos
-    if has_word(name, "polo"):
-        return ClassificationResult("tops_base", "polos", "Polo Shirts")
-
+    (("polo",), None, _R_POLOS),
     # Shirts (most generic - only if nothing else matched)
-    if has_word(name, "shirt"):
-        return ClassificationResult("tops_base", "shirts", "Shirts")
+    (("shirt",), None, _R_SHIRTS),
+)
+
+
+def _word_pattern(words: Iterable[str]) -> str:
+    """
+    Regex source matching any of ``words`` as a complete word.
+
+    Mirrors hasAnyWord() in static/viewer.js: each word may take an optional plural
+    suffix (s or es), and word boundaries prevent "pants" from matching in
+    "participants". Words are trusted static data and are inserted without
+    re.escape(); test_keywords_are_plain_words checks they stay that way.
+    """
+    return r"\b(?:" + "|".join(words) + r")(?:s|es)?\b"
+
+
+# _CLASSIFICATION_RULES with each keyword list compiled into a single pattern
+_COMPILED_RULES: tuple[
+    tuple[re.Pattern, Optional[re.Pattern], ClassificationResult], ...
+] = tuple(
+    (
+        re.compile(_word_pattern(keywords), re.IGNORECASE),
+        re.compile(_word_pattern(unless), re.IGNORECASE) if unless else None,
+        result,
+    )
+    for keywords, unless, result in _CLASSIFICATION_RULES
+)
+
+# Every token a rule keyword can start with: plural forms for single-word
+# keywords, the first word of multi-word ones ("t-shirt" -> "t"). A name
+# sharing no token with this set cannot match any rule.
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+_KEYWORD_TOKENS = frozenset(
+    token
+    for keywords, _, _ in _CLASSIFICATION_RULES
+    for kw in keywords
+    for token in (
+        (kw, kw + "s", kw + "es")
+        if len(_TOKEN_SPLIT.split(kw)) == 1
+        else (_TOKEN_SPLIT.split(kw)[0],)
+    )
+)
+
+# tags_final categories that map to a result regardless of top_layer_role.
+# "top" and "top_base" are resolved in classify_product() because a "mid"
+# layer role takes precedence over them.
+_CATEGORY_FALLBACK: dict[str, ClassificationResult] = {
+    "bottom": _R_PANTS,
+    "outerwear": _R_JACKETS,
+    "shoes": _R_SHOES,
+    "top_mid": _R_SWEATERS,
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_name(name: str) -> Optional[ClassificationResult]:
+    """
+    Classify a product name against the keyword rules (STEPS 1-5).
+
+    Returns None when no rule matches. Cached per name because catalogs
+    repeat the same product names across colors and categories.
+    """
+    # Match against the lowercased name, as classifyProduct() does; this
+    # differs from case-insensitive matching for characters such as "İ"
+    name = name.lower()
+
+    # Cheap set test first
+    if _KEYWORD_TOKENS.isdisjoint(_TOKEN_SPLIT.split(name)):
+        return None
+
+    for keywords, unless, result in _COMPILED_RULES:
+        if keywords.search(name) and not (unless and unless.search(name)):
+            return result
+
+    return None
+
+
+def classify_product(
+    name: str, tags_final: Optional[dict] = None
+) -> ClassificationResult:
+    """
+    Classify a product based on its name.
+
+    This mirrors the JavaScript classifyProduct() function in static/viewer.js.
+    The classification follows a strict priority order (_CLASSIFICATION_RULES)
+    to ensure more specific categories are matched before generic ones.
+
+    Args:
+        name: Product name
+        tags_final: Optional tags_final dict from database
+
+    Returns:
+        ClassificationResult with main category, subcategory, and display name
+    """
+    result = _classify_name(name)
+    if result is not None:
+        return result
 
     # =========================================================================
     # STEP 6: Fallback - use tags_final if available
     # =========================================================================
-    if tags_final and tags_final.get("category"):
-        cat = tags_final["category"].lower()
-        if cat == "bottom":
-            return ClassificationResult("bottoms", "pants", "Pants")
-        if cat == "outerwear":
-            return ClassificationResult("outerwear", "jackets", "Jackets")
-        if cat == "shoes":
-            return ClassificationResult("shoes", "shoes", "Shoes")
-        if cat == "top_mid" or tags_final.get("top_layer_role") == "mid":
-            return ClassificationResult("tops_mid", "sweaters", "Sweaters")
-        if cat in ("top_base", "top") or tags_final.get("top_layer_role") == "base":
-            return ClassificationResult("tops_base", "tshirts", "T-Shirts")
+    category = tags_final.get("category") if tags_final else None
+    if category:
+        cat = category.lower()
+        result = _CATEGORY_FALLBACK.get(cat)
+        if result is not None:
+            return result
+        role = tags_final.get("top_layer_role")
+        if role == "mid":
+            return _R_SWEATERS
+        if cat in ("top_base", "top") or role == "base":
+            return _R_TSHIRTS
 
     # =========================================================================
     # STEP 7: Last resort - uncategorized
     # =========================================================================
-    return ClassificationResult("other", None, "Other")
+    return _R_OTHER
 
 
 # =============================================================================
@@ -247,12 +298,154 @@ def classify_product(
 # =============================================================================
 
 
+# (product name, expected display category)
+CLASSIFICATION_CASES = [
+    # Bottoms
+    ("Relaxed Fit Trousers", "Pants"),
+    ("Slim Fit Chinos", "Pants"),
+    ("Cargo Pants", "Pants"),
+    ("Dress Pants", "Pants"),
+    ("Suit Pants", "Pants"),
+    ("Joggers", "Pants"),
+    ("Wide Leg Trousers", "Pants"),
+    ("Pleated Pants", "Pants"),
+    ("Linen Trousers", "Pants"),
+    ("Cotton Slacks", "Pants"),
+    ("Slim Fit Jeans", "Jeans"),
+    ("Relaxed Jeans", "Jeans"),
+    ("Skinny Jeans", "Jeans"),
+    ("Straight Leg Jeans", "Jeans"),
+    ("Denim Pants", "Jeans"),  # Should match "denim pant"
+    ("Relaxed Fit Shorts", "Shorts"),
+    ("Bermuda Shorts", "Shorts"),
+    ("Linen Shorts", "Shorts"),
+    ("Swim Shorts", "Shorts"),
+    ("Cargo Shorts", "Shorts"),
+    ("100% Linen Relaxed Fit Shorts", "Shorts"),
+    ("Tracksuit Bottoms", "Sweatsuits"),
+    ("Track Pants", "Sweatsuits"),
+    ("Jogger Set", "Sweatsuits"),
+    ("Matching Set Pants", "Sweatsuits"),
+    # Footwear
+    ("Leather Loafers", "Shoes"),
+    ("Canvas Sneakers", "Shoes"),
+    ("Derby Shoes", "Shoes"),
+    ("Suede Sandals", "Shoes"),
+    ("Leather Moccasins", "Shoes"),
+    ("Canvas Trainers", "Shoes"),
+    ("Espadrilles", "Shoes"),
+    ("Oxford Shoes", "Shoes"),  # "shoes" keyword makes this match
+    ("Chelsea Boots", "Boots"),
+    ("Ankle Boots", "Boots"),
+    ("Combat Boots", "Boots"),
+    ("Hiking Boots", "Boots"),
+    ("Leather Boots", "Boots"),
+    ("Suede Chelsea Boots", "Boots"),
+    # Outerwear
+    ("Bomber Jacket", "Jackets"),
+    ("Windbreaker", "Jackets"),
+    ("Trucker Jacket", "Jackets"),
+    ("Down Jacket", "Jackets"),
+    ("Quilted Jacket", "Jackets"),
+    ("Padded Jacket", "Jackets"),
+    ("80% Down - 20% Feather Water Repellent Jacket", "Jackets"),
+    ("Lightweight Jacket", "Jackets"),
+    ("Wool Coat", "Coats"),
+    ("Trench Coat", "Coats"),
+    ("Parka", "Coats"),
+    ("Puffer Coat", "Coats"),
+    ("Overcoat", "Coats"),
+    ("Topcoat", "Coats"),
+    ("Linen Blazer", "Blazers"),
+    ("100% Linen Suit Blazer", "Blazers"),
+    ("Wool Blazer", "Blazers"),
+    ("Sport Coat", "Blazers"),
+    ("Cotton Blazer", "Blazers"),
+    ("Two Piece Suit", "Suits"),
+    ("Linen Suit", "Suits"),
+    ("Wool Suit", "Suits"),
+    ("Suit Jacket", "Suits"),  # Should be Suits, not Jackets
+    ("Leather Jacket", "Jackets"),  # Leather items are classified by garment type
+    ("Leather Bomber", "Jackets"),
+    ("Biker Jacket", "Jackets"),
+    ("Moto Jacket", "Jackets"),
+    ("Leather Coat", "Coats"),
+    ("Leather Trench Coat", "Coats"),
+    ("Down Vest", "Vests"),
+    ("Quilted Gilet", "Vests"),
+    ("Waistcoat", "Vests"),
+    ("Bodywarmer", "Vests"),
+    ("Cotton Overshirt", "Overshirts"),
+    ("Flannel Overshirt", "Overshirts"),
+    ("Shacket", "Overshirts"),
+    ("Shirt Jacket", "Overshirts"),
+    # Mid Layer
+    ("Wool Sweater", "Sweaters"),
+    ("Cashmere Pullover", "Sweaters"),
+    ("Cotton Knit", "Sweaters"),
+    ("Merino Jumper", "Sweaters"),
+    ("Cable Knit Sweater", "Sweaters"),
+    ("Wool Cardigan", "Cardigans"),
+    ("Cotton Cardigan", "Cardigans"),
+    ("Button Front Cardigan", "Cardigans"),
+    ("Zip Up Hoodie", "Hoodies"),
+    ("Pullover Hoodie", "Hoodies"),
+    ("Cotton Hoodie", "Hoodies"),
+    ("Crewneck Sweatshirt", "Sweatshirts"),
+    ("Cotton Sweatshirt", "Sweatshirts"),
+    ("Fleece Pullover", "Sweatshirts"),
+    ("French Terry Sweatshirt", "Sweatshirts"),
+    ("Contrast Collar Polo Sweatshirt", "Sweatshirts"),  # The original bug case!
+    ("Quarter Zip Pullover", "Quarter Zip"),
+    ("Half Zip Sweater", "Quarter Zip"),
+    ("Quarter-Zip Fleece", "Quarter Zip"),
+    # Base Layer
+    ("Basic T-Shirt", "T-Shirts"),
+    ("Cotton Tee", "T-Shirts"),
+    ("V-Neck T-Shirt", "T-Shirts"),
+    ("Graphic Tshirt", "T-Shirts"),
+    ("Relaxed Fit Tee", "T-Shirts"),
+    ("Oxford Shirt", "Shirts"),
+    ("Linen Shirt", "Shirts"),
+    ("Cotton Shirt", "Shirts"),
+    ("Dress Shirt", "Shirts"),
+    ("Button Down Shirt", "Shirts"),
+    ("Pique Polo", "Polo Shirts"),
+    ("Cotton Polo Shirt", "Polo Shirts"),
+    ("Slim Fit Polo", "Polo Shirts"),
+    ("Cotton Tank Top", "Tank Tops"),
+    ("Muscle Tank", "Tank Tops"),
+    ("Sleeveless Top", "Tank Tops"),
+    # Lowercased first, like the JS: "İ" becomes "i" plus a combining dot
+    ("SHİRT", "Other"),
+]
+
+# Names containing a category keyword that must NOT land in that category
+MISCLASSIFICATION_CASES = [
+    ("Short Sleeve Shirt", "Shorts"),
+    ("Short Sleeve T-Shirt", "Shorts"),
+    ("Short Sleeve Polo", "Shorts"),
+]
+
+
 class TestCategoryClassification:
     """Test suite for category classification."""
 
-    # -------------------------------------------------------------------------
-    # BOTTOMS TESTS
-    # -------------------------------------------------------------------------
+    @pytest.mark.parametrize(("name", "expected"), CLASSIFICATION_CASES)
+    def test_display_category(self, name, expected):
+        """Each product name should map to its expected display category."""
+        result = classify_product(name)
+        assert (
+            result.display_category == expected
+        ), f"'{name}' should be {expected}, got {result.display_category}"
+
+    @pytest.mark.parametrize(("name", "wrong"), MISCLASSIFICATION_CASES)
+    def test_not_misclassified(self, name, wrong):
+        """Short sleeve shirts and the like should not fall into a keyword's category."""
+        result = classify_product(name)
+        assert (
+            result.display_category != wrong
+        ), f"'{name}' should NOT be {wrong}, got {result.display_category}"
 
     def test_pants_basic(self):
         """Basic pants should be classified as Pants."""
@@ -260,288 +453,6 @@ class TestCategoryClassification:
         assert classify_product("Slim Fit Stretch Pants").main == "bottoms"
         assert classify_product("Slim Fit Stretch Pants").sub == "pants"
 
-    def test_pants_variations(self):
-        """Various pant names should all be classified as Pants."""
-        pant_names = [
-            "Relaxed Fit Trousers",
-            "Slim Fit Chinos",
-            "Cargo Pants",
-            "Dress Pants",
-            "Suit Pants",
-            "Joggers",
-            "Wide Leg Trousers",
-            "Pleated Pants",
-            "Linen Trousers",
-            "Cotton Slacks",
-        ]
-        for name in pant_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Pants"
-            ), f"'{name}' should be Pants, got {result.display_category}"
-
-    def test_jeans(self):
-        """Jeans should be classified separately from pants."""
-        jeans_names = [
-            "Slim Fit Jeans",
-            "Relaxed Jeans",
-            "Skinny Jeans",
-            "Straight Leg Jeans",
-            "Denim Pants",  # Should match "denim pant"
-        ]
-        for name in jeans_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Jeans"
-            ), f"'{name}' should be Jeans, got {result.display_category}"
-
-    def test_shorts(self):
-        """Shorts should be classified correctly."""
-        shorts_names = [
-            "Relaxed Fit Shorts",
-            "Bermuda Shorts",
-            "Linen Shorts",
-            "Swim Shorts",
-            "Cargo Shorts",
-            "100% Linen Relaxed Fit Shorts",
-        ]
-        for name in shorts_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Shorts"
-            ), f"'{name}' should be Shorts, got {result.display_category}"
-
-    def test_short_sleeve_not_shorts(self):
-        """Short sleeve shirts should NOT be classified as Shorts."""
-        short_sleeve_names = [
-            "Short Sleeve Shirt",
-            "Short Sleeve T-Shirt",
-            "Short Sleeve Polo",
-        ]
-        for name in short_sleeve_names:
-            result = classify_product(name)
-            assert (
-                result.display_category != "Shorts"
-            ), f"'{name}' should NOT be Shorts, got {result.display_category}"
-
-    def test_sweatsuits(self):
-        """Sweatsuits/tracksuits should be classified correctly."""
-        sweatsuit_names = [
-            "Tracksuit Bottoms",
-            "Track Pants",
-            "Jogger Set",
-            "Matching Set Pants",
-        ]
-        for name in sweatsuit_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Sweatsuits"
-            ), f"'{name}' should be Sweatsuits, got {result.display_category}"
-
-    # -------------------------------------------------------------------------
-    # FOOTWEAR TESTS
-    # -------------------------------------------------------------------------
-
-    def test_shoes(self):
-        """Various shoes should be classified correctly."""
-        shoe_names = [
-            "Leather Loafers",
-            "Canvas Sneakers",
-            "Derby Shoes",
-            "Suede Sandals",
-            "Leather Moccasins",
-            "Canvas Trainers",
-            "Espadrilles",
-            "Oxford Shoes",  # "shoes" keyword makes this match
-        ]
-        for name in shoe_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Shoes"
-            ), f"'{name}' should be Shoes, got {result.display_category}"
-
-    def test_boots(self):
-        """Boots should be classified separately from shoes."""
-        boot_names = [
-            "Chelsea Boots",
-            "Ankle Boots",
-            "Combat Boots",
-            "Hiking Boots",
-            "Leather Boots",
-            "Suede Chelsea Boots",
-        ]
-        for name in boot_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Boots"
-            ), f"'{name}' should be Boots, got {result.display_category}"
-
-    # -------------------------------------------------------------------------
-    # OUTERWEAR TESTS
-    # -------------------------------------------------------------------------
-
-    def test_jackets(self):
-        """Jackets should be classified correctly."""
-        jacket_names = [
-            "Bomber Jacket",
-            "Windbreaker",
-            "Trucker Jacket",
-            "Down Jacket",
-            "Quilted Jacket",
-            "Padded Jacket",
-            "80% Down - 20% Feather Water Repellent Jacket",
-            "Lightweight Jacket",
-        ]
-        for name in jacket_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Jackets"
-            ), f"'{name}' should be Jackets, got {result.display_category}"
-
-    def test_coats(self):
-        """Coats should be classified separately from jackets."""
-        coat_names = [
-            "Wool Coat",
-            "Trench Coat",
-            "Parka",
-            "Puffer Coat",
-            "Overcoat",
-            "Topcoat",
-        ]
-        for name in coat_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Coats"
-            ), f"'{name}' should be Coats, got {result.display_category}"
-
-    def test_blazers(self):
-        """Blazers should be classified correctly."""
-        blazer_names = [
-            "Linen Blazer",
-            "100% Linen Suit Blazer",
-            "Wool Blazer",
-            "Sport Coat",
-            "Cotton Blazer",
-        ]
-        for name in blazer_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Blazers"
-            ), f"'{name}' should be Blazers, got {result.display_category}"
-
-    def test_suits(self):
-        """Suits should be classified correctly."""
-        suit_names = [
-            "Two Piece Suit",
-            "Linen Suit",
-            "Wool Suit",
-            "Suit Jacket",  # Should be Suits, not Jackets
-        ]
-        for name in suit_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Suits"
-            ), f"'{name}' should be Suits, got {result.display_category}"
-
-    def test_leather_items_classified_by_garment_type(self):
-        """Leather items should be classified by their garment type (jacket/coat), not as a separate category."""
-        # Leather jackets should be classified as Jackets
-        leather_jacket_names = [
-            "Leather Jacket",
-            "Leather Bomber",
-            "Biker Jacket",
-            "Moto Jacket",
-        ]
-        for name in leather_jacket_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Jackets"
-            ), f"'{name}' should be Jackets, got {result.display_category}"
-
-        # Leather coats should be classified as Coats
-        leather_coat_names = [
-            "Leather Coat",
-            "Leather Trench Coat",
-        ]
-        for name in leather_coat_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Coats"
-            ), f"'{name}' should be Coats, got {result.display_category}"
-
-    def test_vests(self):
-        """Vests should be classified correctly."""
-        vest_names = [
-            "Down Vest",
-            "Quilted Gilet",
-            "Waistcoat",
-            "Bodywarmer",
-        ]
-        for name in vest_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Vests"
-            ), f"'{name}' should be Vests, got {result.display_category}"
-
-    def test_overshirts(self):
-        """Overshirts should be classified correctly."""
-        overshirt_names = [
-            "Cotton Overshirt",
-            "Flannel Overshirt",
-            "Shacket",
-            "Shirt Jacket",
-        ]
-        for name in overshirt_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Overshirts"
-            ), f"'{name}' should be Overshirts, got {result.display_category}"
-
-    # -------------------------------------------------------------------------
-    # MID LAYER TESTS
-    # -------------------------------------------------------------------------
-
-    def test_sweaters(self):
-        """Sweaters should be classified correctly."""
-        sweater_names = [
-            "Wool Sweater",
-            "Cashmere Pullover",
-            "Cotton Knit",
-            "Merino Jumper",
-            "Cable Knit Sweater",
-        ]
-        for name in sweater_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Sweaters"
-            ), f"'{name}' should be Sweaters, got {result.display_category}"
-
-    def test_cardigans(self):
-        """Cardigans should be classified correctly."""
-        cardigan_names = [
-            "Wool Cardigan",
-            "Cotton Cardigan",
-            "Button Front Cardigan",
-        ]
-        for name in cardigan_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Cardigans"
-            ), f"'{name}' should be Cardigans, got {result.display_category}"
-
-    def test_hoodies(self):
-        """Hoodies should be classified correctly."""
-        hoodie_names = [
-            "Zip Up Hoodie",
-            "Pullover Hoodie",
-            "Cotton Hoodie",
-        ]
-        for name in hoodie_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Hoodies"
-            ), f"'{name}' should be Hoodies, got {result.display_category}"
-
     def test_hooded_sweatshirt_is_sweatshirt(self):
         """A hooded sweatshirt can be either Hoodies or Sweatshirts - we classify as Sweatshirts."""
         # "Hooded Sweatshirt" contains both "hooded" and "sweatshirt"
@@ -553,81 +464,6 @@ class TestCategoryClassification:
             "Sweatshirts",
         ], f"Expected Hoodies or Sweatshirts, got {result.display_category}"
 
-    def test_sweatshirts(self):
-        """Sweatshirts should be classified correctly."""
-        sweatshirt_names = [
-            "Crewneck Sweatshirt",
-            "Cotton Sweatshirt",
-            "Fleece Pullover",
-            "French Terry Sweatshirt",
-            "Contrast Collar Polo Sweatshirt",  # The original bug case!
-        ]
-        for name in sweatshirt_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Sweatshirts"
-            ), f"'{name}' should be Sweatshirts, got {result.display_category}"
-
-    def test_quarter_zip(self):
-        """Quarter zips should be classified correctly."""
-        quarterzip_names = [
-            "Quarter Zip Pullover",
-            "Half Zip Sweater",
-            "Quarter-Zip Fleece",
-        ]
-        for name in quarterzip_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Quarter Zip"
-            ), f"'{name}' should be Quarter Zip, got {result.display_category}"
-
-    # -------------------------------------------------------------------------
-    # BASE LAYER TESTS
-    # -------------------------------------------------------------------------
-
-    def test_tshirts(self):
-        """T-shirts should be classified correctly."""
-        tshirt_names = [
-            "Basic T-Shirt",
-            "Cotton Tee",
-            "V-Neck T-Shirt",
-            "Graphic Tshirt",
-            "Relaxed Fit Tee",
-        ]
-        for name in tshirt_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "T-Shirts"
-            ), f"'{name}' should be T-Shirts, got {result.display_category}"
-
-    def test_shirts(self):
-        """Shirts should be classified correctly."""
-        shirt_names = [
-            "Oxford Shirt",
-            "Linen Shirt",
-            "Cotton Shirt",
-            "Dress Shirt",
-            "Button Down Shirt",
-        ]
-        for name in shirt_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Shirts"
-            ), f"'{name}' should be Shirts, got {result.display_category}"
-
-    def test_polos(self):
-        """Polos should be classified correctly."""
-        polo_names = [
-            "Pique Polo",
-            "Cotton Polo Shirt",
-            "Slim Fit Polo",
-        ]
-        for name in polo_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Polo Shirts"
-            ), f"'{name}' should be Polo Shirts, got {result.display_category}"
-
     def test_polo_sweatshirt_is_sweatshirt(self):
         """A polo sweatshirt should be Sweatshirts, not Polos."""
         # This was one of the original bugs!
@@ -636,19 +472,6 @@ class TestCategoryClassification:
             result.display_category == "Sweatshirts"
         ), f"Expected Sweatshirts, got {result.display_category}"
 
-    def test_tanks(self):
-        """Tank tops should be classified correctly."""
-        tank_names = [
-            "Cotton Tank Top",
-            "Muscle Tank",
-            "Sleeveless Top",
-        ]
-        for name in tank_names:
-            result = classify_product(name)
-            assert (
-                result.display_category == "Tank Tops"
-            ), f"'{name}' should be Tank Tops, got {result.display_category}"
-
     # -------------------------------------------------------------------------
     # EDGE CASES & REGRESSION TESTS
     # -------------------------------------------------------------------------
@@ -719,60 +542,30 @@ class TestCategoryClassification:
         assert result.display_category == "Other"
 
 
+class TestClassificationRules:
+    """Sanity checks on the classification rule table itself."""
+
+    def test_keywords_are_plain_words(self):
+        """Keywords are compiled without re.escape(), so they must not contain regex syntax."""
+        special = set(".^$*+?{}[]\\|()")
+        for keywords, unless, _ in _CLASSIFICATION_RULES:
+            for kw in keywords + (unless or ()):
+                assert not special.intersection(kw), f"{kw!r} contains regex syntax"
+
+    @pytest.mark.parametrize(
+        "keyword",
+        sorted({kw for keywords, _, _ in _CLASSIFICATION_RULES for kw in keywords}),
+    )
+    def test_keyword_passes_token_check(self, keyword):
+        """The token pre-check must never reject a name made of a rule keyword."""
+        assert _classify_name(keyword) is not None
+        assert _classify_name(keyword + "s") is not None
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
 
-def run_tests():
-    """Run all tests and report results."""
-    import traceback
-
-    test_class = TestCategoryClassification()
-    test_methods = [m for m in dir(test_class) if m.startswith("test_")]
-
-    passed = 0
-    failed = 0
-    failures = []
-
-    print("=" * 70)
-    print("CATEGORY CLASSIFICATION TESTS")
-    print("=" * 70)
-    print()
-
-    for method_name in test_methods:
-        method = getattr(test_class, method_name)
-        try:
-            method()
-            print(f"✅ PASS: {method_name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"❌ FAIL: {method_name}")
-            print(f"   Error: {e}")
-            failed += 1
-            failures.append((method_name, str(e), traceback.format_exc()))
-        except Exception as e:
-            print(f"❌ ERROR: {method_name}")
-            print(f"   Error: {e}")
-            failed += 1
-            failures.append((method_name, str(e), traceback.format_exc()))
-
-    print()
-    print("=" * 70)
-    print(f"RESULTS: {passed} passed, {failed} failed")
-    print("=" * 70)
-
-    if failures:
-        print("\nFAILURE DETAILS:")
-        for method_name, error, tb in failures:
-            print(f"\n--- {method_name} ---")
-            print(error)
-
-    return failed == 0
-
-
 if __name__ == "__main__":
-    import sys
-
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-q", "-n", "auto"]))
@@ -2,13 +2,19 @@
 """
 Test script to verify composition extraction from Zara products.
 Run this to make sure composition is being scraped correctly before running the full pipeline.
+
+These checks hit zara.com, so under pytest they only run when REFITD_LIVE_TESTS
+is set:
+    REFITD_LIVE_TESTS=1 python -m pytest tests/test_composition.py -n auto
 """
 
 import asyncio
+import os
 import re
 
 import httpx
-from playwright.async_api import async_playwright
+import pytest
+from playwright.async_api import BrowserContext, Route, async_playwright
 from playwright_stealth import stealth_async
 
 
@@ -27,16 +33,83 @@ TEST_PRODUCTS = [
 ]
 
 
+BROWSER_CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 800},
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
+}
+
+# Resources the composition text never depends on; aborting them lets
+# networkidle fire long before images and web fonts finish downloading.
+# Stylesheets still load: inner_text() reflects CSS visibility
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+COMPOSITION_BUTTON_SELECTOR = (
+    'button:has-text("COMPOSITION"), button:has-text("Composition")'
+)
+# Any "NN% material" text, i.e. the composition panel has rendered
+COMPOSITION_TEXT_SELECTOR = r"text=/\d+%\s*[a-zA-Z]+/"
+
+# Compiled once at import rather than looked up in re's cache on every probe
+COMPOSITION_RE = re.compile(r"Composition:?\s*([\d]+%[^\n]*)", re.IGNORECASE)
+MATERIAL_RE = re.compile(r"\d+%\s*[a-zA-Z]+(?:\s*,\s*\d+%\s*[a-zA-Z]+)*")
+PRODUCT_ID_RE = re.compile(r"-p(\d+)\.html")
+
+# Words that mark a "NN% word" match as a fabric composition
+MATERIAL_KEYWORDS = frozenset(
+    {
+        "cotton",
+        "polyester",
+        "wool",
+        "silk",
+        "linen",
+        "nylon",
+        "polyamide",
+        "acrylic",
+        "viscose",
+        "elastane",
+        "spandex",
+        "rayon",
+        "cashmere",
+        "leather",
+        "denim",
+        "modal",
+        "lyocell",
+        "tencel",
+    }
+)
+# One alternation over all keywords: a single C-level scan per match replaces a
+# Python-level any() over every keyword
+MATERIAL_KEYWORD_RE = re.compile(
+    "|".join(sorted(MATERIAL_KEYWORDS, key=len, reverse=True)), re.IGNORECASE
+)
+
+
+def new_api_client() -> httpx.AsyncClient:
+    """
+    Create the HTTP client shared by all API probes in one run.
+
+    Keep-alive pooling and HTTP/2 mean the TLS handshake with www.zara.com is
+    paid once per run rather than once per product. Created per run (not at
+    import) because an AsyncClient is bound to the event loop it first runs on.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=15,
+    )
+
+
 def extract_product_id(url: str) -> str:
     """Extract product ID from URL."""
-    match = re.search(r"-p(\d+)\.html", url)
+    match = PRODUCT_ID_RE.search(url)
     if match:
         return match.group(1)
     return url.split("/")[-1].replace(".html", "")
 
 
-async def test_api_extraction(product_id: str) -> dict:
-    """Test composition extraction from Zara API."""
+async def test_api_extraction(client: httpx.AsyncClient, product_id: str) -> dict:
+    """Test composition extraction from Zara API, using a shared HTTP client."""
     api_url = f"https://www.zara.com/itxrest/2/catalog/store/11719/product/{product_id}"
 
     headers = {
@@ -58,46 +131,43 @@ async def test_api_extraction(product_id: str) -> dict:
     }
 
     try:
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(api_url, headers=headers, timeout=15)
-            results["api_status"] = response.status_code
-
-            if response.status_code == 200:
-                data = response.json()
-                results["raw_response_keys"] = list(data.keys())
-
-                if "detail" in data:
-                    results["detail_keys"] = list(data["detail"].keys())
-
-                    if "colors" in data["detail"]:
-                        colors = data["detail"]["colors"]
-                        if colors:
-                            first_color = colors[0]
-                            results["color_keys"] = list(first_color.keys())
-
-                            # Check for rawMaterials
-                            if "rawMaterials" in first_color:
-                                results["raw_materials"] = first_color["rawMaterials"]
-
-                            # Check for materials
-                            if "materials" in first_color:
-                                results["materials"] = first_color["materials"]
-
-                            # Check for composition
-                            if "composition" in first_color:
-                                results["composition_found"] = first_color[
-                                    "composition"
-                                ]
-
-                    # Also check at detail level
-                    if "rawMaterials" in data["detail"]:
-                        results["raw_materials"] = data["detail"]["rawMaterials"]
-                    if "composition" in data["detail"]:
-                        results["composition_found"] = data["detail"]["composition"]
-                    if "detailedComposition" in data["detail"]:
-                        results["detailed_composition"] = data["detail"][
-                            "detailedComposition"
-                        ]
+        response = await client.get(api_url, headers=headers)
+        results["api_status"] = response.status_code
+
+        if response.status_code == 200:
+            data = response.json()
+            results["raw_response_keys"] = list(data.keys())
+
+            if "detail" in data:
+                results["detail_keys"] = list(data["detail"].keys())
+
+                if "colors" in data["detail"]:
+                    colors = data["detail"]["colors"]
+                    if colors:
+                        first_color = colors[0]
+                        results["color_keys"] = list(first_color.keys())
+
+                        # Check for rawMaterials
+                        if "rawMaterials" in first_color:
+                            results["raw_materials"] = first_color["rawMaterials"]
+
+                        # Check for materials
+                        if "materials" in first_color:
+                            results["materials"] = first_color["materials"]
+
+                        # Check for composition
+                        if "composition" in first_color:
+                            results["composition_found"] = first_color["composition"]
+
+                # Also check at detail level
+                if "rawMaterials" in data["detail"]:
+                    results["raw_materials"] = data["detail"]["rawMaterials"]
+                if "composition" in data["detail"]:
+                    results["composition_found"] = data["detail"]["composition"]
+                if "detailedComposition" in data["detail"]:
+                    results["detailed_composition"] = data["detail"][
+                        "detailedComposition"
+                    ]
 
     except Exception as e:
         results["error"] = str(e)
@@ -105,8 +175,20 @@ async def test_api_extraction(product_id: str) -> dict:
     return results
 
 
-async def test_dom_extraction(url: str) -> dict:
-    """Test composition extraction from DOM."""
+# Probe helpers, not pytest tests (they take plain arguments, not fixtures)
+test_api_extraction.__test__ = False
+
+
+async def block_heavy_resources(route: Route) -> None:
+    """Route handler aborting requests listed in BLOCKED_RESOURCE_TYPES."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def test_dom_extraction(context: BrowserContext, url: str) -> dict:
+    """Test composition extraction from DOM, in a new page of a shared context."""
     results = {
         "page_loaded": False,
         "composition_from_page_text": None,
@@ -114,100 +196,142 @@ async def test_dom_extraction(url: str) -> dict:
         "page_text_snippet": None,
     }
 
+    page = await context.new_page()
     try:
-        async with async_playwright() as p:
-            browser = await p.firefox.launch(headless=True)
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 800},
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
-            )
-            page = await context.new_page()
-            await stealth_async(page)
-
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(2)
-            results["page_loaded"] = True
+        await stealth_async(page)
 
-            # Try to click "COMPOSITION & CARE" button
-            try:
-                composition_buttons = await page.query_selector_all(
-                    'button:has-text("COMPOSITION"), button:has-text("Composition")'
-                )
-                for btn in composition_buttons:
-                    try:
-                        await btn.click()
-                        await asyncio.sleep(1)
-                        print("  ✓ Clicked COMPOSITION button")
-                    except:
-                        pass
-            except Exception as e:
-                print(f"  Could not click composition button: {e}")
-
-            # Get full page text and search for composition
-            page_text = await page.evaluate("() => document.body.innerText")
-
-            # Look for "Composition:" in the page text
-            comp_match = re.search(
-                r"Composition:?\s*([\d]+%[^\n]*)", page_text, re.IGNORECASE
-            )
-            if comp_match:
-                results["composition_from_page_text"] = comp_match.group(1).strip()
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+        results["page_loaded"] = True
 
-            # Also try to find percentage patterns with material names
-            material_pattern = re.findall(
-                r"\d+%\s*[a-zA-Z]+(?:\s*,\s*\d+%\s*[a-zA-Z]+)*", page_text
+        # Try to click "COMPOSITION & CARE" button. Wait for the button and
+        # then for the panel text instead of sleeping a fixed time
+        try:
+            await page.wait_for_selector(COMPOSITION_BUTTON_SELECTOR, timeout=15000)
+            composition_buttons = await page.query_selector_all(
+                COMPOSITION_BUTTON_SELECTOR
             )
-            if material_pattern:
-                # Filter to only those with material keywords
-                material_keywords = [
-                    "cotton",
-                    "polyester",
-                    "wool",
-                    "silk",
-                    "linen",
-                    "nylon",
-                    "polyamide",
-                    "acrylic",
-                    "viscose",
-                    "elastane",
-                    "spandex",
-                    "rayon",
-                    "cashmere",
-                    "leather",
-                    "denim",
-                    "modal",
-                    "lyocell",
-                    "tencel",
-                ]
-                valid = [
-                    m
-                    for m in material_pattern
-                    if any(kw in m.lower() for kw in material_keywords)
-                ]
-                if valid:
-                    results["composition_from_selectors"] = valid[0]
-
-            # Get a snippet of page text around "Composition" for debugging
-            if "composition" in page_text.lower():
-                idx = page_text.lower().find("composition")
-                start = max(0, idx - 50)
-                end = min(len(page_text), idx + 200)
-                results["page_text_snippet"] = page_text[start:end].replace("\n", " ")
-
-            await browser.close()
+            for btn in composition_buttons:
+                try:
+                    await btn.click()
+                    print("  ✓ Clicked COMPOSITION button")
+                    await page.wait_for_selector(
+                        COMPOSITION_TEXT_SELECTOR, timeout=5000
+                    )
+                except:
+                    pass
+        except Exception as e:
+            print(f"  Could not click composition button: {e}")
+
+        # Get full page text and search for composition
+        page_text = await page.inner_text("body")
+
+        # Look for "Composition:" in the page text
+        comp_match = COMPOSITION_RE.search(page_text)
+        if comp_match:
+            results["composition_from_page_text"] = comp_match.group(1).strip()
+
+        # Also try to find percentage patterns with material names
+        material_pattern = MATERIAL_RE.findall(page_text)
+        if material_pattern:
+            # Filter to only those with material keywords
+            valid = [m for m in material_pattern if MATERIAL_KEYWORD_RE.search(m)]
+            if valid:
+                results["composition_from_selectors"] = valid[0]
+
+        # Get a snippet of page text around "Composition" for debugging
+        if "composition" in page_text.lower():
+            idx = page_text.lower().find("composition")
+            start = max(0, idx - 50)
+            end = min(len(page_text), idx + 200)
+            results["page_text_snippet"] = page_text[start:end].replace("\n", " ")
 
     except Exception as e:
         results["error"] = str(e)
+    finally:
+        await page.close()
 
     return results
 
 
+test_dom_extraction.__test__ = False
+
+
+async def extract_compositions(products: list[dict]) -> list[tuple[dict, dict]]:
+    """
+    Run API and DOM extraction for all products concurrently.
+
+    All API probes run first through one pooled HTTP/2 client. The much more
+    expensive DOM probe only runs for products whose API response had no
+    composition; those share one Firefox instance and browser context, each
+    probe opening (and closing) its own page. If every API probe succeeds the
+    browser is never launched, and skipped products get {"skipped": True}.
+
+    Returns:
+        (api_results, dom_results) for each product, in input order
+    """
+    async with new_api_client() as client:
+        api_all = await asyncio.gather(
+            *[
+                test_api_extraction(client, extract_product_id(product["url"]))
+                for product in products
+            ]
+        )
+
+    dom_all = [{"skipped": True} for _ in products]
+    needs_dom = [
+        i
+        for i, api_results in enumerate(api_all)
+        if not (
+            api_results.get("composition_found") or api_results.get("raw_materials")
+        )
+    ]
+    if needs_dom:
+        async with async_playwright() as p:
+            browser = await p.firefox.launch(headless=True)
+            try:
+                context = await browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+                await context.route("**/*", block_heavy_resources)
+                dom_found = await asyncio.gather(
+                    *[
+                        test_dom_extraction(context, products[i]["url"])
+                        for i in needs_dom
+                    ]
+                )
+            finally:
+                await browser.close()
+        for i, dom_results in zip(needs_dom, dom_found):
+            dom_all[i] = dom_results
+
+    return list(zip(api_all, dom_all))
+
+
+@pytest.mark.skipif(
+    not os.getenv("REFITD_LIVE_TESTS"), reason="set REFITD_LIVE_TESTS=1 to hit zara.com"
+)
+@pytest.mark.parametrize(
+    "product", TEST_PRODUCTS, ids=[p["name"] for p in TEST_PRODUCTS]
+)
+def test_composition_extracted(product):
+    """Each test product yields a composition from the API or the DOM."""
+    [(api_results, dom_results)] = asyncio.run(extract_compositions([product]))
+
+    assert (
+        api_results.get("composition_found")
+        or api_results.get("raw_materials")
+        or dom_results.get("composition_from_page_text")
+        or dom_results.get("composition_from_selectors")
+    ), f"No composition extracted for {product['name']}"
+
+
 async def main():
     print("=" * 60)
     print("ZARA COMPOSITION EXTRACTION TEST")
     print("=" * 60)
 
-    for product in TEST_PRODUCTS:
+    print("\n📡🌐 Running API (and, where needed, DOM) extraction for all products...")
+    all_results = await extract_compositions(TEST_PRODUCTS)
+
+    for product, (api_results, dom_results) in zip(TEST_PRODUCTS, all_results):
         print(f"\n{'─' * 60}")
         print(f"Testing: {product['name']}")
         print(f"URL: {product['url']}")
@@ -217,9 +341,8 @@ async def main():
         product_id = extract_product_id(product["url"])
         print(f"\nProduct ID: {product_id}")
 
-        # Test API extraction
-        print("\n📡 Testing API extraction...")
-        api_results = await test_api_extraction(product_id)
+        # API extraction
+        print("\n📡 API extraction:")
         print(f"  API Status: {api_results['api_status']}")
         print(f"  Response Keys: {api_results['raw_response_keys']}")
         print(f"  Detail Keys: {api_results['detail_keys']}")
@@ -231,16 +354,18 @@ async def main():
         if "error" in api_results:
             print(f"  ❌ Error: {api_results['error']}")
 
-        # Test DOM extraction
-        print("\n🌐 Testing DOM extraction...")
-        dom_results = await test_dom_extraction(product["url"])
-        print(f"  Page Loaded: {dom_results['page_loaded']}")
-        print(f"  From Page Text: {dom_results['composition_from_page_text']}")
-        print(f"  From Selectors: {dom_results['composition_from_selectors']}")
-        if dom_results.get("page_text_snippet"):
-            print(f"  Page Snippet: ...{dom_results['page_text_snippet']}...")
-        if "error" in dom_results:
-            print(f"  ❌ Error: {dom_results['error']}")
+        # DOM extraction
+        print("\n🌐 DOM extraction:")
+        if dom_results.get("skipped"):
+            print("  Skipped (API already returned a composition)")
+        else:
+            print(f"  Page Loaded: {dom_results['page_loaded']}")
+            print(f"  From Page Text: {dom_results['composition_from_page_text']}")
+            print(f"  From Selectors: {dom_results['composition_from_selectors']}")
+            if dom_results.get("page_text_snippet"):
+                print(f"  Page Snippet: ...{dom_results['page_text_snippet']}...")
+            if "error" in dom_results:
+                print(f"  ❌ Error: {dom_results['error']}")
 
         # Summary
         found_composition = (
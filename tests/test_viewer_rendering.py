@@ -2,13 +2,14 @@
 Tests for viewer.py rendering quality.
 
 These tests validate that canonical tags and composition data are rendered correctly
-in the product viewer. They test the JavaScript parsing logic used in viewer.py.
+in the product viewer. They test the JavaScript parsing logic in static/viewer.js.
 
 Run with: python3 tests/test_viewer_rendering.py
 """
 
 import re
 import sys
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -23,115 +24,127 @@ except ImportError:
 # COMPOSITION PARSING TESTS
 # ============================================================================
 
+# Shoe part names that split a composition into sections
+_PART_NAMES = (
+    "UPPER",
+    "LINING",
+    "SOLE",
+    "INSOLE",
+    "TONGUE",
+    "OUTER",
+    "INNER",
+    "OUTSOLE",
+    "MIDSOLE",
+    "TOE",
+    "HEEL",
+    "COUNTER",
+    "FOOTBED",
+)
+
+# Part names can appear:
+# 1. At the start of the string
+# 2. After a letter (e.g., "polyesterLINING")
+# 3. After a space or colon
+# We need to be careful to match INSOLE before SOLE, OUTSOLE before SOLE, MIDSOLE before SOLE
+# Sort by length descending to match longer parts first
+_SORTED_PARTS = sorted(_PART_NAMES, key=len, reverse=True)
+
+# Compiled once at import; parse_composition() runs on every product
+# "Not preceded by anything but a letter, whitespace or colon" is a single
+# negative lookbehind, which also holds at the start of the string.
+_PART_RES = tuple(
+    (part, re.compile(rf"(?<![^a-zA-Z\s:]){part}", re.IGNORECASE))
+    for part in _SORTED_PARTS
+)
+# Percentage followed by material name (letters and spaces until next percentage or end)
+_MATERIAL_RE = re.compile(r"(\d+%\s*[a-zA-Z][a-zA-Z\s]*?)(?=\d+%|$)")
+
 
 class TestCompositionParsing:
     """Test composition string parsing for different product types."""
 
-    def parse_composition(self, composition: str) -> dict:
+    @staticmethod
+    def parse_composition(composition: str) -> dict:
         """
         Parse composition string into structured format.
 
-        This mirrors the JavaScript logic in viewer.py for parsing compositions.
+        This mirrors the JavaScript logic in static/viewer.js for parsing compositions.
+        Results for non-empty strings are cached and shared between callers,
+        so treat them as read-only.
         """
         if not composition:
             return {"type": "empty", "sections": [], "materials": []}
+        return TestCompositionParsing._parse_nonempty(composition)
 
-        # Check for shoe-style composition with part names
-        part_names = [
-            "UPPER",
-            "LINING",
-            "SOLE",
-            "INSOLE",
-            "TONGUE",
-            "OUTER",
-            "INNER",
-            "OUTSOLE",
-            "MIDSOLE",
-            "TOE",
-            "HEEL",
-            "COUNTER",
-            "FOOTBED",
-        ]
+    @staticmethod
+    @lru_cache(maxsize=10_000)
+    def _parse_nonempty(composition: str) -> dict:
+        """
+        parse_composition() for a non-empty string, memoized on the exact text.
 
-        # Part names can appear:
-        # 1. At the start of the string
-        # 2. After a letter (e.g., "polyesterLINING")
-        # 3. After a space or colon
-        # We need to be careful to match INSOLE before SOLE, OUTSOLE before SOLE, MIDSOLE before SOLE
-        # Sort by length descending to match longer parts first
-        sorted_parts = sorted(part_names, key=len, reverse=True)
-        part_pattern = (
-            r"(?:^|(?<=[a-zA-Z])|(?<=\s)|(?<=:))(" + "|".join(sorted_parts) + r")"
-        )
-        has_parts = bool(re.search(part_pattern, composition, re.IGNORECASE))
-
-        if has_parts:
-            # Parse shoe-style composition by finding each part and its materials
-            sections = []
-
-            # Find all part positions using a simpler approach
-            # We need to find each part name in order, being careful about overlapping names
-            part_matches = []
-
-            # Use a different approach: scan for each part name
-            for part in sorted_parts:
-                for match in re.finditer(
-                    r"(?:^|(?<=[a-zA-Z])|(?<=[\s:]))" + part, composition, re.IGNORECASE
-                ):
-                    # Check if this position is not already covered by a longer part
-                    overlap = False
-                    for existing in part_matches:
-                        if (
-                            match.start() >= existing["start"]
-                            and match.start() < existing["end"]
-                        ) or (
-                            match.end() > existing["start"]
-                            and match.end() <= existing["end"]
-                        ):
-                            overlap = True
-                            break
-                    if not overlap:
-                        part_matches.append(
-                            {
-                                "name": part.upper(),
-                                "start": match.start(),
-                                "end": match.end(),
-                            }
-                        )
-
-            # Sort by start position
-            part_matches.sort(key=lambda x: x["start"])
-
-            for i, match in enumerate(part_matches):
-                part_name = match["name"]
-                start_pos = match["end"]
-
-                # End position is either the next part or end of string
-                if i + 1 < len(part_matches):
-                    end_pos = part_matches[i + 1]["start"]
-                else:
-                    end_pos = len(composition)
-
-                materials_str = composition[start_pos:end_pos].strip()
-                # Remove leading colon or space if present
-                materials_str = materials_str.lstrip(": ")
-
-                # Parse materials: "37% polyurethane32% polyester" -> ["37% polyurethane", "32% polyester"]
-                # Match percentage followed by material name (letters and spaces until next percentage or end)
-                material_list = re.findall(
-                    r"(\d+%\s*[a-zA-Z][a-zA-Z\s]*?)(?=\d+%|$)", materials_str
+        Catalogs repeat the same compositions ("100% cotton") across many
+        products, so repeats skip all regex work.
+        """
+        # Check for shoe-style composition with part names, scanning for each
+        # part name in turn like the JS. Longer names are scanned first, and a
+        # match overlapping an already found (longer) part is skipped, so e.g.
+        # INSOLE is never also read as SOLE. Each match is a (start, end, name)
+        # tuple
+        part_matches = []
+        for part, part_re in _PART_RES:
+            for match in part_re.finditer(composition):
+                start, end = match.span()
+                overlap = any(
+                    existing_start <= start < existing_end
+                    or existing_start < end <= existing_end
+                    for existing_start, existing_end, _ in part_matches
                 )
-                cleaned_materials = [m.strip() for m in material_list if m.strip()]
-
-                if cleaned_materials:
-                    sections.append({"part": part_name, "materials": cleaned_materials})
-
-            return {"type": "shoe", "sections": sections, "materials": []}
-        else:
-            # Simple composition like "100% cotton" or "49% polyamide, 29% polyester"
-            materials = [m.strip() for m in composition.split(",") if m.strip()]
+                if not overlap:
+                    part_matches.append((start, end, part))
+
+        # Sort by start position
+        part_matches.sort()
+
+        if not part_matches:
+            # Simple composition like "100% cotton" or "49% polyamide, 29% polyester".
+            # Single-material strings (the common case) skip the split
+            if "," not in composition:
+                material = composition.strip()
+                materials = [material] if material else []
+            else:
+                materials = [s for m in composition.split(",") if (s := m.strip())]
             return {"type": "simple", "sections": [], "materials": materials}
 
+        # Parse shoe-style composition by finding each part and its materials
+        sections = []
+        n_parts = len(part_matches)
+        n_comp = len(composition)
+        for i, (_, start_pos, part_name) in enumerate(part_matches):
+            # End position is either the next part or end of string
+            if i + 1 < n_parts:
+                end_pos = part_matches[i + 1][0]
+            else:
+                end_pos = n_comp
+
+            # Parse materials: "37% polyurethane32% polyester" -> ["37% polyurethane", "32% polyester"]
+            # Scanning the full string between the part boundaries avoids copying
+            # each section out. Neither leading ": " nor trailing whitespace
+            # needs trimming first: matches start at a digit and are stripped
+            # Sections without a "%" (e.g. "TOE" inside a word) can't hold a
+            # material; str.find() rules them out without entering the regex
+            if composition.find("%", start_pos, end_pos) == -1:
+                continue
+            material_list = [
+                m.group(1)
+                for m in _MATERIAL_RE.finditer(composition, start_pos, end_pos)
+            ]
+            cleaned_materials = [m.strip() for m in material_list if m.strip()]
+
+            if cleaned_materials:
+                sections.append({"part": part_name, "materials": cleaned_materials})
+
+        return {"type": "shoe", "sections": sections, "materials": []}
+
     def test_simple_single_material(self):
         """Test simple single-material composition."""
         result = self.parse_composition("100% cotton")
@@ -200,6 +213,32 @@ class TestCompositionParsing:
         assert result["type"] == "shoe"
         # Should still detect parts even with colons and commas
 
+    def test_longer_part_names_win(self):
+        """INSOLE/OUTSOLE/MIDSOLE are single sections, never also SOLE, in order."""
+        composition = (
+            "UPPER100% leatherINSOLE100% polyesterOUTSOLE100% rubberMIDSOLE100% eva"
+        )
+        result = self.parse_composition(composition)
+
+        assert [s["part"] for s in result["sections"]] == [
+            "UPPER",
+            "INSOLE",
+            "OUTSOLE",
+            "MIDSOLE",
+        ]
+
+    def test_overlapping_part_names(self):
+        """A part name inside a longer one it overlaps is not a section of its own."""
+        result = self.parse_composition("HEELINING100% cotton")
+
+        assert [s["part"] for s in result["sections"]] == ["LINING"]
+
+    def test_part_after_unicode_whitespace(self):
+        """Part names after non-ASCII whitespace (e.g. NBSP) are still found."""
+        result = self.parse_composition("UPPER: 100% leather\u00a0LINING: 100% cotton")
+
+        assert [s["part"] for s in result["sections"]] == ["UPPER", "LINING"]
+
     def test_empty_composition(self):
         """Test empty composition string."""
         result = self.parse_composition("")
@@ -215,24 +254,51 @@ class TestCompositionParsing:
         )
         result = self.parse_composition(composition)
 
-        # Count total materials across all sections
-        all_materials = []
+        # Check for no exact duplicates across all sections
+        seen = set()
         for section in result["sections"]:
-            all_materials.extend(section["materials"])
-
-        # Check for no exact duplicates
-        assert len(all_materials) == len(set(all_materials))
+            for material in section["materials"]:
+                assert material not in seen, f"Duplicate material: {material}"
+                seen.add(material)
 
 
 # ============================================================================
 # CANONICAL TAGS RENDERING TESTS
 # ============================================================================
 
+# Allowed canonical tag values, built once rather than on every validation.
+# All lowercase: tags usually arrive normalized, so validators test the raw
+# value first and only call lower() when that misses
+_VALID_STYLES = frozenset(
+    {
+        "minimal",
+        "classic",
+        "streetwear",
+        "prep",
+        "workwear",
+        "avant-garde",
+        "outdoor",
+        "athleisure",
+        "maximalist",
+        "bohemian",
+        "punk",
+        "vintage",
+        "normcore",
+    }
+)
+_VALID_FORMALITIES = frozenset(
+    {"athletic", "casual", "smart-casual", "business-casual", "formal"}
+)
+_VALID_LAYER_ROLES = frozenset({"base", "mid"})
+# Categories for which top_layer_role applies
+_TOP_CATEGORIES = frozenset({"top", "top_base", "top_mid"})
+
 
 class TestCanonicalTagsRendering:
     """Test canonical tags rendering logic."""
 
-    def validate_style_identity(self, tags: list[str]) -> dict:
+    @staticmethod
+    def validate_style_identity(tags: list[str]) -> dict:
         """Validate style identity tags."""
         issues = []
 
@@ -243,60 +309,42 @@ class TestCanonicalTagsRendering:
             issues.append("Missing style identity (required)")
 
         # Check for valid style identities
-        valid_styles = {
-            "minimal",
-            "classic",
-            "streetwear",
-            "prep",
-            "workwear",
-            "avant-garde",
-            "outdoor",
-            "athleisure",
-            "maximalist",
-            "bohemian",
-            "punk",
-            "vintage",
-            "normcore",
-        }
-
         for tag in tags:
-            if tag.lower() not in valid_styles:
+            if tag not in _VALID_STYLES and tag.lower() not in _VALID_STYLES:
                 issues.append(f"Unknown style identity: {tag}")
 
         return {"valid": len(issues) == 0, "issues": issues}
 
-    def validate_formality(self, formality: Optional[str]) -> dict:
+    @staticmethod
+    def validate_formality(formality: Optional[str]) -> dict:
         """Validate formality tag."""
         issues = []
 
-        valid_formalities = {
-            "athletic",
-            "casual",
-            "smart-casual",
-            "business-casual",
-            "formal",
-        }
-
         if formality is None:
             issues.append("Missing formality (required)")
-        elif formality.lower() not in valid_formalities:
+        elif (
+            formality not in _VALID_FORMALITIES
+            and formality.lower() not in _VALID_FORMALITIES
+        ):
             issues.append(f"Invalid formality: {formality}")
 
         return {"valid": len(issues) == 0, "issues": issues}
 
-    def validate_top_layer_role(self, category: str, layer_role: Optional[str]) -> dict:
+    @staticmethod
+    def validate_top_layer_role(category: str, layer_role: Optional[str]) -> dict:
         """Validate top layer role for tops."""
         issues = []
 
         # Only required for 'top' category
-        if category.lower() not in ["top", "top_base", "top_mid"]:
+        if category not in _TOP_CATEGORIES and category.lower() not in _TOP_CATEGORIES:
             return {"valid": True, "issues": [], "skipped": True}
 
-        valid_roles = {"base", "mid"}
-
         if layer_role is None:
             issues.append("Missing top_layer_role (required for tops)")
-        elif layer_role.lower() not in valid_roles:
+        elif (
+            layer_role not in _VALID_LAYER_ROLES
+            and layer_role.lower() not in _VALID_LAYER_ROLES
+        ):
             issues.append(f"Invalid top_layer_role: {layer_role}")
 
         return {"valid": len(issues) == 0, "issues": issues}
@@ -378,29 +426,35 @@ class TestCanonicalTagsRendering:
 # PRODUCT DATA VALIDATION TESTS
 # ============================================================================
 
+# Fields a product needs to render, and fields it should have to render well
+_REQUIRED_FIELDS = ("product_id", "name", "category")
+_RECOMMENDED_FIELDS = ("url", "price_current", "description")
+
 
 class TestProductDataValidation:
     """Test product data validation for viewer rendering."""
 
-    def validate_product_for_rendering(self, product: dict) -> dict:
+    @staticmethod
+    def validate_product_for_rendering(product: dict) -> dict:
         """Validate a product has required fields for proper rendering."""
-        issues = []
-        warnings = []
+        get = product.get
 
         # Required fields
-        required = ["product_id", "name", "category"]
-        for field in required:
-            if not product.get(field):
-                issues.append(f"Missing required field: {field}")
+        issues = [
+            f"Missing required field: {field}"
+            for field in _REQUIRED_FIELDS
+            if not get(field)
+        ]
 
         # Recommended fields
-        recommended = ["url", "price_current", "description"]
-        for field in recommended:
-            if not product.get(field):
-                warnings.append(f"Missing recommended field: {field}")
+        warnings = [
+            f"Missing recommended field: {field}"
+            for field in _RECOMMENDED_FIELDS
+            if not get(field)
+        ]
 
         # Tags validation
-        tags_final = product.get("tags_final", {})
+        tags_final = get("tags_final", {})
         if tags_final:
             # Style identity
             style_identity = tags_final.get("style_identity", [])
@@ -414,13 +468,13 @@ class TestProductDataValidation:
                 warnings.append("Missing formality in tags_final")
 
             # Category-specific checks
-            category = tags_final.get("category", product.get("category", ""))
-            if category.lower() in ["top", "top_base", "top_mid"]:
+            category = tags_final.get("category", get("category", ""))
+            if category in _TOP_CATEGORIES or category.lower() in _TOP_CATEGORIES:
                 if not tags_final.get("top_layer_role"):
                     warnings.append("Missing top_layer_role for top category")
 
         # Image validation
-        image_paths = product.get("image_paths", [])
+        image_paths = get("image_paths", [])
         if not image_paths or len(image_paths) == 0:
             warnings.append("No images available")
 
@@ -501,44 +555,50 @@ def run_tests_without_pytest():
     tag_tests = TestCanonicalTagsRendering()
     product_tests = TestProductDataValidation()
 
-    # Get all test methods
+    # Get all test methods, in definition order, straight from each class __dict__
     test_methods = []
     for cls_name, cls in [
         ("TestCompositionParsing", comp_tests),
         ("TestCanonicalTagsRendering", tag_tests),
         ("TestProductDataValidation", product_tests),
     ]:
-        for method_name in dir(cls):
-            if method_name.startswith("test_"):
-                test_methods.append((cls_name, method_name, getattr(cls, method_name)))
+        for method_name, fn in vars(type(cls)).items():
+            if method_name.startswith("test_") and callable(fn):
+                test_methods.append((cls_name, method_name, fn.__get__(cls)))
 
-    # Run each test
+    # Run each test, buffering the report so it is written out in one go
+    report = []
     for cls_name, method_name, method in test_methods:
         full_name = f"{cls_name}::{method_name}"
         try:
             method()
-            print(f"✓ PASSED: {full_name}")
+            report.append(f"✓ PASSED: {full_name}")
             passed += 1
         except AssertionError as e:
-            print(f"✗ FAILED: {full_name}")
-            print(f"  Error: {e}")
+            report.append(f"✗ FAILED: {full_name}")
+            report.append(f"  Error: {e}")
             errors.append((full_name, str(e)))
             failed += 1
         except Exception as e:
-            print(f"✗ ERROR: {full_name}")
-            print(f"  Exception: {e}")
+            report.append(f"✗ ERROR: {full_name}")
+            report.append(f"  Exception: {e}")
             errors.append((full_name, str(e)))
             failed += 1
 
-    # Print summary
-    print(f"\n{'='*60}")
-    print(f"RESULTS: {passed} passed, {failed} failed out of {passed + failed} tests")
-    print(f"{'='*60}")
+    # Summary
+    report.append(f"\n{'='*60}")
+    report.append(
+        f"RESULTS: {passed} passed, {failed} failed out of {passed + failed} tests"
+    )
+    report.append(f"{'='*60}")
 
     if errors:
-        print("\nFailed tests:")
+        report.append("\nFailed tests:")
         for name, err in errors:
-            print(f"  - {name}: {err}")
+            report.append(f"  - {name}: {err}")
+
+    sys.stdout.write("\n".join(report) + "\n")
+    sys.stdout.flush()
 
     return failed == 0
 